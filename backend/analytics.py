@@ -0,0 +1,196 @@
+# Resolution-time Analytics Module
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, case
+from models import Complaint, ComplaintCategory, Department
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_RESOLUTION_DAYS = 7
+
+# group_by value -> (key columns, name columns)
+RESOLUTION_GROUPINGS = {
+    'department': (
+        [Complaint.department_id],
+        [Department.name.label('department_name')]
+    ),
+    'category': (
+        [Complaint.category_id],
+        [ComplaintCategory.name.label('category_name')]
+    ),
+    'department_category': (
+        [Complaint.department_id, Complaint.category_id],
+        [Department.name.label('department_name'), ComplaintCategory.name.label('category_name')]
+    )
+}
+
+def _is_postgres(session):
+    return session.get_bind().dialect.name == 'postgresql'
+
+def resolution_hours_expr(dialect_name):
+    """SQL expression for hours between creation and resolution"""
+    if dialect_name == 'postgresql':
+        return func.extract('epoch', Complaint.resolved_at - Complaint.created_at) / 3600.0
+    return (func.julianday(Complaint.resolved_at) - func.julianday(Complaint.created_at)) * 24.0
+
+def sla_breached_expr(dialect_name):
+    """SQL expression that is 1 when a complaint was resolved after its SLA target.
+
+    The target is expected_resolution_date, falling back to created_at plus the
+    category's typical_resolution_days.
+    """
+    typical_days = func.coalesce(ComplaintCategory.typical_resolution_days, DEFAULT_RESOLUTION_DAYS)
+    if dialect_name == 'postgresql':
+        deadline = func.coalesce(
+            Complaint.expected_resolution_date,
+            Complaint.created_at + func.make_interval(0, 0, 0, typical_days)
+        )
+        return case((Complaint.resolved_at > deadline, 1), else_=0)
+    deadline = func.coalesce(
+        func.julianday(Complaint.expected_resolution_date),
+        func.julianday(Complaint.created_at) + typical_days
+    )
+    return case((func.julianday(Complaint.resolved_at) > deadline, 1), else_=0)
+
+def _resolved_filters(date_from=None, date_to=None):
+    filters = [Complaint.status == 'Resolved', Complaint.resolved_at.isnot(None)]
+    if date_from:
+        filters.append(Complaint.created_at >= date_from)
+    if date_to:
+        filters.append(Complaint.created_at < date_to + timedelta(days=1))  # date_to is inclusive
+    return filters
+
+def average_resolution_hours(session, date_from=None, date_to=None):
+    """Return (average hours, resolved count) computed inside the database"""
+    hours = resolution_hours_expr(session.get_bind().dialect.name)
+    avg_hours, resolved_count = session.execute(
+        select(func.avg(hours), func.count(Complaint.id)).where(*_resolved_filters(date_from, date_to))
+    ).one()
+    return float(avg_hours or 0), resolved_count
+
+def _summary(count, percentile_values, mean_hours, breaches):
+    summary = {
+        'count': int(count),
+        'mean_hours': round(float(mean_hours), 1) if count else 0
+    }
+    for p, value in zip(PERCENTILES, percentile_values):
+        summary[f'p{p}_hours'] = round(float(value), 1) if count and value is not None else 0
+    summary['sla_breaches'] = int(breaches or 0)
+    summary['sla_breach_rate'] = round(int(breaches or 0) / count * 100, 1) if count else 0
+    return summary
+
+def _postgres_stats(session, key_columns, name_columns, filters):
+    hours = resolution_hours_expr('postgresql')
+    breached = sla_breached_expr('postgresql')
+    aggregates = [
+        func.count(Complaint.id),
+        *[func.percentile_cont(p / 100.0).within_group(hours) for p in PERCENTILES],
+        func.avg(hours),
+        func.sum(breached)
+    ]
+
+    def run(group_columns):
+        stmt = (
+            select(*group_columns, *aggregates)
+            .select_from(Complaint)
+            .outerjoin(Department, Complaint.department_id == Department.id)
+            .outerjoin(ComplaintCategory, Complaint.category_id == ComplaintCategory.id)
+            .where(*filters)
+        )
+        if group_columns:
+            stmt = stmt.group_by(*group_columns)
+        return session.execute(stmt).all()
+
+    group_columns = key_columns + name_columns
+    n_keys = len(group_columns)
+    groups = []
+    for row in run(group_columns):
+        count = row[n_keys]
+        group = {column.key: value for column, value in zip(group_columns, row[:n_keys])}
+        group.update(_summary(count, row[n_keys + 1:n_keys + 1 + len(PERCENTILES)], row[-2] or 0, row[-1]))
+        groups.append(group)
+
+    overall_row = run([])[0]
+    overall = _summary(overall_row[0], overall_row[1:1 + len(PERCENTILES)], overall_row[-2] or 0, overall_row[-1])
+    return overall, groups
+
+def _numpy_stats(session, key_columns, name_columns, filters):
+    """Single columnar fetch, then per-group percentiles with NumPy"""
+    import numpy as np
+    dialect_name = session.get_bind().dialect.name
+    stmt = (
+        select(
+            *key_columns,
+            resolution_hours_expr(dialect_name).label('hours'),
+            sla_breached_expr(dialect_name).label('breached')
+        )
+        .select_from(Complaint)
+        .outerjoin(ComplaintCategory, Complaint.category_id == ComplaintCategory.id)
+        .where(*filters)
+    )
+    rows = session.execute(stmt).all()
+    n_keys = len(key_columns)
+
+    if not rows:
+        return _summary(0, [None] * len(PERCENTILES), 0, 0), []
+
+    columns = list(zip(*rows))
+    keys = np.array(columns[:n_keys], dtype=np.int64).T
+    hours = np.array(columns[n_keys], dtype=np.float64)
+    breached = np.array(columns[n_keys + 1], dtype=np.int64)
+
+    overall = _summary(len(hours), np.percentile(hours, PERCENTILES), hours.mean(), breached.sum())
+
+    # Sort rows by group key and split into contiguous runs
+    order = np.lexsort(keys.T[::-1])
+    keys, hours, breached = keys[order], hours[order], breached[order]
+    boundaries = np.flatnonzero(np.any(keys[1:] != keys[:-1], axis=1)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(hours)]))
+
+    names = _group_names(session, name_columns)
+    groups = []
+    for start, end in zip(starts, ends):
+        key = tuple(int(k) for k in keys[start])
+        group_hours = hours[start:end]
+        group = {column.key: value for column, value in zip(key_columns, key)}
+        for column, value in zip(name_columns, key):
+            group[column.key] = names[column.key].get(value)
+        group.update(_summary(
+            end - start,
+            np.percentile(group_hours, PERCENTILES),
+            group_hours.mean(),
+            breached[start:end].sum()
+        ))
+        groups.append(group)
+    return overall, groups
+
+def _group_names(session, name_columns):
+    names = {}
+    for column in name_columns:
+        model = Department if column.key == 'department_name' else ComplaintCategory
+        names[column.key] = dict(session.execute(select(model.id, model.name)).all())
+    return names
+
+def resolution_time_stats(session, group_by='department', date_from=None, date_to=None):
+    """Resolution-time percentiles and SLA breach rates for resolved complaints.
+
+    Both the PostgreSQL and the NumPy path outer-join department and category, so a
+    complaint whose row is missing is still counted (with a None name).
+    """
+    if group_by not in RESOLUTION_GROUPINGS:
+        raise ValueError(f'group_by must be one of: {", ".join(RESOLUTION_GROUPINGS)}')
+
+    key_columns, name_columns = RESOLUTION_GROUPINGS[group_by]
+    filters = _resolved_filters(date_from, date_to)
+
+    if _is_postgres(session):
+        overall, groups = _postgres_stats(session, key_columns, name_columns, filters)
+    else:
+        overall, groups = _numpy_stats(session, key_columns, name_columns, filters)
+
+    groups.sort(key=lambda g: g['p90_hours'], reverse=True)
+    return {
+        'group_by': group_by,
+        'overall': overall,
+        'groups': groups,
+        'generated_at': datetime.utcnow().isoformat()
+    }
@@ -1,4 +1,12 @@
-from flask import Flask, request, jsonify, session
+import os
+import csv
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import Flask, Blueprint, current_app, request, jsonify, session, Response, stream_with_context
 from flask_cors import CORS
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from flask_bcrypt import Bcrypt
@@ -6,27 +14,173 @@ from models import db, User, Complaint, Comment, Department, Course, ComplaintCa
 from config import Config
 from security import security_manager, validate_request, rate_limit, security_headers, VALIDATION_RULES
 from performance import perf_monitor, monitor_performance, cached_query
+from analytics import average_resolution_hours, resolution_time_stats, RESOLUTION_GROUPINGS
+from report_jobs import report_manager, job_to_dict
+from db_pool import pool_metrics
+from db_routing import init_routing, read_only, reading
+from db_indexes import ensure_indexes
+from sqlite_profile import is_file_sqlite, install_pragmas, create_read_engine, WalCheckpointer
+from background import background_services
+from reference_data import reference_data
+from batch import batch_runner, batch_cost, BatchError
+from dashboard import dashboard_cache
+from duplicates import duplicate_index, link_duplicate, cluster_of, cluster_members, open_clusters
+from escalation import SlaEscalator
+from assignment import auto_assigner
+from suggestions import category_suggester, complaint_text, MAX_BATCH_ITEMS as MAX_SUGGESTION_ITEMS
+from negotiation import NegotiatingJSONProvider, wants_msgpack, wants_columnar, MSGPACK_MIMETYPE
+from comments import comments_by_complaint, parse_ids
+from complaint_feed import (feed_page, iter_feed, json_array_chunks, ndjson_chunks, NDJSON_MIMETYPE,
+                            MAX_PAGE_SIZE as FEED_MAX_PAGE_SIZE)
+from projection import complaint_projection, user_projection, comment_projection, notification_projection, FieldsError
+from notifications import (add_notifications, notify, notify_admins, latest_notifications,
+                           latest_notifications_query, unread_count, mark_read)
+from logging_config import configure_logging, init_request_ids, logging_status
 from error_handler import ErrorHandler, handle_database_errors, validate_json_request
+from sqlalchemy.exc import OperationalError, DisconnectionError
+
+# Heavy modules (pandas, pyarrow via columnar_export) are imported inside the
+# handlers that use them so importing the app stays cheap.
 
-from export_utils import export_complaints_to_csv, export_complaints_to_json, generate_complaint_report, export_students_to_csv
-from email_templates import get_complaint_submitted_template, get_status_update_template, get_admin_notification_template
+logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
+# Routes live on this blueprint; extensions are bound per app in create_app()
+api = Blueprint('api', __name__)
+bcrypt = Bcrypt()
+login_manager = LoginManager()
+login_manager.login_view = 'api.login'
+
+# Rate limiting (if flask-limiter is installed)
+try:
+    from flask_limiter import Limiter
+    from flask_limiter.util import get_remote_address
+    
+    limiter = Limiter(
+        key_func=get_remote_address,
+        default_limits=["200 per day", "50 per hour"]
+    )
+except ImportError:
+    limiter = None
 
-app = Flask(__name__)
-app.config.from_object(Config)
+class StartupTimer:
+    """Milliseconds spent in each create_app() phase"""
+    def __init__(self):
+        self.phases = {}
+        self.last = time.perf_counter()
 
-# Initialize extensions
-CORS(app, supports_credentials=True)
-db.init_app(app)
-bcrypt = Bcrypt(app)
-login_manager = LoginManager(app)
-login_manager.login_view = 'login'
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self.last) * 1000, 1)
+        self.last = now
 
-# Initialize error handling and security
-error_handler = ErrorHandler(app)
-app.after_request(security_headers)
+def create_app(config=None):
+    """Application factory. `config` is a config class or a dict of overrides on top of Config."""
+    timer = StartupTimer()
+    app = Flask(__name__)
+    app.json = NegotiatingJSONProvider(app)  # jsonify() also answers Accept: application/msgpack
+    app.config.from_object(Config)
+    if isinstance(config, dict):
+        app.config.update(config)
+    elif config is not None:
+        app.config.from_object(config)
+    configure_logging(app.config)
+    init_request_ids(app)
+    
+    # Initialize extensions
+    CORS(app, supports_credentials=True)
+    db.init_app(app)
+    bcrypt.init_app(app)
+    login_manager.init_app(app)
+    if limiter:
+        limiter.init_app(app)
+    else:
+        logger.warning("⚠️ Flask-Limiter not installed. Rate limiting disabled.")
+    
+    # Read routing (configured replicas) and the SQLite performance profile:
+    # connect-time pragmas, a read-only pool for GET endpoints and WAL checkpoints
+    with app.app_context():
+        router = init_routing(app, db.engine)
+        if is_file_sqlite(db.engine):
+            install_pragmas(db.engine, app.config)
+            if app.config['SQLITE_READ_POOL_SIZE'] > 0:
+                # Same file, so it never lags; only liveness is checked
+                router.add_reader(
+                    'sqlite-reader',
+                    create_read_engine(db.engine, app.config),
+                    check_lag=False,
+                    check_interval_seconds=app.config['REPLICA_CHECK_SECONDS']
+                )
+            if app.config['SQLITE_JOURNAL_MODE'].upper() == 'WAL':
+                app.extensions['wal_checkpointer'] = background_services.register('sqlite-wal-checkpoint', WalCheckpointer(
+                    db.engine,
+                    interval_seconds=app.config['SQLITE_WAL_CHECKPOINT_SECONDS'],
+                    size_limit=app.config['SQLITE_WAL_SIZE_LIMIT']
+                ))
+    
+    # Initialize error handling and security
+    ErrorHandler(app)
+    app.after_request(security_headers)
+    
+    # Background report jobs
+    report_manager.init_app(app)
+    batch_runner.init_app(app)
+    
+    # SLA escalation of overdue complaints (runs where the background services run)
+    app.extensions['sla_escalator'] = background_services.register('sla-escalation', SlaEscalator(
+        app,
+        check_seconds=app.config['SLA_CHECK_SECONDS'],
+        batch_size=app.config['SLA_BATCH_SIZE']
+    ))
+    
+    # Real-time monitor (system metrics, complaint stats); psutil and SocketIO load here, not on import
+    from monitoring import monitor
+    monitor.app = app
+    app.extensions['realtime_monitor'] = background_services.register('realtime-monitor', monitor)
+    
+    # Connection pool observability
+    pool_metrics.configure(warn_wait_ms=app.config['DB_POOL_WAIT_WARN_MS'])
+    
+    app.register_blueprint(api)
+    timer.mark('extensions')
+    
+    # Setup database
+    init_db(app)
+    reference_data.init_app(app)
+    dashboard_cache.init_app(app)
+    duplicate_index.init_app(app)
+    category_suggester.init_app(app)
+    auto_assigner.init_app(app)
+    timer.mark('create_tables')
+    create_default_admin(app)
+    timer.mark('default_admin')
+    if app.config['LOAD_CSV_ON_STARTUP']:
+        load_initial_data(app)
+        timer.mark('csv_data')
+    
+    app.extensions['startup_timings'] = timer.phases
+    return app
+
+_default_app_lock = threading.Lock()
+
+def __getattr__(name):
+    """`app` (the default application) is built on first access, e.g. by `gunicorn app:app`"""
+    global app
+    if name != 'app':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _default_app_lock:
+        if 'app' not in globals():
+            app = create_app()
+    return app
+
+def admin_required(func):
+    """login_required, and the user must be an admin"""
+    @wraps(func)
+    @login_required
+    def wrapper(*args, **kwargs):
+        if current_user.role != 'admin':
+            return jsonify({'error': 'Admin access required'}), 403
+        return func(*args, **kwargs)
+    return wrapper
 
 # Database connection retry
 def retry_db_operation(max_retries=3, delay=1):
@@ -39,7 +193,7 @@ def retry_db_operation(max_retries=3, delay=1):
                     return func(*args, **kwargs)
                 except (OperationalError, DisconnectionError) as e:
                     if attempt == max_retries - 1:
-                        print(f"Database operation failed after {max_retries} attempts: {e}")
+                        logger.error("Database operation failed after %d attempts: %s", max_retries, e)
                         # Try to reconnect
                         try:
                             db.session.remove()
@@ -47,7 +201,8 @@ def retry_db_operation(max_retries=3, delay=1):
                         except:
                             pass
                         raise e
-                    print(f"Database connection lost, retrying in {current_delay} seconds... (attempt {attempt + 1}/{max_retries})")
+                    logger.warning("Database connection lost, retrying in %s seconds... (attempt %d/%d)",
+                                   current_delay, attempt + 1, max_retries)
                     time.sleep(current_delay)
                     current_delay *= 2  # Exponential backoff
             return func(*args, **kwargs)
@@ -55,9 +210,16 @@ def retry_db_operation(max_retries=3, delay=1):
     return decorator
 
 # CSV file operations
+def csv_mirror_path(filename):
+    """Path of a CSV mirror file, or None when mirroring is off (CSV_MIRROR_DIR empty)"""
+    mirror_dir = current_app.config['CSV_MIRROR_DIR']
+    return os.path.join(mirror_dir, filename) if mirror_dir else None
+
 def save_student_to_csv(user):
     try:
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/students.csv')
+        csv_path = csv_mirror_path('students.csv')
+        if not csv_path:
+            return
         
         # Student data for CSV
         student_data = {
@@ -96,17 +258,17 @@ def save_student_to_csv(user):
             
             writer.writerow(student_data)
         
-        print(f"✅ Student {user.name} ({user.student_id}) saved to CSV")
+        logger.info("✅ Student %s (%s) saved to CSV", user.name, user.student_id)
         
     except Exception as e:
-        print(f"❌ Error saving student to CSV: {e}")
+        logger.exception("❌ Error saving student to CSV: %s", e)
 
 def update_complaint_in_csv(complaint):
     """Update existing complaint in CSV file"""
     try:
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/student_complaints.csv')
+        csv_path = csv_mirror_path('student_complaints.csv')
         
-        if not os.path.exists(csv_path):
+        if not csv_path or not os.path.exists(csv_path):
             return
         
         # Read existing data
@@ -124,26 +286,24 @@ def update_complaint_in_csv(complaint):
             
             # Save back to CSV
             df.to_csv(csv_path, index=False)
-            print(f"✅ Complaint {complaint.complaint_id} updated in CSV")
+            logger.info("✅ Complaint %s updated in CSV", complaint.complaint_id)
         
     except Exception as e:
-        print(f"❌ Error updating complaint in CSV: {e}")
+        logger.exception("❌ Error updating complaint in CSV: %s", e)
 
 def save_complaint_to_csv(complaint, student_name):
     try:
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/student_complaints.csv')
+        csv_path = csv_mirror_path('student_complaints.csv')
+        if not csv_path:
+            return
         
         # Get student info more reliably
         student = User.query.get(complaint.student_id) if complaint.student_id else None
         student_id_str = student.student_id if student else ''
         
         # Get category and department info more reliably
-        category = ComplaintCategory.query.get(complaint.category_id) if complaint.category_id else None
-        department = Department.query.get(complaint.department_id) if complaint.department_id else None
-        
-        # Debug the queries
-        print(f"   Category ID: {complaint.category_id}, Found: {category.name if category else 'None'}")
-        print(f"   Department ID: {complaint.department_id}, Found: {department.name if department else 'None'}")
+        category = reference_data.category(complaint.category_id)
+        department = reference_data.department(complaint.department_id)
         
         # Complaint data for CSV
         complaint_data = {
@@ -152,8 +312,8 @@ def save_complaint_to_csv(complaint, student_name):
             'student_name': student_name,
             'title': complaint.title,
             'description': complaint.description,
-            'category': category.name if category else '',
-            'department': department.name if department else '',
+            'category': category['name'] if category else '',
+            'department': department['name'] if department else '',
             'status': complaint.status,
             'priority': complaint.priority,
             'urgency_level': complaint.urgency_level,
@@ -163,17 +323,12 @@ def save_complaint_to_csv(complaint, student_name):
             'admin_comments': ''
         }
         
-        print(f"🔍 Debug - Saving complaint to CSV:")
-        print(f"   Complaint ID: {complaint.complaint_id}")
-        print(f"   Student ID: {student_id_str}")
-        print(f"   Student Name: {student_name}")
-        print(f"   Category: {category.name if category else 'None'}")
-        print(f"   Department: {department.name if department else 'None'}")
+        logger.debug("🔍 Saving complaint %s to CSV (student %s, category %s, department %s)",
+                     complaint.complaint_id, student_id_str, complaint_data['category'], complaint_data['department'])
         
         # Check if file exists and has data
         file_exists = os.path.exists(csv_path)
-        print(f"   CSV file exists: {file_exists}")
-        print(f"   CSV path: {csv_path}")
+        logger.debug("CSV path: %s (exists: %s)", csv_path, file_exists)
         
         # Ensure file ends with newline if it exists and has content
         if file_exists and os.path.getsize(csv_path) > 0:
@@ -189,19 +344,14 @@ def save_complaint_to_csv(complaint, student_name):
             
             # Write header if file is new or empty
             if not file_exists or os.path.getsize(csv_path) == 0:
-                print(f"   Writing CSV header...")
                 writer.writeheader()
             
-            print(f"   Writing complaint data to CSV...")
             writer.writerow(complaint_data)
-            print(f"   Data written successfully")
         
-        print(f"✅ Complaint {complaint.complaint_id} saved to CSV")
+        logger.info("✅ Complaint %s saved to CSV", complaint.complaint_id)
         
     except Exception as e:
-        print(f"❌ Error saving complaint to CSV: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error saving complaint to CSV: %s", e)
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -210,17 +360,20 @@ def load_user(user_id):
 # Model functionality removed for clean deployment
 
 @retry_db_operation(max_retries=5, delay=2)
-def init_db():
+def init_db(app):
     with app.app_context():
         try:
             # Test connection first
             with db.engine.connect() as conn:
                 conn.execute(db.text('SELECT 1'))
             db.create_all()
-            print("✅ Database tables created successfully.")
+            logger.info("✅ Database tables created successfully.")
+            created = ensure_indexes(db.engine)
+            if created:
+                logger.info("✅ Created indexes: %s", ', '.join(created))
             return True
         except Exception as e:
-            print(f"❌ Error creating database tables: {e}")
+            logger.error("❌ Error creating database tables: %s", e)
             # Try to dispose and recreate engine
             try:
                 db.session.remove()
@@ -229,11 +382,8 @@ def init_db():
                 pass
             raise e
 
-# Setup database
-init_db()
-
 # Admin setup
-def create_default_admin():
+def create_default_admin(app):
     with app.app_context():
         # Create admin if not exists
         admin = User.query.filter_by(email='admin@college.edu').first()
@@ -248,21 +398,18 @@ def create_default_admin():
             )
             db.session.add(admin)
             db.session.commit()
-            print("✅ Default admin created")
+            logger.info("✅ Default admin created")
 
-def load_initial_data():
+def load_initial_data(app):
     try:
         from data_loader import load_all_data
-        load_all_data()
+        with app.app_context():
+            load_all_data()
     except Exception as e:
-        print(f"⚠️ Could not load CSV data: {e}")
-        print("📝 Make sure CSV files exist in the data/ directory")
-
-create_default_admin()
-load_initial_data()
+        logger.warning("⚠️ Could not load CSV data: %s (make sure CSV files exist in the data/ directory)", e)
 
 # Login/Register endpoints
-@app.route('/api/register', methods=['POST'])
+@api.route('/api/register', methods=['POST'])
 @validate_json_request
 @validate_request(VALIDATION_RULES['student_registration'])
 @rate_limit(max_attempts=3, window_minutes=10)
@@ -306,10 +453,10 @@ def register():
                 pass
         
         # Create student ID
-        course = Course.query.get(data.get('course_id'))
+        course = reference_data.course(data.get('course_id'))
         if course:
             year_suffix = str(data.get('admission_year', datetime.now().year))[-2:]
-            course_code = course.code.replace(' ', '').replace('.', '').upper()
+            course_code = course['code'].replace(' ', '').replace('.', '').upper()
             
             # Count students for ID generation
             count = User.query.filter_by(
@@ -330,9 +477,9 @@ def register():
             phone=data.get('phone'),
             role='student',
             course_id=data.get('course_id'),
-            course_name=course.name if course else None,
+            course_name=course['name'] if course else None,
             department_id=data.get('department_id'),
-            department_name=course.department.name if course and course.department else None,
+            department_name=course['department_name'] if course else None,
             year=data.get('year'),
             semester=data.get('semester'),
             roll_number=data.get('roll_number'),
@@ -361,7 +508,7 @@ def register():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/login', methods=['POST'])
+@api.route('/api/login', methods=['POST'])
 @validate_json_request
 @rate_limit(max_attempts=5, window_minutes=15)
 @monitor_performance
@@ -411,19 +558,19 @@ def login():
         
         return jsonify({'error': 'Invalid credentials'}), 401
 
-@app.route('/api/logout', methods=['POST'])
+@api.route('/api/logout', methods=['POST'])
 @login_required
 def logout():
     logout_user()
     return jsonify({'message': 'Logged out successfully'}), 200
 
-@app.route('/api/me', methods=['GET'])
+@api.route('/api/me', methods=['GET'])
 @login_required
 def get_current_user():
     return jsonify(current_user.to_dict())
 
 # Complaint endpoints
-@app.route('/api/complaints', methods=['POST'])
+@api.route('/api/complaints', methods=['POST'])
 @validate_json_request
 @validate_request(VALIDATION_RULES['complaint_submission'])
 @monitor_performance
@@ -452,11 +599,11 @@ def create_complaint():
         return jsonify({'error': 'User not found'}), 404
 
     # Set priority from category
-    category = ComplaintCategory.query.get(category_id)
-    priority = category.priority_level if category else 'Medium'
+    category = reference_data.category(category_id)
+    priority = category['priority_level'] if category else 'Medium'
     
     # Set expected resolution date
-    resolution_days = category.typical_resolution_days if category else 7
+    resolution_days = category['typical_resolution_days'] if category else 7
     expected_date = datetime.utcnow() + timedelta(days=resolution_days)
 
     # Save complaint
@@ -474,24 +621,50 @@ def create_complaint():
     # Set complaint ID
     complaint.complaint_id = complaint.generate_complaint_id()
     
+    # Recent near-duplicates in the same department (looked up before this transaction writes)
+    try:
+        matches = duplicate_index.find(complaint)
+    except Exception as e:
+        logger.exception("Duplicate check failed: %s", e)
+        matches = []
+    
+    # Least loaded admin of the department
+    try:
+        auto_assigner.assign(complaint)
+    except Exception as e:
+        logger.exception("Auto-assignment failed: %s", e)
+    
     db.session.add(complaint)
+    db.session.flush()
+    cluster_id = link_duplicate(complaint.id, matches) if matches else None
+    notify_admins('new_complaint', 'New Complaint Received', f'{complaint.title} - {user.name}',
+                  complaint_id=complaint.id, data={'cluster_id': cluster_id} if cluster_id else None)
+    if complaint.assigned_to:
+        notify([complaint.assigned_to], 'complaint_assigned', 'Complaint Assigned to You',
+               f'{complaint.title} - {user.name}', complaint_id=complaint.id)
     db.session.commit()
     
     # Save to CSV
     save_complaint_to_csv(complaint, user.name)
     
-    return jsonify(complaint.to_dict()), 201
+    result = complaint.to_dict()
+    result['cluster_id'] = cluster_id
+    result['possible_duplicates'] = [{'id': match_id, 'similarity': similarity} for match_id, similarity in matches]
+    return jsonify(result), 201
 
-@app.route('/api/complaints', methods=['GET'])
+@api.route('/api/complaints', methods=['GET'])
+@batch_cost(5)
+@read_only
 def get_complaints():
+    fields = complaint_projection.requested()
     user_id = request.args.get('user_id')
-    if user_id:
-        complaints = Complaint.query.filter_by(student_id=user_id).order_by(Complaint.created_at.desc()).all()
-    else:
-        complaints = Complaint.query.order_by(Complaint.created_at.desc()).all()
-    return jsonify([c.to_dict() for c in complaints])
+    query = Complaint.query.filter_by(student_id=user_id) if user_id else Complaint.query
+    query = query.order_by(Complaint.created_at.desc())
+    if fields:
+        return jsonify(complaint_projection.rows(query, fields))
+    return jsonify([c.to_dict() for c in query.all()])
 
-@app.route('/api/complaints/<int:id>/status', methods=['PATCH'])
+@api.route('/api/complaints/<int:id>/status', methods=['PATCH'])
 def update_status(id):
     try:
         data = request.json
@@ -526,13 +699,18 @@ def update_status(id):
                 )
                 db.session.add(comment)
         
+        if status != old_status:
+            notify([complaint.student_id], 'complaint_update', f'Complaint {complaint.complaint_id} Updated',
+                   f'Status changed to {status}', complaint_id=complaint.id,
+                   data={'old_status': old_status, 'status': status})
+        
         db.session.commit()
         
         # Update CSV file
         try:
             update_complaint_in_csv(complaint)
         except Exception as e:
-            print(f"Failed to update CSV: {e}")
+            logger.exception("Failed to update CSV: %s", e)
         
         return jsonify({
             'message': f'Complaint status updated to {status}',
@@ -541,7 +719,7 @@ def update_status(id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/complaints/<int:id>/priority', methods=['PATCH'])
+@api.route('/api/complaints/<int:id>/priority', methods=['PATCH'])
 def update_priority(id):
     data = request.json
     priority = data.get('priority')
@@ -551,7 +729,7 @@ def update_priority(id):
     return jsonify(complaint.to_dict())
 
 # Comment endpoints
-@app.route('/api/complaints/<int:complaint_id>/comments', methods=['POST'])
+@api.route('/api/complaints/<int:complaint_id>/comments', methods=['POST'])
 def add_comment(complaint_id):
     data = request.json
     admin_id = data.get('admin_id')
@@ -572,74 +750,107 @@ def add_comment(complaint_id):
     )
     
     db.session.add(comment)
+    complaint = db.session.get(Complaint, complaint_id)
+    if complaint:
+        notify([complaint.student_id], 'new_comment', f'New comment on {complaint.complaint_id}',
+               f'{admin.name}: {text}', complaint_id=complaint.id)
     db.session.commit()
     
     return jsonify(comment.to_dict()), 201
 
-@app.route('/api/complaints/<int:complaint_id>/comments', methods=['GET'])
+@api.route('/api/complaints/<int:complaint_id>/comments', methods=['GET'])
+@read_only
 def get_comments(complaint_id):
     # First check if the complaint exists
     complaint = Complaint.query.get(complaint_id)
     if not complaint:
         return jsonify({'error': 'Complaint not found'}), 404
     
-    comments = Comment.query.filter_by(complaint_id=complaint_id).order_by(Comment.created_at.asc()).all()
-    return jsonify([c.to_dict() for c in comments])
+    fields = comment_projection.requested()
+    query = Comment.query.filter_by(complaint_id=complaint_id).order_by(Comment.created_at.asc())
+    if fields:
+        return jsonify(comment_projection.rows(query, fields))
+    return jsonify([c.to_dict() for c in query.all()])
+
+@api.route('/api/comments', methods=['GET'])
+@batch_cost(3)
+@read_only
+def get_comments_for_complaints():
+    """Comments grouped by complaint in one query: ?complaint_ids=1,2,3 (&latest=K for the newest K each)"""
+    try:
+        complaint_ids = parse_ids(request.args.get('complaint_ids', ''))
+        latest = request.args.get('latest', type=int)
+        if latest is not None and latest < 1:
+            raise ValueError('latest must be a positive integer')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    grouped, missing = comments_by_complaint(complaint_ids, latest)
+    return jsonify({
+        'comments': {str(complaint_id): [c.to_dict() for c in comments] for complaint_id, comments in grouped.items()},
+        'missing': missing
+    })
 
 # Department endpoints
-@app.route('/api/departments', methods=['GET'])
+@api.route('/api/departments', methods=['GET'])
 @retry_db_operation(max_retries=3, delay=1)
+@read_only
 def get_departments():
     try:
-        departments = Department.query.all()
-        return jsonify([dept.to_dict() for dept in departments])
+        return Response(reference_data.json('departments'), mimetype='application/json')
     except Exception as e:
-        print(f"Error fetching departments: {e}")
+        logger.exception("Error fetching departments: %s", e)
         return jsonify({'error': 'Failed to fetch departments', 'details': str(e)}), 500
 
-@app.route('/api/departments/<int:dept_id>/categories', methods=['GET'])
+@api.route('/api/departments/<int:dept_id>/categories', methods=['GET'])
+@read_only
 def get_department_categories(dept_id):
-    categories = ComplaintCategory.query.filter_by(department_id=dept_id).all()
-    return jsonify([cat.to_dict() for cat in categories])
+    return Response(reference_data.json('categories', department_id=dept_id), mimetype='application/json')
 
 # Course endpoints
-@app.route('/api/courses', methods=['GET'])
+@api.route('/api/courses', methods=['GET'])
 @retry_db_operation(max_retries=3, delay=1)
+@read_only
 def get_courses():
     try:
-        courses = Course.query.all()
-        return jsonify([course.to_dict() for course in courses])
+        return Response(reference_data.json('courses'), mimetype='application/json')
     except Exception as e:
-        print(f"Error fetching courses: {e}")
+        logger.exception("Error fetching courses: %s", e)
         return jsonify({'error': 'Failed to fetch courses', 'details': str(e)}), 500
 
-@app.route('/api/courses/<int:dept_id>', methods=['GET'])
+@api.route('/api/courses/<int:dept_id>', methods=['GET'])
+@read_only
 def get_courses_by_department(dept_id):
-    courses = Course.query.filter_by(department_id=dept_id).all()
-    return jsonify([course.to_dict() for course in courses])
+    return Response(reference_data.json('courses', department_id=dept_id), mimetype='application/json')
 
 # Category endpoints
-@app.route('/api/complaint-categories', methods=['GET'])
+@api.route('/api/complaint-categories', methods=['GET'])
 @retry_db_operation(max_retries=3, delay=1)
+@read_only
 def get_complaint_categories():
     try:
-        categories = ComplaintCategory.query.all()
-        return jsonify([cat.to_dict() for cat in categories])
+        return Response(reference_data.json('categories'), mimetype='application/json')
     except Exception as e:
-        print(f"Error fetching complaint categories: {e}")
+        logger.exception("Error fetching complaint categories: %s", e)
         return jsonify({'error': 'Failed to fetch complaint categories', 'details': str(e)}), 500
 
 # Student endpoints
-@app.route('/api/students', methods=['GET'])
+@api.route('/api/students', methods=['GET'])
+@batch_cost(3)
+@read_only
 def get_all_students():
-    """Get all students for admin dashboard"""
+    """Get all students for admin dashboard (?fields= selects only the listed columns)"""
+    fields = user_projection.requested()
     try:
-        students = User.query.filter_by(role='student').all()
-        return jsonify([student.to_dict() for student in students])
+        query = User.query.filter_by(role='student')
+        if fields:
+            return jsonify(user_projection.rows(query, fields))
+        return jsonify([student.to_dict() for student in query.all()])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/student/<student_id>', methods=['GET'])
+@api.route('/api/student/<student_id>', methods=['GET'])
+@read_only
 def get_student_info(student_id):
     student = User.find_by_student_id(student_id)
     if not student:
@@ -647,54 +858,69 @@ def get_student_info(student_id):
     return jsonify(student.to_dict())
 
 # CSV data endpoints
-@app.route('/api/student-complaints/<student_id>', methods=['GET'])
+@api.route('/api/student-complaints/<student_id>', methods=['GET'])
+@batch_cost(3)
 @retry_db_operation(max_retries=3, delay=1)
+@read_only
 def get_student_complaints_from_csv(student_id):
+    """One student's complaints in the student_complaints.csv format (see complaint_feed)"""
     try:
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/student_complaints.csv')
-        
-        if not os.path.exists(csv_path):
-            return jsonify([]), 200
-        
-        # Read CSV file
-        df = pd.read_csv(csv_path)
-        
-        # Filter by student ID
-        student_complaints = df[df['student_id'] == student_id]
-        
-        # Convert to list of dictionaries
-        complaints_list = student_complaints.to_dict('records')
-        
-        return jsonify(complaints_list), 200
-        
+        return complaint_feed_response(student_id)
     except Exception as e:
-        print(f"Error reading student complaints CSV: {e}")
+        logger.exception("Error reading student complaints: %s", e)
         return jsonify({'error': 'Failed to fetch student complaints', 'details': str(e)}), 500
 
-@app.route('/api/all-student-complaints', methods=['GET'])
+@api.route('/api/all-student-complaints', methods=['GET'])
+@batch_cost(5)
 @retry_db_operation(max_retries=3, delay=1)
+@read_only
 def get_all_student_complaints_from_csv():
+    """All complaints in the student_complaints.csv format (see complaint_feed)"""
     try:
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/student_complaints.csv')
-        
-        if not os.path.exists(csv_path):
-            return jsonify([]), 200
-        
-        # Read CSV file with optimized settings
-        df = pd.read_csv(csv_path, low_memory=False)
-        
-        # Convert to list of dictionaries
-        complaints_list = df.to_dict('records')
-        
-        return jsonify(complaints_list), 200
-        
+        return complaint_feed_response()
     except Exception as e:
-        print(f"Error reading all student complaints CSV: {e}")
+        logger.exception("Error reading all student complaints: %s", e)
         return jsonify({'error': 'Failed to fetch all student complaints', 'details': str(e)}), 500
 
+def complaint_feed_response(student_id=None):
+    """A page for ?limit=/?cursor= (next cursor in X-Next-Cursor), otherwise the whole feed streamed.
+    JSON array by default; NDJSON with ?format=ndjson or Accept: application/x-ndjson. MessagePack
+    and ?layout=columnar bodies are encoded whole."""
+    ndjson = (request.args.get('format') == 'ndjson' or
+              request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE)
+    
+    limit = request.args.get('limit', type=int)
+    cursor = request.args.get('cursor', type=int)
+    if limit is not None or cursor is not None:
+        limit = max(1, min(limit or FEED_MAX_PAGE_SIZE, FEED_MAX_PAGE_SIZE))
+        records, next_cursor = feed_page(db.session, limit, student_id, cursor)
+        if ndjson:
+            response = Response(b''.join(ndjson_chunks(records)), mimetype=NDJSON_MIMETYPE)
+        else:
+            response = jsonify(records)
+        if next_cursor is not None:
+            response.headers['X-Next-Cursor'] = str(next_cursor)
+        return response
+    
+    if not ndjson and (wants_msgpack() or wants_columnar()):
+        return jsonify(list(iter_feed(db.session, student_id)))
+    
+    records = iter_feed(db.session, student_id)
+    encode = ndjson_chunks if ndjson else json_array_chunks
+    mimetype = NDJSON_MIMETYPE if ndjson else 'application/json'
+    
+    def read_chunks():
+        with reading():
+            yield from encode(records)
+    
+    return Response(stream_with_context(read_chunks()), mimetype=mimetype)
+
 # Search and Filter endpoints
-@app.route('/api/complaints/search', methods=['GET'])
+@api.route('/api/complaints/search', methods=['GET'])
+@batch_cost(3)
+@read_only
 def search_complaints():
+    fields = complaint_projection.requested()
     try:
         query = request.args.get('q', '').strip()
         status = request.args.get('status', '')
@@ -731,16 +957,22 @@ def search_complaints():
             to_date = datetime.strptime(date_to, '%Y-%m-%d')
             complaints_query = complaints_query.filter(Complaint.created_at <= to_date)
         
-        complaints = complaints_query.order_by(Complaint.created_at.desc()).all()
+        complaints_query = complaints_query.order_by(Complaint.created_at.desc())
+        if fields:
+            complaints = complaint_projection.rows(complaints_query, fields)
+        else:
+            complaints = [c.to_dict() for c in complaints_query.all()]
         
         return jsonify({
-            'complaints': [c.to_dict() for c in complaints],
+            'complaints': complaints,
             'total': len(complaints)
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/complaints/export', methods=['GET'])
+@api.route('/api/complaints/export', methods=['GET'])
+@batch_cost(10)
+@read_only
 def export_complaints():
     try:
         # Get all complaints with student info
@@ -755,10 +987,10 @@ def export_complaints():
                 'Student Name': student.name,
                 'Email': student.email,
                 'Course': student.course_name,
-                'Department': complaint.department.name if complaint.department else '',
+                'Department': reference_data.department_name(complaint.department_id) or '',
                 'Title': complaint.title,
                 'Description': complaint.description,
-                'Category': complaint.complaint_category.name if complaint.complaint_category else '',
+                'Category': reference_data.category_name(complaint.category_id) or '',
                 'Status': complaint.status,
                 'Priority': complaint.priority,
                 'Urgency Level': complaint.urgency_level,
@@ -774,9 +1006,54 @@ def export_complaints():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@api.route('/api/complaints/export/columnar', methods=['GET'])
+@batch_cost(10)
+def export_complaints_columnar():
+    """Stream complaints joined with student/department/category as Parquet or Arrow IPC"""
+    import columnar_export
+    try:
+        export_format = request.args.get('format', 'parquet')
+        date_from = request.args.get('date_from', '')
+        date_to = request.args.get('date_to', '')
+        department_id = request.args.get('department_id', '')
+        
+        if export_format not in columnar_export.EXPORT_FORMATS:
+            return jsonify({'error': f'format must be one of: {", ".join(columnar_export.EXPORT_FORMATS)}'}), 400
+        if not columnar_export.PYARROW_AVAILABLE:
+            return jsonify({'error': 'Columnar export requires pyarrow'}), 501
+        
+        filters = {
+            'date_from': datetime.strptime(date_from, '%Y-%m-%d') if date_from else None,
+            'date_to': datetime.strptime(date_to, '%Y-%m-%d') if date_to else None,
+            'department_id': int(department_id) if department_id else None
+        }
+        chunks = columnar_export.iter_export_chunks(
+            db.session,
+            export_format,
+            compression=request.args.get('compression') or None,
+            **filters
+        )
+        
+        def read_chunks():
+            with reading():
+                yield from chunks
+        
+        filename = columnar_export.export_filename(export_format)
+        return Response(
+            stream_with_context(read_chunks()),
+            mimetype=columnar_export.EXPORT_FORMATS[export_format]['mimetype'],
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 # Stats endpoints
-@app.route('/api/stats', methods=['GET'])
+@api.route('/api/stats', methods=['GET'])
+@batch_cost(3)
 @monitor_performance
+@read_only
 def get_stats():
     try:
         # Basic counts
@@ -791,8 +1068,11 @@ def get_stats():
         week_ago = today - timedelta(days=7)
         month_ago = today - timedelta(days=30)
         
+        # Range predicate so the created_at index can be used
+        today_start = datetime.combine(today, datetime.min.time())
         today_complaints = Complaint.query.filter(
-            db.func.date(Complaint.created_at) == today
+            Complaint.created_at >= today_start,
+            Complaint.created_at < today_start + timedelta(days=1)
         ).count()
         
         week_complaints = Complaint.query.filter(
@@ -821,19 +1101,9 @@ def get_stats():
             db.func.count(Complaint.id)
         ).join(Complaint).group_by(ComplaintCategory.name).all()
         
-        # Average resolution time
-        resolved_complaints = Complaint.query.filter(
-            Complaint.status == 'Resolved',
-            Complaint.resolved_at.isnot(None)
-        ).all()
-        
-        avg_resolution_hours = 0
-        if resolved_complaints:
-            total_hours = sum([
-                (c.resolved_at - c.created_at).total_seconds() / 3600 
-                for c in resolved_complaints
-            ])
-            avg_resolution_hours = round(total_hours / len(resolved_complaints), 1)
+        # Average resolution time (computed in the database)
+        avg_hours, _ = average_resolution_hours(db.session)
+        avg_resolution_hours = round(avg_hours, 1)
         
         return jsonify({
             'total': total_complaints,
@@ -853,8 +1123,31 @@ def get_stats():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@api.route('/api/analytics/resolution-times', methods=['GET'])
+@batch_cost(3)
+@monitor_performance
+@read_only
+def get_resolution_time_analytics():
+    """Resolution-time percentiles and SLA breach rates per department/category"""
+    try:
+        group_by = request.args.get('group_by', 'department')
+        date_from = request.args.get('date_from', '')
+        date_to = request.args.get('date_to', '')
+        
+        if group_by not in RESOLUTION_GROUPINGS:
+            return jsonify({'error': f'group_by must be one of: {", ".join(RESOLUTION_GROUPINGS)}'}), 400
+        
+        from_date = datetime.strptime(date_from, '%Y-%m-%d') if date_from else None
+        to_date = datetime.strptime(date_to, '%Y-%m-%d') if date_to else None
+        
+        return jsonify(resolution_time_stats(db.session, group_by, from_date, to_date))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 # Bulk Operations
-@app.route('/api/complaints/bulk-update', methods=['POST'])
+@api.route('/api/complaints/bulk-update', methods=['POST'])
 def bulk_update_complaints():
     try:
         data = request.json
@@ -872,8 +1165,16 @@ def bulk_update_complaints():
             return jsonify({'error': 'No complaints found'}), 404
         
         updated_count = 0
+        status_updates = []
         for complaint in complaints:
             if action == 'status':
+                if complaint.status != value:
+                    status_updates.append({
+                        'user_id': complaint.student_id, 'type': 'complaint_update',
+                        'title': f'Complaint {complaint.complaint_id} Updated',
+                        'message': f'Status changed to {value}', 'complaint_id': complaint.id,
+                        'data': {'old_status': complaint.status, 'status': value}
+                    })
                 complaint.status = value
                 if value == 'Resolved':
                     complaint.resolved_at = datetime.utcnow()
@@ -885,6 +1186,7 @@ def bulk_update_complaints():
             complaint.updated_at = datetime.utcnow()
             updated_count += 1
         
+        add_notifications(status_updates)
         db.session.commit()
         
         return jsonify({
@@ -894,51 +1196,274 @@ def bulk_update_complaints():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-# Notification System
-@app.route('/api/notifications/<int:user_id>', methods=['GET'])
-def get_notifications(user_id):
+# Near-duplicate clusters
+@api.route('/api/complaints/<int:complaint_id>/duplicates', methods=['GET'])
+@read_only
+def get_complaint_duplicates(complaint_id):
+    """The cluster this complaint belongs to, first complaint first"""
+    cluster_id = cluster_of(complaint_id)
+    complaints = cluster_members(cluster_id) if cluster_id else []
+    return jsonify({'cluster_id': cluster_id, 'complaints': [c.to_dict() for c in complaints]})
+
+@api.route('/api/complaint-clusters', methods=['GET'])
+@read_only
+def get_complaint_clusters():
+    """Clusters that still have unresolved duplicates, largest first"""
+    limit = request.args.get('limit', 50, type=int)
+    return jsonify(open_clusters(max(1, min(limit, 200))))
+
+@api.route('/api/complaint-clusters/<int:cluster_id>/resolve', methods=['POST'])
+@admin_required
+def resolve_complaint_cluster(cluster_id):
+    """Give every complaint in a cluster the same status (default Resolved) and optional admin comment"""
     try:
-        user = User.query.get_or_404(user_id)
-        notifications = []
-        
-        if user.role == 'student':
-            # Get student's complaint updates
-            recent_updates = Complaint.query.filter_by(student_id=user_id).filter(
-                Complaint.updated_at > datetime.utcnow() - timedelta(days=7)
-            ).order_by(Complaint.updated_at.desc()).limit(10).all()
-            
-            for complaint in recent_updates:
-                notifications.append({
-                    'id': f'complaint_{complaint.id}',
-                    'type': 'complaint_update',
+        data = request.get_json(silent=True) or {}
+        status = data.get('status', 'Resolved')
+        admin_comment = data.get('admin_comment', '')
+        
+        if status not in ['Pending', 'In Progress', 'Resolved', 'Rejected']:
+            return jsonify({'error': 'Invalid status'}), 400
+        if cluster_of(cluster_id) != cluster_id:
+            return jsonify({'error': 'Cluster not found'}), 404
+        
+        now = datetime.utcnow()
+        status_updates = []
+        complaints = cluster_members(cluster_id)
+        for complaint in complaints:
+            if complaint.status != status:
+                status_updates.append({
+                    'user_id': complaint.student_id, 'type': 'complaint_update',
                     'title': f'Complaint {complaint.complaint_id} Updated',
-                    'message': f'Status changed to {complaint.status}',
-                    'timestamp': complaint.updated_at.isoformat(),
-                    'read': False
+                    'message': f'Status changed to {status}', 'complaint_id': complaint.id,
+                    'data': {'old_status': complaint.status, 'status': status, 'cluster_id': cluster_id}
                 })
+            complaint.status = status
+            complaint.updated_at = now
+            if status == 'Resolved':
+                complaint.resolved_at = now
+                complaint.actual_resolution_date = now
+            if admin_comment:
+                db.session.add(Comment(complaint_id=complaint.id, admin_id=current_user.id,
+                                       admin_name=current_user.name,
+                                       text=f"Status changed to {status}. {admin_comment}"[:500]))
+        
+        add_notifications(status_updates)
+        db.session.commit()
         
-        elif user.role == 'admin':
-            # Get new complaints for admin
-            new_complaints = Complaint.query.filter_by(status='Pending').filter(
-                Complaint.created_at > datetime.utcnow() - timedelta(days=1)
-            ).order_by(Complaint.created_at.desc()).limit(10).all()
-            
-            for complaint in new_complaints:
-                notifications.append({
-                    'id': f'new_complaint_{complaint.id}',
-                    'type': 'new_complaint',
-                    'title': 'New Complaint Received',
-                    'message': f'{complaint.title} - {complaint.student.name}',
-                    'timestamp': complaint.created_at.isoformat(),
-                    'read': False
-                })
+        return jsonify({
+            'message': f'Cluster {cluster_id} set to {status}',
+            'cluster_id': cluster_id,
+            'updated_count': len(complaints)
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+# Auto-assignment
+@api.route('/api/admin/assignments/workload', methods=['GET'])
+@admin_required
+@read_only
+def get_admin_workloads():
+    """Weighted open workload per admin, busiest first"""
+    workloads = auto_assigner.workloads()
+    names = dict(db.session.query(User.id, User.name).filter(User.id.in_([w['admin_id'] for w in workloads])).all())
+    return jsonify([{**w, 'name': names.get(w['admin_id'])} for w in workloads])
+
+@api.route('/api/admin/assignments/rebalance', methods=['POST'])
+@admin_required
+def rebalance_assignments():
+    """Assign unassigned open complaints and even out admins' workloads (optionally one department)"""
+    data = request.get_json(silent=True) or {}
+    try:
+        max_moves = max(0, min(int(data.get('max_moves', 100)), 1000))
+        department_id = int(data['department_id']) if data.get('department_id') is not None else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'max_moves and department_id must be integers'}), 400
+    try:
+        changes = auto_assigner.rebalance(department_id, max_moves)
+        add_notifications([{
+            'user_id': new_admin, 'type': 'complaint_assigned', 'title': 'Complaint Assigned to You',
+            'message': f'{complaint.complaint_id}: {complaint.title}', 'complaint_id': complaint.id,
+            'data': {'reassigned_from': old_admin} if old_admin else None
+        } for complaint, old_admin, new_admin in changes])
+        db.session.commit()
         
-        return jsonify({'notifications': notifications})
+        return jsonify({
+            'assigned': sum(1 for _, old_admin, _ in changes if old_admin is None),
+            'moved': sum(1 for _, old_admin, _ in changes if old_admin is not None),
+            'changes': [{'id': complaint.id, 'from': old_admin, 'to': new_admin}
+                        for complaint, old_admin, new_admin in changes],
+            'workload': auto_assigner.workloads()
+        })
     except Exception as e:
+        db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+# Category suggestions
+NO_SUGGESTION_MODEL = {'error': 'No suggestion model yet; train one with python backend/suggestions.py'}
+
+def suggestion_limit(data):
+    """Suggestions per result from the request body (1-10, default 3), or None if not an integer"""
+    try:
+        return max(1, min(int(data.get('limit', 3)), 10))
+    except (TypeError, ValueError):
+        return None
+
+@api.route('/api/suggestions/categories', methods=['POST'])
+def suggest_categories():
+    """Rank categories and departments for a draft complaint's title and description"""
+    data = request.get_json(silent=True) or {}
+    text = complaint_text(data.get('title'), data.get('description'))
+    if not text.strip():
+        return jsonify({'error': 'Title or description required'}), 400
+    limit = suggestion_limit(data)
+    if limit is None:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    suggestions = category_suggester.suggest([text], limit)
+    if suggestions is None:
+        return jsonify(NO_SUGGESTION_MODEL), 503
+    return jsonify(suggestions[0])
+
+@api.route('/api/suggestions/categories/batch', methods=['POST'])
+@read_only
+def suggest_categories_batch():
+    """Score many drafts ("items") or existing complaints ("complaint_ids") in one pass.
+
+    For complaints, each result says whether the top suggestion matches the filed
+    category; "only_mismatched": true returns just the likely misrouted ones.
+    """
+    data = request.get_json(silent=True) or {}
+    items, complaint_ids = data.get('items'), data.get('complaint_ids')
+    batch = items if items is not None else complaint_ids
+    if not isinstance(batch, list) or not batch:
+        return jsonify({'error': 'Send a non-empty "items" or "complaint_ids" list'}), 400
+    if len(batch) > MAX_SUGGESTION_ITEMS:
+        return jsonify({'error': f'At most {MAX_SUGGESTION_ITEMS} items per request'}), 400
+    limit = suggestion_limit(data)
+    if limit is None:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    
+    if items is not None:
+        texts = [complaint_text(item.get('title'), item.get('description')) if isinstance(item, dict) else ''
+                 for item in items]
+        suggestions = category_suggester.suggest(texts, limit)
+        if suggestions is None:
+            return jsonify(NO_SUGGESTION_MODEL), 503
+        return jsonify({'results': suggestions})
+    
+    try:
+        ids = list(dict.fromkeys(int(complaint_id) for complaint_id in complaint_ids))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'complaint_ids must be integers'}), 400
+    rows = db.session.query(
+        Complaint.id, Complaint.title, Complaint.description, Complaint.category_id, Complaint.department_id
+    ).filter(Complaint.id.in_(ids)).all()
+    suggestions = category_suggester.suggest([complaint_text(row.title, row.description) for row in rows], limit)
+    if suggestions is None:
+        return jsonify(NO_SUGGESTION_MODEL), 503
+    
+    by_id = {}
+    for row, suggestion in zip(rows, suggestions):
+        top = suggestion['categories'][0] if suggestion['categories'] else None
+        by_id[row.id] = {
+            'id': row.id, 'category_id': row.category_id, 'department_id': row.department_id,
+            'matches_category': top is None or top['category_id'] == row.category_id,
+            **suggestion
+        }
+    results = [by_id[complaint_id] for complaint_id in ids if complaint_id in by_id]
+    if data.get('only_mismatched'):
+        results = [result for result in results if not result['matches_category']]
+    return jsonify({'results': results, 'missing': [complaint_id for complaint_id in ids if complaint_id not in by_id]})
+
+@api.route('/api/admin/suggestions/reload', methods=['POST'])
+@admin_required
+def reload_suggestion_model():
+    """Swap in a retrained model now instead of within SUGGESTION_CHECK_SECONDS"""
+    category_suggester.reload()
+    return jsonify(category_suggester.status())
+
+# Notification System
+@api.route('/api/notifications/<int:user_id>', methods=['GET'])
+@login_required
+@read_only
+def get_notifications(user_id):
+    """Latest notifications from the user's inbox plus the unread badge count"""
+    if current_user.id != user_id and current_user.role != 'admin':
+        return jsonify({'error': 'Forbidden'}), 403
+    fields = notification_projection.requested()
+    try:
+        limit = request.args.get('limit', 20, type=int)
+        if fields:
+            notifications = notification_projection.rows(latest_notifications_query(user_id, limit), fields)
+        else:
+            notifications = [n.to_dict() for n in latest_notifications(user_id, limit)]
+        return jsonify({
+            'notifications': notifications,
+            'unread_count': unread_count(user_id)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/notifications/<int:user_id>/unread-count', methods=['GET'])
+@login_required
+@read_only
+def get_unread_notification_count(user_id):
+    if current_user.id != user_id and current_user.role != 'admin':
+        return jsonify({'error': 'Forbidden'}), 403
+    return jsonify({'unread_count': unread_count(user_id)})
+
+@api.route('/api/notifications/<int:user_id>/read', methods=['POST'])
+@login_required
+def mark_notifications_read(user_id):
+    """Mark `ids` (or every unread notification) read in the caller's own inbox"""
+    if current_user.id != user_id:
+        return jsonify({'error': 'Forbidden'}), 403
+    ids = (request.get_json(silent=True) or {}).get('ids')
+    if ids is not None and not isinstance(ids, list):
+        return jsonify({'error': 'ids must be a list'}), 400
+    try:
+        marked = mark_read(user_id, ids)
+        db.session.commit()
+        return jsonify({'marked': marked, 'unread_count': unread_count(user_id)})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+# Admin dashboard bootstrap
+@api.route('/api/admin/dashboard', methods=['GET'])
+@admin_required
+@read_only
+@monitor_performance
+def get_admin_dashboard():
+    """Everything the dashboard's first screen needs, served from the precomputed payload"""
+    try:
+        snapshot = dashboard_cache.current()
+        if wants_msgpack():
+            response = Response(snapshot.msgpack_body(), mimetype=MSGPACK_MIMETYPE)
+            response.set_etag(f'{snapshot.etag}-msgpack')
+        else:
+            response = Response(snapshot.body, mimetype='application/json')
+            response.set_etag(snapshot.etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.vary.add('Accept')
+        return response.make_conditional(request)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Request batching
+@api.route('/api/batch', methods=['POST'])
+@validate_json_request
+def run_batch():
+    """Run several GET requests in one round trip: {"requests": [{"id": ..., "path": ...}], "concurrent": false}"""
+    try:
+        items, cost = batch_runner.parse(request.json)
+    except BatchError as e:
+        return jsonify({'error': str(e)}), 400
+    body = batch_runner.run(items, concurrent=bool(request.json.get('concurrent')))
+    return Response(body, mimetype='application/json', headers={'X-Batch-Cost': str(cost)})
+
 # Health check and monitoring
-@app.route('/api/health', methods=['GET'])
+@api.route('/api/health', methods=['GET'])
 def health_check():
     try:
         # Check database
@@ -961,7 +1486,7 @@ def health_check():
             'timestamp': datetime.utcnow().isoformat()
         }), 500
 
-@app.route('/api/admin/performance', methods=['GET'])
+@api.route('/api/admin/performance', methods=['GET'])
 @monitor_performance
 def get_performance_metrics():
     """Get detailed performance metrics for admin dashboard"""
@@ -969,180 +1494,192 @@ def get_performance_metrics():
         stats = perf_monitor.get_performance_stats()
         return jsonify({
             'performance_metrics': stats,
+            'db_pool': pool_metrics.snapshot(db.engine),
+            'background_services': background_services.status(),
+            'reference_data': reference_data.status(),
+            'dashboard': dashboard_cache.status(),
+            'duplicates': duplicate_index.status(),
+            'suggestions': category_suggester.status(),
+            'sla_escalation': current_app.extensions['sla_escalator'].status(),
+            'auto_assignment': auto_assigner.status(),
+            'logging': logging_status(),
+            'timestamp': datetime.utcnow().isoformat()
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/admin/db-pool', methods=['GET'])
+@admin_required
+def get_db_pool_metrics():
+    """Connection pool usage, checkout wait times and sizing"""
+    try:
+        router = current_app.extensions['db_routing']
+        wal_checkpointer = current_app.extensions.get('wal_checkpointer')
+        return jsonify({
+            'pool': pool_metrics.snapshot(db.engine),
+            'read_pools': [pool_metrics.snapshot(reader.engine) for reader in router.readers],
+            'readers': router.status(),
+            'wal_checkpoint': wal_checkpointer.last_result if wal_checkpointer else None,
+            'sizing': {
+                'workers': current_app.config['WEB_CONCURRENCY'],
+                'threads': current_app.config['WEB_THREADS'],
+                'max_connections': current_app.config['DB_MAX_CONNECTIONS'],
+                **current_app.config['DB_POOL_SIZING']
+            },
             'timestamp': datetime.utcnow().isoformat()
         }), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Error Handlers
-@app.errorhandler(404)
+@api.app_errorhandler(404)
 def not_found(error):
     return jsonify({'error': 'Resource not found'}), 404
 
-@app.errorhandler(500)
+@api.app_errorhandler(500)
 def internal_error(error):
     db.session.rollback()
     return jsonify({'error': 'Internal server error'}), 500
 
-@app.errorhandler(400)
+@api.app_errorhandler(400)
 def bad_request(error):
     return jsonify({'error': 'Bad request'}), 400
 
-@app.errorhandler(403)
+@api.app_errorhandler(403)
 def forbidden(error):
     return jsonify({'error': 'Access forbidden'}), 403
 
-# Rate limiting (if flask-limiter is installed)
-try:
-    from flask_limiter import Limiter
-    from flask_limiter.util import get_remote_address
-    
-    limiter = Limiter(
-        key_func=get_remote_address,
-        app=app,
-        default_limits=["200 per day", "50 per hour"]
-    )
-    
-    # Apply rate limiting to sensitive endpoints
-    @app.route('/api/register', methods=['POST'])
-    @limiter.limit("5 per minute")
-    def register_limited():
-        return register()
-        
-except ImportError:
-    print("⚠️ Flask-Limiter not installed. Rate limiting disabled.")
+@api.errorhandler(FieldsError)
+def unknown_fields(error):
+    return jsonify({'error': str(error)}), 400
 
-if __name__ == '__main__':
-    app.run(debug=False, port=5000)
 # Export endpoints
-@app.route('/api/export/complaints/csv', methods=['GET'])
+def complaint_export_records(iso=False):
+    """Every complaint as an export record, with ISO or CSV-style dates. Student names come
+    from one join on student_id, department and category names from the reference data registry."""
+    def timestamp(value):
+        return value.isoformat() if iso else value.strftime('%Y-%m-%d %H:%M:%S')
+    
+    rows = (db.session.query(Complaint, User.name, User.student_id)
+            .outerjoin(User, Complaint.student_id == User.id)
+            .order_by(Complaint.id))
+    return [{
+        'complaint_id': complaint.complaint_id,
+        'student_name': student_name or 'Unknown',
+        'student_id': student_id or 'Unknown',
+        'title': complaint.title,
+        'description': complaint.description,
+        'department': reference_data.department_name(complaint.department_id) or 'Unknown',
+        'category': reference_data.category_name(complaint.category_id) or 'Unknown',
+        'status': complaint.status,
+        'priority': complaint.priority,
+        'urgency_level': complaint.urgency_level,
+        'created_at': timestamp(complaint.created_at),
+        'updated_at': timestamp(complaint.updated_at),
+        'expected_resolution': ((complaint.expected_resolution_date.isoformat() if iso
+                                 else complaint.expected_resolution_date.strftime('%Y-%m-%d'))
+                                if complaint.expected_resolution_date else (None if iso else ''))
+    } for complaint, student_name, student_id in rows]
+
+@api.route('/api/export/complaints/csv', methods=['GET'])
+@batch_cost(10)
 @login_required
+@read_only
 def export_complaints_csv():
     """Export all complaints to CSV"""
     try:
-        # Get all complaints
-        complaints = Complaint.query.all()
-        
-        # Convert to dict format
-        complaints_data = []
-        for complaint in complaints:
-            user = User.query.get(complaint.user_id)
-            department = Department.query.get(complaint.department_id)
-            category = ComplaintCategory.query.get(complaint.category_id)
-            
-            complaints_data.append({
-                'complaint_id': complaint.complaint_id,
-                'student_name': user.name if user else 'Unknown',
-                'student_id': user.student_id if user else 'Unknown',
-                'title': complaint.title,
-                'description': complaint.description,
-                'department': department.name if department else 'Unknown',
-                'category': category.name if category else 'Unknown',
-                'status': complaint.status,
-                'priority': complaint.priority,
-                'urgency_level': complaint.urgency_level,
-                'created_at': complaint.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                'updated_at': complaint.updated_at.strftime('%Y-%m-%d %H:%M:%S'),
-                'expected_resolution': complaint.expected_resolution.strftime('%Y-%m-%d') if complaint.expected_resolution else ''
-            })
+        from export_utils import export_complaints_to_csv
+        complaints_data = complaint_export_records()
         
         return export_complaints_to_csv(complaints_data)
         
     except Exception as e:
-        print(f"Export error: {e}")
+        logger.exception("Export error: %s", e)
         return jsonify({'error': 'Export failed'}), 500
 
-@app.route('/api/export/complaints/json', methods=['GET'])
+@api.route('/api/export/complaints/json', methods=['GET'])
+@batch_cost(10)
 @login_required
+@read_only
 def export_complaints_json():
     """Export all complaints to JSON"""
     try:
-        # Get all complaints
-        complaints = Complaint.query.all()
-        
-        # Convert to dict format
-        complaints_data = []
-        for complaint in complaints:
-            user = User.query.get(complaint.user_id)
-            department = Department.query.get(complaint.department_id)
-            category = ComplaintCategory.query.get(complaint.category_id)
-            
-            complaints_data.append({
-                'complaint_id': complaint.complaint_id,
-                'student_name': user.name if user else 'Unknown',
-                'student_id': user.student_id if user else 'Unknown',
-                'title': complaint.title,
-                'description': complaint.description,
-                'department': department.name if department else 'Unknown',
-                'category': category.name if category else 'Unknown',
-                'status': complaint.status,
-                'priority': complaint.priority,
-                'urgency_level': complaint.urgency_level,
-                'created_at': complaint.created_at.isoformat(),
-                'updated_at': complaint.updated_at.isoformat(),
-                'expected_resolution': complaint.expected_resolution.isoformat() if complaint.expected_resolution else None
-            })
+        from export_utils import export_complaints_to_json
+        complaints_data = complaint_export_records(iso=True)
         
         return export_complaints_to_json(complaints_data)
         
     except Exception as e:
-        print(f"Export error: {e}")
+        logger.exception("Export error: %s", e)
         return jsonify({'error': 'Export failed'}), 500
 
-@app.route('/api/reports/summary', methods=['GET'])
+@api.route('/api/reports/summary', methods=['GET'])
+@batch_cost(5)
 @login_required
 def get_complaint_summary():
-    """Get complaint summary report"""
+    """Get complaint summary report (served from cache while data is unchanged)"""
     try:
-        # Get all complaints
-        complaints = Complaint.query.all()
+        job = report_manager.wait(report_manager.submit('summary'), timeout=current_app.config['REPORT_WAIT_SECONDS'])
         
-        # Convert to dict format
-        complaints_data = []
-        for complaint in complaints:
-            user = User.query.get(complaint.user_id)
-            department = Department.query.get(complaint.department_id)
-            category = ComplaintCategory.query.get(complaint.category_id)
-            
-            complaints_data.append({
-                'complaint_id': complaint.complaint_id,
-                'student_name': user.name if user else 'Unknown',
-                'title': complaint.title,
-                'department': department.name if department else 'Unknown',
-                'category': category.name if category else 'Unknown',
-                'status': complaint.status,
-                'priority': complaint.priority,
-                'created_at': complaint.created_at.isoformat()
-            })
+        if job['status'] == 'completed':
+            return jsonify(job['result'])
+        if job['status'] == 'failed':
+            return jsonify({'error': 'Report generation failed'}), 500
         
-        report = generate_complaint_report(complaints_data)
-        return jsonify(report)
+        # Still running - hand back the job so the client can poll
+        return jsonify(job_to_dict(job)), 202
         
     except Exception as e:
-        print(f"Report error: {e}")
+        logger.exception("Report error: %s", e)
         return jsonify({'error': 'Report generation failed'}), 500
 
-@app.route('/api/export/students/csv', methods=['GET'])
+@api.route('/api/reports/summary', methods=['POST'])
+@login_required
+def start_complaint_summary_job():
+    """Start a background summary report job"""
+    try:
+        job = report_manager.submit('summary')
+        status_code = 200 if job['status'] == 'completed' else 202
+        response = jsonify(job_to_dict(job, include_result=False))
+        response.headers['Location'] = f"/api/reports/jobs/{job['id']}"
+        return response, status_code
+    except Exception as e:
+        logger.exception("Report error: %s", e)
+        return jsonify({'error': 'Failed to start report job'}), 500
+
+@api.route('/api/reports/jobs/<job_id>', methods=['GET'])
+@login_required
+def get_report_job(job_id):
+    """Report job status, progress and (once completed) the report"""
+    job = report_manager.get(job_id)
+    if not job:
+        return jsonify({'error': 'Report job not found'}), 404
+    return jsonify(job_to_dict(job))
+
+@api.route('/api/export/students/csv', methods=['GET'])
+@batch_cost(10)
 @login_required
+@read_only
 def export_students_csv():
     """Export all students to CSV"""
     try:
+        from export_utils import export_students_to_csv
         # Get all students
         students = User.query.filter_by(role='student').all()
         
         # Convert to dict format
         students_data = []
         for student in students:
-            course = Course.query.get(student.course_id) if student.course_id else None
-            department = Department.query.get(student.department_id) if student.department_id else None
+            course = reference_data.course(student.course_id)
+            department = reference_data.department(student.department_id)
             
             students_data.append({
                 'student_id': student.student_id,
                 'name': student.name,
                 'email': student.email,
                 'phone': student.phone,
-                'course_name': course.name if course else student.course_name,
-                'department_name': department.name if department else student.department_name,
+                'course_name': course['name'] if course else student.course_name,
+                'department_name': department['name'] if department else student.department_name,
                 'year': student.year,
                 'semester': student.semester,
                 'roll_number': student.roll_number,
@@ -1152,15 +1689,16 @@ def export_students_csv():
         return export_students_to_csv(students_data)
         
     except Exception as e:
-        print(f"Export error: {e}")
+        logger.exception("Export error: %s", e)
         return jsonify({'error': 'Export failed'}), 500
 
 # Email notification endpoint
-@app.route('/api/send-notification', methods=['POST'])
+@api.route('/api/send-notification', methods=['POST'])
 @login_required
 def send_notification():
     """Send email notification (mock implementation)"""
     try:
+        from email_templates import get_complaint_submitted_template, get_status_update_template, get_admin_notification_template
         data = request.get_json()
         notification_type = data.get('type', 'general')
         recipient = data.get('recipient')
@@ -1179,9 +1717,7 @@ def send_notification():
             return jsonify({'error': 'Invalid notification type'}), 400
         
         # Log the email (in real implementation, send via SMTP)
-        print(f"📧 Email would be sent to: {recipient}")
-        print(f"📧 Subject: {template['subject']}")
-        print(f"📧 Type: {notification_type}")
+        logger.info("📧 Email would be sent to %s: %s (%s)", recipient, template['subject'], notification_type)
         
         return jsonify({
             'success': True,
@@ -1191,5 +1727,8 @@ def send_notification():
         })
         
     except Exception as e:
-        print(f"Notification error: {e}")
+        logger.exception("Notification error: %s", e)
         return jsonify({'error': 'Failed to send notification'}), 500
+
+if __name__ == '__main__':
+    create_app().run(debug=False, port=5000)
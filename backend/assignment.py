@@ -0,0 +1,284 @@
+# Auto-Assignment Module
+"""
+Assigns new complaints to the least loaded admin of their department and
+rebalances departments on demand.
+
+An admin's load is the weighted sum of their open complaints (Pending or In
+Progress): the priority weight scaled by urgency_level. Loads are counters
+kept in memory and updated incrementally. Commits that assign, close or
+re-prioritise complaints apply their deltas after commit, and rollbacks
+discard them. Every department (and the pool of all admins, used when a
+department has none) has a min-heap of (load, admin id) with lazy deletion,
+so picking an admin is O(log n).
+
+Each process keeps its own counters, so they are reconciled against the
+database every ASSIGNMENT_RECONCILE_SECONDS with one grouped query, instead
+of recounting on every assignment.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict
+from sqlalchemy import event, inspect, select, func
+from sqlalchemy.orm import Session
+from db_routing import RoutingSession
+from models import db, Complaint, User
+
+OPEN_STATUSES = ('Pending', 'In Progress')
+PRIORITY_WEIGHTS = {'Low': 1.0, 'Medium': 2.0, 'High': 3.0, 'Critical': 5.0}
+ALL_ADMINS = None  # Pool key for departments without admins of their own
+MAX_REBALANCE_MOVES = 200
+
+def workload(priority, urgency_level):
+    """How much one open complaint adds to its admin's load"""
+    urgency = min(max(urgency_level or 1, 1), 5)
+    return PRIORITY_WEIGHTS.get(priority, PRIORITY_WEIGHTS['Medium']) * (1 + 0.25 * (urgency - 1))
+
+def _load_of(values):
+    """(admin id, weight) a complaint contributes with the given attribute values, or None"""
+    status = values['status'] or 'Pending'  # unset until the column default applies on insert
+    if values['assigned_to'] is None or status not in OPEN_STATUSES:
+        return None
+    return values['assigned_to'], workload(values['priority'], values['urgency_level'])
+
+TRACKED = ('assigned_to', 'status', 'priority', 'urgency_level')
+
+class AutoAssigner:
+    def __init__(self, reconcile_seconds=60):
+        self.enabled = True
+        self.reconcile_seconds = reconcile_seconds
+        self.loads = {}  # admin id -> weighted open workload
+        self.departments = {}  # admin id -> department id
+        self.pools = {}  # department id (or ALL_ADMINS) -> heap of (load, admin id)
+        self.reconciled_at = None
+        self.reconciles = 0
+        self.assigned = 0
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config['AUTO_ASSIGN_ENABLED']
+        self.reconcile_seconds = app.config['ASSIGNMENT_RECONCILE_SECONDS']
+        self.reconciled_at = None
+
+    # Counters
+    def reconcile(self):
+        """Reload admins and recount their open workload from the database"""
+        # Private session on the primary: sees every commit and leaves the request session alone
+        with Session(db.engine) as session:
+            admins = session.execute(
+                select(User.id, User.department_id).where(User.role == 'admin', User.is_active.isnot(False))
+            ).all()
+            counts = session.execute(
+                select(Complaint.assigned_to, Complaint.priority, Complaint.urgency_level, func.count())
+                .where(Complaint.status.in_(OPEN_STATUSES), Complaint.assigned_to.isnot(None))
+                .group_by(Complaint.assigned_to, Complaint.priority, Complaint.urgency_level)
+            ).all()
+        with self.lock:
+            self.departments = {admin_id: department_id for admin_id, department_id in admins}
+            self.loads = dict.fromkeys(self.departments, 0.0)
+            for admin_id, priority, urgency_level, count in counts:
+                if admin_id in self.loads:
+                    self.loads[admin_id] += workload(priority, urgency_level) * count
+            self._rebuild_pools()
+            self.reconciled_at = time.monotonic()
+            self.reconciles += 1
+
+    def _rebuild_pools(self):
+        members = defaultdict(list)
+        for admin_id, department_id in self.departments.items():
+            members[department_id].append(admin_id)
+            if department_id is not ALL_ADMINS:
+                members[ALL_ADMINS].append(admin_id)
+        self.pools = {key: [(self.loads[a], a) for a in admin_ids] for key, admin_ids in members.items()}
+        for heap in self.pools.values():
+            heapq.heapify(heap)
+
+    def _maybe_reconcile(self):
+        if self.reconciled_at is None or time.monotonic() - self.reconciled_at >= self.reconcile_seconds:
+            self.reconcile()
+
+    def _adjust(self, admin_id, delta):
+        """Change an admin's load and re-enter them in their heaps (old entries go stale)"""
+        if admin_id not in self.loads:
+            return
+        load = self.loads[admin_id] = self.loads[admin_id] + delta
+        department_id = self.departments[admin_id]
+        for key in {department_id, ALL_ADMINS}:
+            heap = self.pools.get(key)
+            if heap is None:
+                continue
+            heapq.heappush(heap, (load, admin_id))
+            if len(heap) > 4 * len(self.loads) + 16:  # too many stale entries: compact
+                self._rebuild_pools()
+
+    def apply(self, deltas):
+        with self.lock:
+            for admin_id, delta in deltas.items():
+                self._adjust(admin_id, delta)
+
+    def _least_loaded(self, department_id):
+        heap = self.pools.get(department_id) or self.pools.get(ALL_ADMINS)
+        while heap:
+            load, admin_id = heap[0]
+            if self.loads.get(admin_id) == load:
+                return admin_id
+            heapq.heappop(heap)  # stale: the admin's load changed since this entry was pushed
+        return None
+
+    # Assignment
+    def assign(self, complaint):
+        """Pick the least loaded admin for a complaint about to be created; returns the admin id or None.
+
+        The load is reserved at once so concurrent submissions spread out; a
+        rollback of the current transaction releases it.
+        """
+        if not self.enabled:
+            return None
+        self._maybe_reconcile()
+        weight = workload(complaint.priority, complaint.urgency_level)
+        with self.lock:
+            admin_id = self._least_loaded(complaint.department_id)
+            if admin_id is None:
+                return None
+            self._adjust(admin_id, weight)
+            self.assigned += 1
+        complaint.assigned_to = admin_id
+        db.session.info.setdefault('assignment_reserved', {})[id(complaint)] = (admin_id, weight)
+        return admin_id
+
+    def rebalance(self, department_id=None, max_moves=MAX_REBALANCE_MOVES):
+        """Assign unassigned open complaints and move Pending ones off the busiest admins.
+
+        Works on fresh counts. Returns [(complaint, old admin id, new admin id)]
+        with the complaints updated in the current session; the caller commits.
+        """
+        self.reconcile()
+        query = Complaint.query.filter(Complaint.status.in_(OPEN_STATUSES))
+        if department_id is not None:
+            query = query.filter(Complaint.department_id == department_id)
+        by_pool = defaultdict(list)
+        with self.lock:
+            loads = dict(self.loads)
+            members = defaultdict(list)
+            for admin_id, admin_department in self.departments.items():
+                members[admin_department].append(admin_id)
+            members[ALL_ADMINS] = list(loads)
+        for complaint in query.all():
+            if complaint.assigned_to is None or complaint.assigned_to in loads:
+                pool = complaint.department_id if members.get(complaint.department_id) else ALL_ADMINS
+                by_pool[pool].append(complaint)
+
+        changes = []
+        for pool, complaints in by_pool.items():
+            moves = sum(1 for _, old_admin, _ in changes if old_admin is not None)
+            changes += plan_rebalance(complaints, members[pool], loads, max_moves - moves)
+        for complaint, _, new_admin in changes:
+            complaint.assigned_to = new_admin
+        return changes
+
+    def status(self):
+        return {
+            'enabled': self.enabled,
+            'admins': len(self.loads),
+            'assigned': self.assigned,
+            'reconciles': self.reconciles,
+            'seconds_since_reconcile': round(time.monotonic() - self.reconciled_at, 1) if self.reconciled_at else None
+        }
+
+    def workloads(self):
+        self._maybe_reconcile()
+        with self.lock:
+            return [{'admin_id': admin_id, 'department_id': self.departments[admin_id], 'load': round(load, 2)}
+                    for admin_id, load in sorted(self.loads.items(), key=lambda item: (-item[1], item[0]))]
+
+def plan_rebalance(complaints, admin_ids, loads, max_moves):
+    """Assignments that even out the admins' loads (updating `loads`), as [(complaint, old, new)].
+
+    Unassigned complaints go to the least loaded admin, heaviest first. Then,
+    up to max_moves times, while the busiest admin has a Pending complaint
+    lighter than the gap to the least busy one, the heaviest such complaint
+    moves across; each move strictly lowers the larger of the two loads.
+    """
+    if not admin_ids:
+        return []
+    changes = []
+    unassigned = sorted((c for c in complaints if c.assigned_to is None),
+                        key=lambda c: -workload(c.priority, c.urgency_level))
+    for complaint in unassigned:
+        target = min(admin_ids, key=lambda a: (loads[a], a))
+        loads[target] += workload(complaint.priority, complaint.urgency_level)
+        changes.append((complaint, None, target))
+
+    movable = defaultdict(list)
+    for complaint in complaints:
+        if complaint.assigned_to is not None and complaint.status == 'Pending':
+            movable[complaint.assigned_to].append(complaint)
+    for pending in movable.values():
+        pending.sort(key=lambda c: workload(c.priority, c.urgency_level))
+
+    for _ in range(max(max_moves, 0)):
+        busiest = max(admin_ids, key=lambda a: (loads[a], -a))
+        idlest = min(admin_ids, key=lambda a: (loads[a], a))
+        gap = loads[busiest] - loads[idlest]
+        candidates = [c for c in movable[busiest] if workload(c.priority, c.urgency_level) < gap - 1e-9]
+        if busiest == idlest or not candidates:
+            break
+        complaint = candidates[-1]
+        weight = workload(complaint.priority, complaint.urgency_level)
+        movable[busiest].remove(complaint)
+        movable[idlest].append(complaint)
+        movable[idlest].sort(key=lambda c: workload(c.priority, c.urgency_level))
+        loads[busiest] -= weight
+        loads[idlest] += weight
+        changes.append((complaint, busiest, idlest))
+    return changes
+
+auto_assigner = AutoAssigner()
+
+def _tracked_values(state, before):
+    values = {}
+    for attr in TRACKED:
+        history = state.attrs[attr].history
+        current = history.added[0] if history.added else (history.unchanged[0] if history.unchanged else None)
+        values[attr] = (history.deleted[0] if history.deleted else current) if before else current
+    return values
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _collect_workload_changes(session, flush_context):
+    reserved = session.info.get('assignment_reserved', {})
+    deltas = session.info.setdefault('assignment_deltas', defaultdict(float))
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Complaint):
+            continue
+        state = inspect(obj)
+        before = None if obj in session.new else _load_of(_tracked_values(state, before=True))
+        after = None if obj in session.deleted else _load_of(_tracked_values(state, before=False))
+        reservation = reserved.pop(id(obj), None)
+        if reservation is not None:
+            # Counted when it was assigned; keep it for the rollback and count later changes only
+            session.info.setdefault('assignment_confirmed', []).append(reservation)
+            before = reservation
+        if before != after:
+            if before:
+                deltas[before[0]] -= before[1]
+            if after:
+                deltas[after[0]] += after[1]
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _apply_after_commit(session):
+    deltas = session.info.pop('assignment_deltas', None)
+    session.info.pop('assignment_reserved', None)
+    session.info.pop('assignment_confirmed', None)
+    if deltas:
+        auto_assigner.apply({admin_id: delta for admin_id, delta in deltas.items() if delta})
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _release_after_rollback(session):
+    session.info.pop('assignment_deltas', None)
+    released = defaultdict(float)
+    for admin_id, weight in itertools.chain(session.info.pop('assignment_reserved', {}).values(),
+                                            session.info.pop('assignment_confirmed', [])):
+        released[admin_id] -= weight
+    if released:
+        auto_assigner.apply(released)
@@ -0,0 +1,160 @@
+# Background Services Module
+"""
+Periodic jobs (WAL checkpoints, monitors, schedulers) run once per deployment
+instead of once per imported process. Services register here at import time
+but only start in the process that owns the background lock:
+
+    python backend/background.py      # production: dedicated process
+    python backend/run_server.py      # development: started in-process
+
+Web workers (gunicorn) never start them.
+"""
+import fcntl
+import logging
+import os
+import signal
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+POSTGRES_LOCK_KEY = 0x5C5B6701  # pg advisory lock id shared by all runners
+
+class BackgroundLock:
+    """Ensures a single owner of the background services.
+
+    PostgreSQL deployments use a session advisory lock, so runners on different
+    hosts exclude each other; SQLite uses a file lock next to the database.
+    """
+    def __init__(self, engine, lock_file=None):
+        self.engine = engine
+        self.lock_file = lock_file or self._default_lock_file()
+        self.connection = None
+        self.handle = None
+
+    def _default_lock_file(self):
+        database = self.engine.url.database
+        if self.engine.dialect.name == 'sqlite' and database not in (None, '', ':memory:'):
+            return os.path.abspath(database) + '.background.lock'
+        return os.path.join(tempfile.gettempdir(), 'smart-complaint-background.lock')
+
+    @property
+    def held(self):
+        return self.connection is not None or self.handle is not None
+
+    def acquire(self):
+        if self.held:
+            return True
+        if self.engine.dialect.name == 'postgresql':
+            conn = self.engine.connect()
+            if conn.exec_driver_sql(f"SELECT pg_try_advisory_lock({POSTGRES_LOCK_KEY})").scalar():
+                conn.commit()
+                self.connection = conn
+                return True
+            conn.close()
+            return False
+
+        handle = open(self.lock_file, 'a+')
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        handle.seek(0)
+        handle.truncate()
+        handle.write(str(os.getpid()))
+        handle.flush()
+        self.handle = handle
+        return True
+
+    def release(self):
+        if self.connection is not None:
+            try:
+                self.connection.exec_driver_sql(f"SELECT pg_advisory_unlock({POSTGRES_LOCK_KEY})")
+            finally:
+                self.connection.close()
+                self.connection = None
+        if self.handle is not None:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+            self.handle.close()
+            self.handle = None
+
+class BackgroundServices:
+    """Registry of long-running services with start()/stop() methods"""
+    def __init__(self):
+        self.services = OrderedDict()
+        self.lock = None
+        self.started_at = None
+
+    def register(self, name, service):
+        self.services[name] = service
+        if self.started_at:
+            service.start()
+        return service
+
+    @property
+    def running(self):
+        return self.started_at is not None
+
+    def start(self, engine, lock_file=None):
+        """Start every service if this process wins the lock; returns whether it did"""
+        if self.running:
+            return True
+        self.lock = self.lock or BackgroundLock(engine, lock_file)
+        if not self.lock.acquire():
+            return False
+        for name, service in self.services.items():
+            service.start()
+            logger.info("⚙️ Background service started: %s", name)
+        self.started_at = time.time()
+        return True
+
+    def stop(self):
+        for service in reversed(self.services.values()):
+            try:
+                service.stop()
+            except Exception as e:
+                logger.exception("Background service stop error: %s", e)
+        self.started_at = None
+        if self.lock:
+            self.lock.release()
+
+    def status(self):
+        return {
+            'owner': self.running,
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'services': list(self.services)
+        }
+
+background_services = BackgroundServices()
+
+def main():
+    """Dedicated runner: waits for the lock (standby), runs services until SIGTERM/SIGINT"""
+    from app import app, db
+
+    retry_seconds = app.config['BACKGROUND_LOCK_RETRY_SECONDS']
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    with app.app_context():
+        engine = db.engine
+    lock_file = app.config['BACKGROUND_LOCK_FILE']
+
+    while not stop.is_set():
+        if background_services.start(engine, lock_file):
+            logger.info("🟢 Background services running in pid %d", os.getpid())
+            break
+        logger.info("⏳ Background services owned by another process; retrying in %ss", retry_seconds)
+        stop.wait(retry_seconds)
+
+    stop.wait()
+    if background_services.running:
+        background_services.stop()
+        logger.info("🛑 Background services stopped")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# Request Batching Module
+"""
+Runs several GET sub-requests inside one HTTP request (/api/batch).
+
+Each item goes through the normal request pipeline (before/after hooks, rate
+limits, error handlers) in a nested request context. Sequential items share
+the outer application context, so the logged-in user, the Flask session and
+the DB session are loaded once. Concurrent items run on a small thread pool,
+each with its own application context (Sessions are not thread-safe) seeded
+with the caller's user and session.
+
+Every endpoint costs 1 unless its view is marked with @batch_cost(n); a batch
+whose total cost exceeds BATCH_MAX_COST is rejected before anything runs.
+JSON bodies are spliced into the combined response without re-encoding.
+"""
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from flask import current_app, g, request, session
+from flask.ctx import RequestContext
+from flask_login import current_user
+from werkzeug.exceptions import HTTPException
+from models import db
+
+class BatchError(ValueError):
+    """Invalid batch payload (reported as 400)"""
+
+def batch_cost(cost):
+    """Declare what one call to this view costs in a batch (default 1)"""
+    def decorator(func):
+        func.batch_cost = cost
+        return func
+    return decorator
+
+class BatchRunner:
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        self.max_workers = app.config['BATCH_MAX_WORKERS']
+
+    def _executor(self):
+        # Created on first use so forked workers never inherit a dead pool
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='batch')
+            return self.executor
+
+    def parse(self, payload):
+        """Validate the payload; returns [(id, path)] and the total cost"""
+        items = payload.get('requests') if isinstance(payload, dict) else None
+        if not isinstance(items, list) or not items:
+            raise BatchError('requests must be a non-empty list')
+        max_items = current_app.config['BATCH_MAX_ITEMS']
+        if len(items) > max_items:
+            raise BatchError(f'At most {max_items} requests per batch')
+
+        adapter = current_app.create_url_adapter(request)
+        parsed, total_cost = [], 0
+        for index, item in enumerate(items):
+            if isinstance(item, str):
+                item = {'path': item}
+            if not isinstance(item, dict) or not isinstance(item.get('path'), str) or not item['path'].startswith('/'):
+                raise BatchError(f'requests[{index}] needs a path starting with /')
+            if item.get('method', 'GET').upper() != 'GET':
+                raise BatchError(f'requests[{index}]: only GET requests can be batched')
+            try:
+                endpoint, _ = adapter.match(urlsplit(item['path']).path, method='GET')
+            except HTTPException:
+                endpoint = None  # dispatched anyway so the item reports the 404/405 (e.g. a nested /api/batch)
+            view = current_app.view_functions.get(endpoint)
+            total_cost += getattr(view, 'batch_cost', 1)
+            parsed.append((item.get('id', index), item['path']))
+
+        max_cost = current_app.config['BATCH_MAX_COST']
+        if total_cost > max_cost:
+            raise BatchError(f'Batch cost {total_cost} exceeds the limit of {max_cost}')
+        return parsed, total_cost
+
+    def run(self, items, concurrent=False):
+        """Dispatch the items; returns the combined JSON body as bytes"""
+        app = current_app._get_current_object()
+        outer_session = session._get_current_object()
+        environs = [_sub_environ(path) for _, path in items]
+        if concurrent and len(items) > 1:
+            user = current_user._get_current_object() if current_user.is_authenticated else None
+            futures = [self._executor().submit(_dispatch_isolated, app, environ, outer_session, user)
+                       for environ in environs]
+            results = [future.result() for future in futures]
+        else:
+            results = [_dispatch(app, environ, outer_session) for environ in environs]
+
+        parts = [
+            b'{"id":' + json.dumps(item_id).encode() + b',"status":' + str(status).encode() + b',"body":' + body + b'}'
+            for (item_id, _), (status, body) in zip(items, results)
+        ]
+        return b'{"responses":[' + b','.join(parts) + b']}'
+
+def _sub_environ(path):
+    """The outer request's environ (cookies, client address, Accept) for a GET of `path`"""
+    url = urlsplit(path)
+    environ = {key: value for key, value in request.environ.items() if not key.startswith('werkzeug.')}
+    environ.update({
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': url.path,
+        'QUERY_STRING': url.query,
+        'CONTENT_LENGTH': '0',
+        'CONTENT_TYPE': '',
+        'wsgi.input': io.BytesIO(),
+        'HTTP_X_REQUEST_ID': g.get('request_id', ''),
+        'HTTP_ACCEPT': 'application/json'  # item bodies are spliced into the JSON envelope
+    })
+    return environ
+
+def _dispatch(app, environ, outer_session):
+    """Run one sub-request through the full pipeline; returns (status, JSON body bytes)"""
+    with RequestContext(app, environ, session=outer_session):
+        try:
+            response = app.full_dispatch_request()
+        except Exception as e:
+            response = app.make_response(app.handle_exception(e))
+        body = response.get_data()  # inside the context: streamed bodies may need it
+        if not response.is_json:
+            body = json.dumps(body.decode('utf-8', 'replace')).encode()
+        return response.status_code, body
+
+def _dispatch_isolated(app, environ, outer_session, user):
+    with app.app_context():
+        if user is not None:
+            # flask-login reads the user from g; attach a copy to this thread's session
+            g._login_user = db.session.merge(user, load=False)
+        return _dispatch(app, environ, outer_session)
+
+batch_runner = BatchRunner()
@@ -0,0 +1,227 @@
+# Columnar (Parquet / Arrow IPC) Export Module
+import argparse
+import os
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from models import db, Complaint, User, Department, ComplaintCategory
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+EXPORT_FORMATS = {
+    'parquet': {'extension': 'parquet', 'mimetype': 'application/vnd.apache.parquet'},
+    'arrow': {'extension': 'arrow', 'mimetype': 'application/vnd.apache.arrow.file'}
+}
+DEFAULT_BATCH_SIZE = 10000
+
+# (column name, SQL expression, arrow type name)
+EXPORT_COLUMNS = [
+    ('id', Complaint.id, 'int64'),
+    ('complaint_id', Complaint.complaint_id, 'string'),
+    ('title', Complaint.title, 'string'),
+    ('description', Complaint.description, 'string'),
+    ('status', Complaint.status, 'category'),
+    ('priority', Complaint.priority, 'category'),
+    ('urgency_level', Complaint.urgency_level, 'int16'),
+    ('category_id', Complaint.category_id, 'int32'),
+    ('category', ComplaintCategory.name, 'category'),
+    ('department_id', Complaint.department_id, 'int32'),
+    ('department', Department.name, 'category'),
+    ('student_db_id', Complaint.student_id, 'int64'),
+    ('student_id', User.student_id, 'string'),
+    ('student_name', User.name, 'string'),
+    ('student_email', User.email, 'string'),
+    ('course', User.course_name, 'category'),
+    ('year', User.year, 'int16'),
+    ('assigned_to', Complaint.assigned_to, 'int64'),
+    ('escalated', Complaint.escalated, 'bool'),
+    ('satisfaction_rating', Complaint.satisfaction_rating, 'int16'),
+    ('created_at', Complaint.created_at, 'timestamp'),
+    ('updated_at', Complaint.updated_at, 'timestamp'),
+    ('expected_resolution_date', Complaint.expected_resolution_date, 'timestamp'),
+    ('resolved_at', Complaint.resolved_at, 'timestamp')
+]
+
+def _arrow_type(type_name):
+    if type_name == 'category':
+        # Low-cardinality strings are dictionary encoded
+        return pa.dictionary(pa.int32(), pa.string())
+    if type_name == 'timestamp':
+        return pa.timestamp('us')
+    return {
+        'string': pa.string(),
+        'int16': pa.int16(),
+        'int32': pa.int32(),
+        'int64': pa.int64(),
+        'bool': pa.bool_()
+    }[type_name]
+
+def export_schema():
+    """Arrow schema shared by Parquet and Arrow IPC exports"""
+    return pa.schema([(name, _arrow_type(type_name)) for name, _, type_name in EXPORT_COLUMNS])
+
+def build_export_query(date_from=None, date_to=None, department_id=None):
+    """Complaints joined with student, department and category as plain columns"""
+    stmt = (
+        select(*[expr.label(name) for name, expr, _ in EXPORT_COLUMNS])
+        .select_from(Complaint)
+        .join(User, Complaint.student_id == User.id)
+        .outerjoin(Department, Complaint.department_id == Department.id)
+        .outerjoin(ComplaintCategory, Complaint.category_id == ComplaintCategory.id)
+        .order_by(Complaint.id)
+    )
+    if date_from:
+        stmt = stmt.where(Complaint.created_at >= date_from)
+    if date_to:
+        stmt = stmt.where(Complaint.created_at < date_to + timedelta(days=1))  # date_to is inclusive
+    if department_id:
+        stmt = stmt.where(Complaint.department_id == department_id)
+    return stmt
+
+class _DictionaryEncoder:
+    """Dictionary-encode a string column with one dictionary that only grows.
+
+    Arrow IPC files cannot replace a dictionary between batches, so later
+    batches extend it and the writer emits dictionary deltas.
+    """
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def encode(self, values):
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            position = self.index.get(value)
+            if position is None:
+                position = self.index[value] = len(self.values)
+                self.values.append(value)
+            indices.append(position)
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=pa.int32()),
+            pa.array(self.values, type=pa.string())
+        )
+
+def iter_record_batches(session, batch_size=DEFAULT_BATCH_SIZE, **filters):
+    """Yield Arrow record batches from a server-side cursor"""
+    schema = export_schema()
+    encoders = {field.name: _DictionaryEncoder() for field in schema if pa.types.is_dictionary(field.type)}
+    result = session.execute(
+        build_export_query(**filters).execution_options(stream_results=True, yield_per=batch_size)
+    )
+    for rows in result.partitions(batch_size):
+        columns = list(zip(*rows))
+        arrays = []
+        for values, field in zip(columns, schema):
+            if field.name in encoders:
+                arrays.append(encoders[field.name].encode(values))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def _open_writer(sink, export_format, compression):
+    schema = export_schema()
+    if export_format == 'parquet':
+        return pq.ParquetWriter(sink, schema, compression=compression or 'zstd')
+    # Uncompressed Arrow IPC files can be memory-mapped without a copy
+    options = pa.ipc.IpcWriteOptions(compression=compression, emit_dictionary_deltas=True)
+    return pa.ipc.new_file(sink, schema, options=options)
+
+def _write_batch(writer, batch, export_format):
+    if export_format == 'parquet':
+        writer.write_batch(batch)
+    else:
+        writer.write(batch)
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to a generator"""
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def iter_export_chunks(session, export_format='parquet', compression=None, batch_size=DEFAULT_BATCH_SIZE, **filters):
+    """Yield the encoded export file piece by piece, one record batch at a time"""
+    sink = _ChunkSink()
+    writer = _open_writer(pa.PythonFile(sink, mode='w'), export_format, compression)
+    for batch in iter_record_batches(session, batch_size, **filters):
+        _write_batch(writer, batch, export_format)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    writer.close()
+    yield sink.drain()
+
+def write_export(path, session, export_format='parquet', compression=None, batch_size=DEFAULT_BATCH_SIZE, **filters):
+    """Write the export to a file and return the number of rows written"""
+    rows = 0
+    writer = _open_writer(path, export_format, compression)
+    try:
+        for batch in iter_record_batches(session, batch_size, **filters):
+            _write_batch(writer, batch, export_format)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+def export_filename(export_format):
+    extension = EXPORT_FORMATS[export_format]['extension']
+    return f'complaints_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+
+def main():
+    parser = argparse.ArgumentParser(description='Export complaints to Parquet or Arrow IPC')
+    parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='parquet')
+    parser.add_argument('--output', help='Output file path (default: complaints_export_<timestamp>.<ext>)')
+    parser.add_argument('--compression', help='Codec, e.g. zstd, snappy, lz4 (Parquet defaults to zstd, Arrow to none)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--date-from', help='YYYY-MM-DD')
+    parser.add_argument('--date-to', help='YYYY-MM-DD')
+    parser.add_argument('--department-id', type=int)
+    args = parser.parse_args()
+
+    if not PYARROW_AVAILABLE:
+        parser.error('pyarrow is required for columnar export (pip install pyarrow)')
+
+    output = args.output or export_filename(args.format)
+    filters = {
+        'date_from': datetime.strptime(args.date_from, '%Y-%m-%d') if args.date_from else None,
+        'date_to': datetime.strptime(args.date_to, '%Y-%m-%d') if args.date_to else None,
+        'department_id': args.department_id
+    }
+
+    from app import app
+    with app.app_context():
+        start = datetime.now()
+        rows = write_export(output, db.session, args.format, args.compression, args.batch_size, **filters)
+        elapsed = (datetime.now() - start).total_seconds()
+
+    print(f"✅ Exported {rows} complaints to {output} ({os.path.getsize(output) / 1024:.1f} KB in {elapsed:.2f}s)")
+
+if __name__ == '__main__':
+    main()
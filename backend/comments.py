@@ -0,0 +1,44 @@
+# Batched Comments Module
+"""
+Comments for many complaints at once: one IN query over the
+(complaint_id, created_at) index plus one primary-key lookup to report
+unknown complaints, instead of a request and two queries per complaint.
+With `latest`, a ROW_NUMBER() window keeps only each complaint's newest K
+comments inside the same query.
+"""
+from sqlalchemy import select, func
+from models import db, Complaint, Comment
+
+MAX_COMPLAINT_IDS = 100
+
+def parse_ids(raw):
+    """Complaint ids from a comma-separated string, deduplicated in order"""
+    try:
+        ids = [int(part) for part in raw.split(',') if part.strip()]
+    except ValueError:
+        raise ValueError('complaint_ids must be comma-separated integers')
+    if not ids:
+        raise ValueError('complaint_ids must list at least one id')
+    if len(ids) > MAX_COMPLAINT_IDS:
+        raise ValueError(f'At most {MAX_COMPLAINT_IDS} complaint ids per request')
+    return list(dict.fromkeys(ids))
+
+def comments_by_complaint(complaint_ids, latest=None):
+    """{complaint id: [comments oldest first]} for the existing complaints, plus the ids that do not exist"""
+    if latest is not None:
+        rank = func.row_number().over(
+            partition_by=Comment.complaint_id,
+            order_by=(Comment.created_at.desc(), Comment.id.desc())
+        ).label('rank')
+        ranked = select(Comment.id, rank).where(Comment.complaint_id.in_(complaint_ids)).subquery()
+        stmt = select(Comment).join(ranked, ranked.c.id == Comment.id).where(ranked.c.rank <= latest)
+    else:
+        stmt = select(Comment).where(Comment.complaint_id.in_(complaint_ids))
+    comments = db.session.scalars(stmt.order_by(Comment.complaint_id, Comment.created_at, Comment.id)).all()
+
+    existing = set(db.session.scalars(select(Complaint.id).where(Complaint.id.in_(complaint_ids))))
+    grouped = {complaint_id: [] for complaint_id in complaint_ids if complaint_id in existing}
+    for comment in comments:
+        if comment.complaint_id in grouped:  # SQLite does not enforce the foreign key
+            grouped[comment.complaint_id].append(comment)
+    return grouped, [complaint_id for complaint_id in complaint_ids if complaint_id not in existing]
@@ -0,0 +1,98 @@
+# Complaint Feed Module
+"""
+The student complaints feed (/api/all-student-complaints and
+/api/student-complaints/<student_id>), read from the database with the field
+names of data/student_complaints.csv so existing clients keep working.
+
+Records come in complaint id order. Pages are keyset based (`cursor` is the
+last id seen), and full feeds are streamed in chunks, so a request never
+loads more than one chunk of rows at a time. `admin_comments` is the latest
+comment, read through the (complaint_id, created_at) index. Missing values
+are null rather than the NaN the CSV reader produced.
+"""
+import json
+from sqlalchemy import select
+from models import Complaint, Comment, User
+from reference_data import reference_data
+
+MAX_PAGE_SIZE = 1000
+CHUNK_SIZE = 500
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+def _timestamp(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+
+def feed_query(student_id=None, cursor=None, limit=None):
+    latest_comment = (
+        select(Comment.text).where(Comment.complaint_id == Complaint.id)
+        .order_by(Comment.created_at.desc(), Comment.id.desc()).limit(1)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Complaint.id, Complaint.complaint_id, User.student_id, User.name.label('student_name'),
+               Complaint.title, Complaint.description, Complaint.category_id, Complaint.department_id,
+               Complaint.status, Complaint.priority, Complaint.urgency_level, Complaint.created_at,
+               Complaint.updated_at, Complaint.resolved_at, latest_comment.label('admin_comments'))
+        .join(User, Complaint.student_id == User.id)
+        .order_by(Complaint.id)
+    )
+    if student_id is not None:
+        stmt = stmt.where(User.student_id == student_id)
+    if cursor is not None:
+        stmt = stmt.where(Complaint.id > cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+def _record(row):
+    return {
+        'complaint_id': row.complaint_id,
+        'student_id': row.student_id,
+        'student_name': row.student_name,
+        'title': row.title,
+        'description': row.description,
+        'category': reference_data.category_name(row.category_id),
+        'department': reference_data.department_name(row.department_id),
+        'status': row.status,
+        'priority': row.priority,
+        'urgency_level': row.urgency_level,
+        'created_at': _timestamp(row.created_at),
+        'updated_at': _timestamp(row.updated_at),
+        'resolved_at': _timestamp(row.resolved_at),
+        'admin_comments': row.admin_comments
+    }
+
+def feed_page(session, limit, student_id=None, cursor=None):
+    """One page of records plus the cursor for the next page (None on the last page)"""
+    rows = session.execute(feed_query(student_id, cursor, limit + 1)).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return [_record(row) for row in rows[:limit]], next_cursor
+
+def iter_feed(session, student_id=None):
+    """Every record, fetched CHUNK_SIZE rows at a time"""
+    result = session.execute(feed_query(student_id).execution_options(yield_per=CHUNK_SIZE))
+    for row in result:
+        yield _record(row)
+
+def json_array_chunks(records):
+    """Encode records as one JSON array, yielded in chunks"""
+    yield b'['
+    buffer, separator = [], b''
+    for record in records:
+        buffer.append(separator + json.dumps(record).encode())
+        separator = b','
+        if len(buffer) >= CHUNK_SIZE:
+            yield b''.join(buffer)
+            buffer = []
+    yield b''.join(buffer) + b']'
+
+def ndjson_chunks(records):
+    """Encode records as newline-delimited JSON, yielded in chunks"""
+    buffer = []
+    for record in records:
+        buffer.append(json.dumps(record).encode() + b'\n')
+        if len(buffer) >= CHUNK_SIZE:
+            yield b''.join(buffer)
+            buffer = []
+    if buffer:
+        yield b''.join(buffer)
@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from db_pool import pool_sizing, InstrumentedQueuePool
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,14 +27,44 @@ class Config:
     SQLALCHEMY_DATABASE_URI = DATABASE_URL
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool sizing: the total connection budget is split across
+    # worker processes, and each process pools one connection per thread
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))  # Worker processes
+    WEB_THREADS = int(os.getenv('WEB_THREADS', '8'))  # Request threads per worker
+    DB_MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', '90'))  # Budget across all workers
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '20'))
+    DB_POOL_WAIT_WARN_MS = int(os.getenv('DB_POOL_WAIT_WARN_MS', '200'))  # Warn on slow checkouts
+    DB_POOL_SIZING = pool_sizing(WEB_CONCURRENCY, WEB_THREADS, DB_MAX_CONNECTIONS)
+    
+    # SQLite performance profile (ignored for PostgreSQL)
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '20000'))
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', '-65536'))  # Negative = KiB, i.e. 64 MB
+    SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
+    SQLITE_READ_POOL_SIZE = int(os.getenv('SQLITE_READ_POOL_SIZE', '8'))  # 0 disables the read-only pool
+    SQLITE_MAX_OVERFLOW = int(os.getenv('SQLITE_MAX_OVERFLOW', '2'))  # One writer: no use for a large overflow
+    SQLITE_WAL_CHECKPOINT_SECONDS = int(os.getenv('SQLITE_WAL_CHECKPOINT_SECONDS', '60'))
+    SQLITE_WAL_SIZE_LIMIT = int(os.getenv('SQLITE_WAL_SIZE_LIMIT', str(64 * 1024 * 1024)))
+
+    # Read replicas: comma-separated URLs that serve read-only endpoints
+    DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', '5'))  # Lagging replicas fall back to primary
+    REPLICA_CHECK_SECONDS = float(os.getenv('REPLICA_CHECK_SECONDS', '10'))  # Health/lag check interval
+    READ_YOUR_WRITES_SECONDS = float(os.getenv('READ_YOUR_WRITES_SECONDS', '10'))  # Writers read from primary this long
+    READ_ONLY_ENDPOINTS = [name.strip() for name in os.getenv('READ_ONLY_ENDPOINTS', '').split(',') if name.strip()]
+
     # Connection pool settings for better stability
     if 'postgresql' in DATABASE_URL:
         SQLALCHEMY_ENGINE_OPTIONS = {
-            'pool_size': 5,
+            'poolclass': InstrumentedQueuePool,
+            'pool_logging_name': 'primary',
+            'pool_size': DB_POOL_SIZING['pool_size'],
             'pool_recycle': 300,  # Recycle connections every 5 minutes
             'pool_pre_ping': True,  # Verify connections before use
-            'pool_timeout': 20,
-            'max_overflow': 10,
+            'pool_timeout': DB_POOL_TIMEOUT,
+            'max_overflow': DB_POOL_SIZING['max_overflow'],
             'connect_args': {
                 'connect_timeout': 10,
                 'application_name': 'smart_complaint_system'
@@ -42,10 +73,15 @@ class Config:
     else:
         # SQLite settings
         SQLALCHEMY_ENGINE_OPTIONS = {
+            'poolclass': InstrumentedQueuePool,
+            'pool_logging_name': 'primary',
+            'pool_size': DB_POOL_SIZING['pool_size'],
+            'pool_timeout': DB_POOL_TIMEOUT,
+            'max_overflow': min(DB_POOL_SIZING['max_overflow'], SQLITE_MAX_OVERFLOW),
             'pool_pre_ping': True,
             'connect_args': {
                 'check_same_thread': False,
-                'timeout': 20
+                'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000
             }
         }
     
@@ -69,4 +105,50 @@ class Config:
     
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'app.log')
\ No newline at end of file
+    LOG_FILE = os.getenv('LOG_FILE', 'app-{pid}.log')  # One file per process (workers must not rotate a shared file); empty disables it
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # Console format: text or json (the file is always JSON lines)
+    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))  # Rotate the file at this size
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))  # Records beyond this are dropped, never waited on
+    
+    # Background report jobs
+    REPORT_WAIT_SECONDS = int(os.getenv('REPORT_WAIT_SECONDS', '30'))  # GET waits this long before returning 202
+
+    # Admin dashboard bootstrap payload (/api/admin/dashboard)
+    DASHBOARD_RECENT_LIMIT = int(os.getenv('DASHBOARD_RECENT_LIMIT', '10'))  # Latest complaints included
+    DASHBOARD_CHECK_SECONDS = int(os.getenv('DASHBOARD_CHECK_SECONDS', '5'))  # Cross-process freshness check
+
+    # Near-duplicate detection at submit time (MinHash/LSH, same department only)
+    DUPLICATE_THRESHOLD = float(os.getenv('DUPLICATE_THRESHOLD', '0.6'))  # Estimated Jaccard similarity to link
+    DUPLICATE_WINDOW_HOURS = int(os.getenv('DUPLICATE_WINDOW_HOURS', '72'))  # Only recent complaints are compared
+
+    # Category/department suggestions (train with: python backend/suggestions.py --source db|csv)
+    SUGGESTION_MODEL_PATH = os.getenv('SUGGESTION_MODEL_PATH') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'category_suggester.npz')
+    SUGGESTION_CHECK_SECONDS = int(os.getenv('SUGGESTION_CHECK_SECONDS', '30'))  # How soon a retrained model is picked up
+
+    # SLA escalation of overdue complaints (a background service, see escalation.py)
+    SLA_CHECK_SECONDS = int(os.getenv('SLA_CHECK_SECONDS', '30'))  # Longest sleep between runs
+    SLA_BATCH_SIZE = int(os.getenv('SLA_BATCH_SIZE', '500'))  # Newly due complaints handled per transaction
+
+    # Auto-assignment of new complaints to the least loaded admin of their department
+    AUTO_ASSIGN_ENABLED = os.getenv('AUTO_ASSIGN_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    ASSIGNMENT_RECONCILE_SECONDS = int(os.getenv('ASSIGNMENT_RECONCILE_SECONDS', '60'))  # Recount workloads from the DB
+
+    # Request batching (/api/batch)
+    BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', '20'))
+    BATCH_MAX_COST = int(os.getenv('BATCH_MAX_COST', '20'))  # Sum of per-endpoint costs (default 1, see @batch_cost)
+    BATCH_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '4'))  # Threads for "concurrent": true batches
+
+    # Reference data registry (departments, courses, categories)
+    REFERENCE_DATA_CHECK_SECONDS = int(os.getenv('REFERENCE_DATA_CHECK_SECONDS', '30'))  # Cross-process version check
+
+    # New students and complaints are also appended to students.csv / student_complaints.csv here
+    CSV_MIRROR_DIR = os.getenv('CSV_MIRROR_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data'))  # Empty disables
+
+    # Startup
+    LOAD_CSV_ON_STARTUP = os.getenv('LOAD_CSV_ON_STARTUP', 'true').lower() in ('1', 'true', 'yes')  # Sync data/*.csv into the DB
+
+    # Background services (run once per deployment, see background.py)
+    BACKGROUND_LOCK_FILE = os.getenv('BACKGROUND_LOCK_FILE') or None  # SQLite only; defaults next to the DB file
+    BACKGROUND_LOCK_RETRY_SECONDS = int(os.getenv('BACKGROUND_LOCK_RETRY_SECONDS', '30'))  # Standby runner retry
@@ -0,0 +1,206 @@
+# Admin Dashboard Module
+"""
+Precomputed bootstrap payload for the admin dashboard's first screen: counts,
+the latest complaints, per-department summaries and chart series, built from
+a handful of aggregate queries and kept as serialized JSON.
+
+Commits that touch complaints or users in this process mark the payload stale
+immediately. Other processes' writes are noticed within DASHBOARD_CHECK_SECONDS
+by comparing an index-only stamp (max complaint id, max updated_at, max user
+id), which also carries the date so the daily figures roll over at midnight. While one request rebuilds a stale payload, others keep getting the
+previous one.
+"""
+import hashlib
+import itertools
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import joinedload
+from analytics import average_resolution_hours, resolution_hours_expr
+from db_routing import RoutingSession
+from models import db, Complaint, User
+from negotiation import packb
+from reference_data import reference_data
+
+STATUSES = ['Pending', 'In Progress', 'Resolved', 'Rejected']
+TREND_DAYS = 31  # today and the 30 days before it, like /api/stats' this_month window
+
+def dashboard_version(session):
+    """Index-only stamp that moves with every complaint insert/update, every new user and each new day"""
+    max_id, last_update = session.execute(select(func.max(Complaint.id), func.max(Complaint.updated_at))).one()
+    max_user = session.execute(select(func.max(User.id))).scalar()
+    return f"{datetime.utcnow().date()}:{max_id or 0}:{last_update or ''}:{max_user or 0}"
+
+def _grouped(session, *columns, where=()):
+    stmt = select(*columns, func.count(Complaint.id)).where(*where).group_by(*columns)
+    return session.execute(stmt).all()
+
+def build_dashboard(session, recent_limit=10):
+    """The first-screen payload, from aggregate queries plus one small page of complaints"""
+    now = datetime.utcnow()
+    today = now.date()
+
+    by_department = {}
+    status_counts = dict.fromkeys(STATUSES, 0)
+    for department_id, status, count in _grouped(session, Complaint.department_id, Complaint.status):
+        summary = by_department.setdefault(department_id, {
+            'id': department_id,
+            'name': reference_data.department_name(department_id) or 'Unknown',
+            'total': 0, **dict.fromkeys(STATUSES, 0)
+        })
+        summary[status] = summary.get(status, 0) + count
+        summary['total'] += count
+        status_counts[status] = status_counts.get(status, 0) + count
+
+    hours = resolution_hours_expr(session.get_bind().dialect.name)
+    for department_id, avg_hours in session.execute(
+        select(Complaint.department_id, func.avg(hours))
+        .where(Complaint.status == 'Resolved', Complaint.resolved_at.isnot(None))
+        .group_by(Complaint.department_id)
+    ).all():
+        if department_id in by_department:
+            by_department[department_id]['avg_resolution_hours'] = round(float(avg_hours or 0), 1)
+
+    # Daily series over the trend window; today/this_week/this_month are sums of its tail
+    start = datetime.combine(today - timedelta(days=TREND_DAYS - 1), datetime.min.time())
+    day = func.date(Complaint.created_at)
+    per_day = {str(d): count for d, count in _grouped(session, day, where=[Complaint.created_at >= start])}
+    days = [(today - timedelta(days=offset)).isoformat() for offset in range(TREND_DAYS - 1, -1, -1)]
+    daily = [per_day.get(d, 0) for d in days]
+
+    priorities = {priority or 'Unknown': count for priority, count in _grouped(session, Complaint.priority)}
+    categories = {
+        reference_data.category_name(category_id) or 'Unknown': count
+        for category_id, count in _grouped(session, Complaint.category_id)
+    }
+
+    recent = session.scalars(
+        select(Complaint).options(joinedload(Complaint.student))
+        .order_by(Complaint.created_at.desc(), Complaint.id.desc()).limit(recent_limit)
+    ).all()
+
+    total = sum(status_counts.values())
+    avg_hours, _ = average_resolution_hours(session)
+    students = session.execute(select(func.count(User.id)).where(User.role == 'student')).scalar()
+    return {
+        'counts': {
+            'total': total,
+            'pending': status_counts['Pending'],
+            'in_progress': status_counts['In Progress'],
+            'resolved': status_counts['Resolved'],
+            'rejected': status_counts['Rejected'],
+            'today': daily[-1],
+            'this_week': sum(daily[-8:]),
+            'this_month': sum(daily),
+            'students': students,
+            'avg_resolution_hours': round(avg_hours, 1),
+            'resolution_rate': round(status_counts['Resolved'] / total * 100, 1) if total else 0
+        },
+        'recent_complaints': [{
+            'id': c.id,
+            'complaint_id': c.complaint_id,
+            'title': c.title,
+            'description': c.description[:200],
+            'status': c.status,
+            'priority': c.priority,
+            'department': reference_data.department_name(c.department_id),
+            'category': reference_data.category_name(c.category_id),
+            'student_name': c.student.name if c.student else None,
+            'created_at': c.created_at.isoformat()
+        } for c in recent],
+        'departments': sorted(by_department.values(), key=lambda d: d['total'], reverse=True),
+        'charts': {
+            'status': {'labels': list(status_counts), 'values': list(status_counts.values())},
+            'priority': {'labels': list(priorities), 'values': list(priorities.values())},
+            'category': {'labels': list(categories), 'values': list(categories.values())},
+            'daily': {'labels': days, 'values': daily}
+        },
+        'generated_at': now.isoformat()
+    }
+
+class DashboardSnapshot:
+    def __init__(self, version, payload, body):
+        self.version = version
+        self.payload = payload
+        self.body = body
+        self.etag = hashlib.sha1(body).hexdigest()
+        self._msgpack = None
+
+    def msgpack_body(self):
+        if self._msgpack is None:
+            self._msgpack = packb(self.payload)
+        return self._msgpack
+
+class DashboardCache:
+    def __init__(self, check_seconds=5, recent_limit=10):
+        self.check_seconds = check_seconds
+        self.recent_limit = recent_limit
+        self.snapshot = None
+        self.stale = True
+        self.checked_at = 0.0
+        self.builds = 0
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        self.check_seconds = app.config['DASHBOARD_CHECK_SECONDS']
+        self.recent_limit = app.config['DASHBOARD_RECENT_LIMIT']
+        self.invalidate()
+
+    def invalidate(self):
+        self.stale = True
+
+    def current(self):
+        """The latest payload, rebuilding if this process wrote or the stored stamp moved"""
+        snapshot = self.snapshot
+        version = None
+        if snapshot is not None and not self.stale:
+            now = time.monotonic()
+            if now - self.checked_at < self.check_seconds:
+                return snapshot
+            self.checked_at = now
+            version = dashboard_version(db.session)
+            if version == snapshot.version:
+                return snapshot
+
+        # Single flight: with a previous payload to serve, nobody waits for the rebuild
+        if not self.lock.acquire(blocking=snapshot is None):
+            return snapshot
+        try:
+            if self.snapshot is snapshot:
+                self.stale = False
+                version = version or dashboard_version(db.session)
+                payload = build_dashboard(db.session, self.recent_limit)
+                self.snapshot = DashboardSnapshot(version, payload, current_app.json.dumps(payload).encode('utf-8'))
+                self.checked_at = time.monotonic()
+                self.builds += 1
+            return self.snapshot
+        finally:
+            self.lock.release()
+
+    def status(self):
+        return {
+            'version': self.snapshot.version if self.snapshot else None,
+            'builds': self.builds,
+            'stale': self.stale
+        }
+
+dashboard_cache = DashboardCache()
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _note_dashboard_change(session, flush_context):
+    # Any complaint change; only new or deleted users (logins touch last_login constantly)
+    complaints = itertools.chain(session.new, session.dirty, session.deleted)
+    users = itertools.chain(session.new, session.deleted)
+    if any(isinstance(obj, Complaint) for obj in complaints) or any(isinstance(obj, User) for obj in users):
+        session.info['dashboard_changed'] = True
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _invalidate_dashboard(session):
+    if session.info.pop('dashboard_changed', False):
+        dashboard_cache.invalidate()
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _discard_dashboard_change(session):
+    session.info.pop('dashboard_changed', None)
@@ -0,0 +1,540 @@
+# Synthetic Data Generator Module
+import argparse
+import csv
+import io
+import os
+import time
+import uuid
+from datetime import datetime
+import numpy as np
+
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_SIZE = 200000
+STUDENTS_PER_COMPLAINT = 0.05
+BULK_TABLES = ('users', 'complaints', 'comments')
+
+STATUSES = np.array(['Pending', 'In Progress', 'Resolved', 'Rejected'], dtype=object)
+PENDING, IN_PROGRESS, RESOLVED, REJECTED = range(4)
+PRIORITIES = np.array(['Low', 'Medium', 'High', 'Critical'], dtype=object)
+PRIORITY_TIME_FACTOR = np.array([1.4, 1.0, 0.75, 0.5])  # Critical work is picked up and closed sooner
+COMMENT_RATE = np.array([0.15, 1.3, 2.0, 1.0])  # Mean admin comments per complaint, by status
+WEEKDAY_WEIGHTS = np.array([1.15, 1.2, 1.1, 1.05, 0.95, 0.55, 0.45])  # Monday..Sunday
+
+FIRST_NAMES = np.array([
+    'Aarav', 'Vivaan', 'Aditya', 'Arjun', 'Sai', 'Rahul', 'Rohan', 'Karan', 'Vikram', 'Ishaan',
+    'Ananya', 'Diya', 'Priya', 'Sneha', 'Kavya', 'Aditi', 'Pooja', 'Neha', 'Riya', 'Meera'
+], dtype=object)
+LAST_NAMES = np.array([
+    'Kumar', 'Sharma', 'Singh', 'Patel', 'Gupta', 'Reddy', 'Nair', 'Iyer', 'Verma', 'Joshi',
+    'Mehta', 'Rao', 'Das', 'Chopra', 'Malhotra', 'Bose', 'Kapoor', 'Pillai', 'Agarwal', 'Mishra'
+], dtype=object)
+ISSUE_PHRASES = np.array([
+    'not working', 'needs urgent attention', 'recurring problem', 'delay in response',
+    'poor condition', 'request for repair', 'unresolved for days', 'affecting classes',
+    'safety concern', 'frequent outages', 'missing facility', 'quality issue'
+], dtype=object)
+DESCRIPTIONS = np.array([
+    'The issue has been ongoing for several days and is affecting my studies.',
+    'Multiple students in my block are facing the same problem.',
+    'I reported this earlier at the front desk but nothing has changed.',
+    'This started after the maintenance work last week.',
+    'It happens mostly in the evenings and on weekends.',
+    'Please look into this as soon as possible, it is getting worse.',
+    'The problem is intermittent but happens several times a day.',
+    'Requesting an update on when this will be fixed.'
+], dtype=object)
+LOCATIONS = np.array([
+    'Block A', 'Block B', 'Block C', 'Main Building', 'Library', 'Hostel 1', 'Hostel 2',
+    'Hostel 3', 'Cafeteria', 'Sports Complex', 'Lab Wing', 'Admin Block'
+], dtype=object)
+COMMENT_TEXTS = np.array([
+    'We have received your complaint and are looking into it.',
+    'The maintenance team has been assigned to this issue.',
+    'Could you share more details about when this happens?',
+    'A technician will visit within the next working day.',
+    'The issue has been escalated to the department head.',
+    'Work is in progress, thank you for your patience.',
+    'This has been fixed. Please let us know if it happens again.',
+    'We could not reproduce this issue; closing for now.'
+], dtype=object)
+
+class ReferenceData:
+    """Departments, courses, categories and admins the generated rows point at"""
+    def __init__(self, departments, courses, categories, admins):
+        self.department_ids = np.asarray(departments['id'], dtype=np.int64)
+        self.department_names = np.asarray(departments['name'], dtype=object)
+        self.department_codes = np.asarray(departments['code'], dtype=object)
+        self.course_ids = np.asarray(courses['id'], dtype=np.int64)
+        self.course_names = np.asarray(courses['name'], dtype=object)
+        self.course_departments = np.asarray(courses['department_id'], dtype=np.int64)
+        self.category_ids = np.asarray(categories['id'], dtype=np.int64)
+        self.category_names = np.asarray(categories['name'], dtype=object)
+        self.category_departments = np.asarray(categories['department_id'], dtype=np.int64)
+        self.category_priorities = np.asarray(categories['priority_level'], dtype=object)
+        self.category_days = np.asarray(categories['typical_resolution_days'], dtype=np.float64)
+        self.admin_ids = np.asarray(admins['id'], dtype=np.int64)
+        self.admin_names = np.asarray(admins['name'], dtype=object)
+        if not len(self.department_ids) or not len(self.category_ids):
+            raise ValueError('Departments and complaint categories must exist before generating data')
+
+    @classmethod
+    def from_engine(cls, engine):
+        from sqlalchemy import select
+        from models import Department, Course, ComplaintCategory, User
+
+        def columns(stmt):
+            with engine.connect() as conn:
+                result = conn.execute(stmt)
+                keys = list(result.keys())
+                rows = result.all()
+            return {key: [row[i] for row in rows] for i, key in enumerate(keys)}
+
+        return cls(
+            columns(select(Department.id, Department.name, Department.code).order_by(Department.id)),
+            columns(select(Course.id, Course.name, Course.department_id).order_by(Course.id)),
+            columns(select(ComplaintCategory.id, ComplaintCategory.name, ComplaintCategory.department_id,
+                           ComplaintCategory.priority_level, ComplaintCategory.typical_resolution_days)
+                    .order_by(ComplaintCategory.id)),
+            columns(select(User.id, User.name).where(User.role == 'admin').order_by(User.id))
+        )
+
+    @classmethod
+    def from_csv(cls, data_dir=None):
+        """Reference data straight from data/*.csv (for CSV-only output)"""
+        import pandas as pd
+        data_dir = data_dir or os.path.join(os.path.dirname(__file__), '..', 'data')
+        categories = pd.read_csv(os.path.join(data_dir, 'complaint_categories.csv'))
+        categories['priority_level'] = categories['priority_level'].fillna('Medium')
+        categories['typical_resolution_days'] = categories['typical_resolution_days'].fillna(7)
+        return cls(
+            pd.read_csv(os.path.join(data_dir, 'departments.csv')),
+            pd.read_csv(os.path.join(data_dir, 'courses.csv')),
+            categories,
+            {'id': [1], 'name': ['System Administrator']}
+        )
+
+def skewed_weights(rng, count, exponent=1.1):
+    """Zipf-like popularity weights in a random (seeded) order"""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return rng.permutation(weights / weights.sum())
+
+def datetime_strings(values):
+    """datetime64 array -> 'YYYY-MM-DD HH:MM:SS.ffffff' strings (None for NaT)"""
+    missing = np.isnat(values)
+    text = np.datetime_as_string(np.where(missing, np.datetime64(0, 'us'), values), unit='us')
+    # Swap the ISO 'T' separator for the space SQLAlchemy stores, in place on the code points
+    text.view(np.uint32).reshape(len(text), -1)[:, 10] = ord(' ')
+    if missing.any():
+        text = text.astype(object)
+        text[missing] = None
+    return text
+
+def _sequence(prefix, start, count, width):
+    return np.char.add(prefix, np.char.zfill(np.arange(start, start + count).astype(str), width))
+
+class SyntheticDataGenerator:
+    """Vectorized generator for students, complaints and comments.
+
+    Complaint volume is skewed across departments, categories and students,
+    arrives with weekday/time-of-day patterns plus incident bursts, and moves
+    through a Pending -> In Progress -> Resolved/Rejected lifecycle driven by
+    each category's typical resolution time.
+    """
+    def __init__(self, reference, seed=DEFAULT_SEED, days=365, end=None, burst_fraction=0.12,
+                 own_department_share=0.45):
+        self.reference = reference
+        self.rng = np.random.default_rng(seed)
+        self.end = np.datetime64((end or datetime.utcnow()).replace(microsecond=0), 'us')
+        self.days = days
+        self.start = self.end - np.timedelta64(days, 'D')
+        self.burst_fraction = burst_fraction
+        self.own_department_share = own_department_share
+
+        rng = self.rng
+        ref = reference
+        # Category popularity = department popularity x popularity within the department
+        department_weights = skewed_weights(rng, len(ref.department_ids))
+        department_index = {dept_id: i for i, dept_id in enumerate(ref.department_ids)}
+        category_weights = np.zeros(len(ref.category_ids))
+        self.categories_by_department = {}
+        for dept_id in np.unique(ref.category_departments):
+            members = np.flatnonzero(ref.category_departments == dept_id)
+            within = skewed_weights(rng, len(members), exponent=1.3)
+            self.categories_by_department[dept_id] = (members, within)
+            category_weights[members] = within * department_weights[department_index.get(dept_id, 0)]
+        self.category_weights = category_weights / category_weights.sum()
+        priority_lookup = {priority: i for i, priority in enumerate(PRIORITIES)}
+        self.category_priority_idx = np.array([priority_lookup.get(p, 1) for p in ref.category_priorities])
+        self.department_weights = department_weights
+
+        # Day-level arrival intensity: weekday pattern plus growth over the window
+        day_starts = self.start + np.arange(days) * np.timedelta64(1, 'D')
+        weekdays = (day_starts.astype('datetime64[D]').astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        intensity = WEEKDAY_WEIGHTS[weekdays] * (1 + 0.5 * np.arange(days) / max(1, days))
+        self.day_probabilities = intensity / intensity.sum()
+
+        # Incident bursts (outages, exam weeks): a category spikes for a day or two
+        bursts = max(1, days // 21)
+        self.burst_offsets = rng.uniform(0, days * 86400, bursts)
+        self.burst_categories = rng.choice(len(ref.category_ids), bursts, p=self.category_weights)
+        self.burst_weights = rng.dirichlet(np.ones(bursts))
+
+    def generate_students(self, count, first_id=1):
+        rng, ref = self.rng, self.reference
+        dept_idx = rng.choice(len(ref.department_ids), count, p=self.department_weights)
+        departments = ref.department_ids[dept_idx]
+
+        course_ids = np.full(count, None, dtype=object)
+        course_names = np.full(count, None, dtype=object)
+        for dept_id in np.unique(departments):
+            rows = np.flatnonzero(departments == dept_id)
+            members = np.flatnonzero(ref.course_departments == dept_id)
+            if len(members):
+                picked = members[rng.integers(0, len(members), len(rows))]
+                course_ids[rows] = ref.course_ids[picked].astype(object)
+                course_names[rows] = ref.course_names[picked]
+
+        year = rng.integers(1, 5, count)
+        admission_year = int(str(self.end)[:4]) - year + 1
+        first_idx = rng.integers(0, len(FIRST_NAMES), count)
+        first = FIRST_NAMES[first_idx]
+        last = LAST_NAMES[rng.integers(0, len(LAST_NAMES), count)]
+        sequence = np.arange(first_id, first_id + count).astype(str)
+        created = datetime_strings(self.start - (year * 365).astype('timedelta64[D]'))
+        unique_ids = np.frombuffer(rng.bytes(16 * count), dtype=np.uint8).reshape(count, 16)
+
+        return {
+            'id': np.arange(first_id, first_id + count),
+            'unique_id': np.array([str(uuid.UUID(bytes=row.tobytes(), version=4)) for row in unique_ids], dtype=object),
+            'student_id': np.char.add(np.char.add('SYN', ref.department_codes[dept_idx].astype(str)),
+                                      np.char.zfill(sequence, 8)),
+            'name': np.char.add(np.char.add(first.astype(str), ' '), last.astype(str)),
+            'email': np.char.add(np.char.add(np.char.lower(np.char.add(np.char.add(first.astype(str), '.'),
+                                                                       last.astype(str))), '.'),
+                                 np.char.add(sequence, '@student.college.edu')),
+            'phone': np.char.add('9', np.char.zfill(rng.integers(0, 10 ** 9, count).astype(str), 9)),
+            'role': np.full(count, 'student', dtype=object),
+            'course_id': course_ids,
+            'course_name': course_names,
+            'department_id': departments,
+            'department_name': ref.department_names[dept_idx],
+            'year': year,
+            'semester': year * 2 - rng.integers(0, 2, count),
+            'roll_number': _sequence('SYN', first_id, count, 8),
+            'admission_year': admission_year,
+            'gender': np.where(first_idx < len(FIRST_NAMES) // 2, 'Male', 'Female'),
+            'is_active': np.ones(count, dtype=bool),
+            'created_at': created,
+            'updated_at': created
+        }
+
+    def _arrival_times(self, count):
+        """Background arrivals plus incident bursts, as (offset seconds, burst category or -1)"""
+        rng = self.rng
+        in_burst = rng.random(count) < self.burst_fraction
+        offsets = np.empty(count)
+        categories = np.full(count, -1)
+
+        background = np.flatnonzero(~in_burst)
+        days = rng.choice(self.days, len(background), p=self.day_probabilities)
+        # Time of day: morning and afternoon peaks plus late-evening hostel reports
+        component = rng.choice(3, len(background), p=[0.45, 0.4, 0.15])
+        hours = rng.normal(np.array([10.5, 15.5, 21.5])[component], np.array([2.0, 2.5, 1.5])[component]) % 24
+        offsets[background] = days * 86400 + hours * 3600
+
+        burst_rows = np.flatnonzero(in_burst)
+        burst = rng.choice(len(self.burst_weights), len(burst_rows), p=self.burst_weights)
+        offsets[burst_rows] = self.burst_offsets[burst] + rng.exponential(10 * 3600, len(burst_rows))
+        categories[burst_rows] = self.burst_categories[burst]
+
+        return np.clip(offsets, 0, self.days * 86400 - 1), categories
+
+    def generate_complaints(self, count, student_ids, student_departments, student_weights, first_id=1):
+        rng, ref = self.rng, self.reference
+        offsets, category_idx = self._arrival_times(count)
+        created = self.start + (offsets * 1e6).astype('timedelta64[us]')
+
+        # Students file mostly with the popular departments, sometimes with their own
+        students = rng.choice(len(student_ids), count, p=student_weights)
+        needs_category = np.flatnonzero(category_idx < 0)
+        category_idx[needs_category] = rng.choice(len(ref.category_ids), len(needs_category), p=self.category_weights)
+        own = needs_category[rng.random(len(needs_category)) < self.own_department_share]
+        own_departments = student_departments[students[own]]
+        for dept_id in np.unique(own_departments):
+            if dept_id not in self.categories_by_department:
+                continue
+            rows = own[own_departments == dept_id]
+            members, within = self.categories_by_department[dept_id]
+            category_idx[rows] = members[rng.choice(len(members), len(rows), p=within)]
+
+        # Priority follows the category most of the time
+        priority_idx = self.category_priority_idx[category_idx]
+        noisy = rng.random(count) < 0.2
+        priority_idx[noisy] = rng.integers(0, len(PRIORITIES), noisy.sum())
+        factor = PRIORITY_TIME_FACTOR[priority_idx]
+        typical_days = ref.category_days[category_idx]
+
+        # Lifecycle: first response, then resolution (or a quicker rejection)
+        first_response_h = rng.lognormal(np.log(6 * factor), 0.9)
+        resolve_h = rng.lognormal(np.log(typical_days * 24 * 0.6 * factor), 0.7)
+        rejected = rng.random(count) < 0.08
+        resolve_h[rejected] *= 0.4
+        age_h = (self.end - created) / np.timedelta64(1, 'h')
+        # A small stale backlog stays open, and a few complaints are never picked up
+        unattended = rng.random(count) < 0.01
+        closed = (resolve_h <= age_h) & (rng.random(count) > 0.03) & ~unattended
+        started = (first_response_h <= age_h) & ~unattended
+
+        status = np.where(closed, np.where(rejected, REJECTED, RESOLVED), np.where(started, IN_PROGRESS, PENDING))
+        closed_at = created + (resolve_h * 3600e6).astype('timedelta64[us]')
+        picked_up_at = created + (first_response_h * 3600e6).astype('timedelta64[us]')
+        updated = np.where(closed, closed_at, np.where(started, picked_up_at, created))
+        resolved_at = np.where(status == RESOLVED, closed_at, np.datetime64('NaT', 'us'))
+        expected = created + (typical_days * 86400e6).astype('timedelta64[us]')
+
+        open_overdue = ~closed & (self.end > expected)
+        escalated = (open_overdue & (rng.random(count) < 0.4)) | ((priority_idx == 3) & (rng.random(count) < 0.1))
+
+        assigned = np.full(count, None, dtype=object)
+        handled = status != PENDING
+        if len(ref.admin_ids):
+            assigned[handled] = ref.admin_ids[rng.integers(0, len(ref.admin_ids), handled.sum())].astype(object)
+
+        rating = np.full(count, None, dtype=object)
+        rated = (status == RESOLVED) & (rng.random(count) < 0.6)
+        lateness = np.clip(resolve_h[rated] / (typical_days[rated] * 24) - 1, 0, 2)
+        rating[rated] = np.clip(np.rint(4.5 - 1.5 * lateness + rng.normal(0, 0.7, rated.sum())), 1, 5).astype(int)
+
+        category_names = ref.category_names[category_idx].astype(str)
+        title = np.char.add(np.char.add(category_names, ' - '),
+                            ISSUE_PHRASES[rng.integers(0, len(ISSUE_PHRASES), count)].astype(str))
+        description = np.char.add(np.char.add(LOCATIONS[rng.integers(0, len(LOCATIONS), count)].astype(str), ': '),
+                                  DESCRIPTIONS[rng.integers(0, len(DESCRIPTIONS), count)].astype(str))
+
+        return {
+            'id': np.arange(first_id, first_id + count),
+            'complaint_id': _sequence('SYN', first_id, count, 10),
+            'title': title,
+            'description': description,
+            'category_id': ref.category_ids[category_idx],
+            'department_id': ref.category_departments[category_idx],
+            'status': STATUSES[status],
+            'priority': PRIORITIES[priority_idx],
+            'student_id': student_ids[students],
+            'urgency_level': np.clip(priority_idx + 1 + rng.integers(0, 2, count), 1, 5),
+            'expected_resolution_date': datetime_strings(expected),
+            'actual_resolution_date': datetime_strings(resolved_at),
+            'satisfaction_rating': rating,
+            'assigned_to': assigned,
+            'escalated': escalated,
+            'created_at': datetime_strings(created),
+            'updated_at': datetime_strings(updated),
+            'resolved_at': datetime_strings(resolved_at),
+            '_created': created,
+            '_updated': updated,
+            '_status': status
+        }
+
+    def generate_comments(self, complaints, first_id=1):
+        rng, ref = self.rng, self.reference
+        if not len(ref.admin_ids):
+            return None
+        counts = rng.poisson(COMMENT_RATE[complaints['_status']])
+        rows = np.repeat(np.arange(len(counts)), counts)
+        total = len(rows)
+        created = complaints['_created'][rows]
+        until = np.where(complaints['_status'][rows] == PENDING, self.end, complaints['_updated'][rows])
+        span = (until - created).astype(np.int64)
+        when = created + (rng.random(total) * span).astype('timedelta64[us]')
+        admin = rng.integers(0, len(ref.admin_ids), total)
+        return {
+            'id': np.arange(first_id, first_id + total),
+            'complaint_id': complaints['id'][rows],
+            'admin_id': ref.admin_ids[admin],
+            'admin_name': ref.admin_names[admin],
+            'text': COMMENT_TEXTS[rng.integers(0, len(COMMENT_TEXTS), total)],
+            'created_at': datetime_strings(when)
+        }
+
+def _public_columns(columns):
+    return {name: values for name, values in columns.items() if not name.startswith('_')}
+
+class DatabaseSink:
+    """Bulk loader: executemany on SQLite, COPY on PostgreSQL.
+
+    With defer_indexes the non-unique indexes of the loaded tables are dropped
+    first and rebuilt once at the end (db_indexes.ensure_indexes).
+    """
+    def __init__(self, engine, defer_indexes=True):
+        self.engine = engine
+        self.postgres = engine.dialect.name == 'postgresql'
+        self.defer_indexes = defer_indexes
+        self.connection = engine.raw_connection()
+        self.dropped = []
+
+    def next_ids(self):
+        from sqlalchemy import text
+        with self.engine.connect() as conn:
+            return {table: (conn.execute(text(f"SELECT MAX(id) FROM {table}")).scalar() or 0) + 1
+                    for table in BULK_TABLES}
+
+    def begin(self):
+        if not self.defer_indexes:
+            return
+        from db_indexes import declared_indexes
+        cursor = self.connection.cursor()
+        for table, index in declared_indexes():
+            if table.name in BULK_TABLES and not index.unique:
+                cursor.execute(f"DROP INDEX IF EXISTS {index.name}")
+                self.dropped.append(index.name)
+        self.connection.commit()
+
+    def write(self, table, columns):
+        columns = _public_columns(columns)
+        names = list(columns)
+        cursor = self.connection.cursor()
+        if self.postgres:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(_rows(columns))
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table} ({', '.join(names)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        else:
+            placeholders = ', '.join('?' for _ in names)
+            cursor.executemany(f"INSERT INTO {table} ({', '.join(names)}) VALUES ({placeholders})", _rows(columns))
+        self.connection.commit()
+
+    def finish(self):
+        cursor = self.connection.cursor()
+        if self.postgres:
+            # Explicit ids were loaded, so move the serial sequences past them
+            for table in BULK_TABLES:
+                cursor.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                               f"(SELECT COALESCE(MAX(id), 1) FROM {table}))")
+        self.connection.commit()
+        self.connection.close()
+        if self.dropped:
+            from db_indexes import ensure_indexes
+            started = time.perf_counter()
+            ensure_indexes(self.engine)
+            return time.perf_counter() - started
+        return 0.0
+
+class CsvSink:
+    """Writes one CSV per table (database column layout) into a directory"""
+    def __init__(self, directory):
+        self.directory = directory
+        self.started = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def next_ids(self):
+        return {table: 1 for table in BULK_TABLES}
+
+    def begin(self):
+        pass
+
+    def write(self, table, columns):
+        columns = _public_columns(columns)
+        first = table not in self.started
+        with open(os.path.join(self.directory, f'{table}.csv'), 'w' if first else 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if first:
+                writer.writerow(list(columns))
+            writer.writerows(_rows(columns))
+        self.started.add(table)
+
+    def finish(self):
+        return 0.0
+
+def _rows(columns):
+    """Column arrays -> row tuples of plain Python values (booleans as 0/1)"""
+    return zip(*[
+        (values.astype(np.int8) if values.dtype == bool else values).tolist() for values in columns.values()
+    ])
+
+def generate_dataset(sink, reference, complaints, students=None, seed=DEFAULT_SEED, days=365,
+                     chunk_size=DEFAULT_CHUNK_SIZE, end=None, progress=None):
+    """Generate and load a full dataset; returns row counts and throughput"""
+    students = students or max(1, int(complaints * STUDENTS_PER_COMPLAINT))
+    generator = SyntheticDataGenerator(reference, seed=seed, days=days, end=end)
+    ids = sink.next_ids()
+    counts = {table: 0 for table in BULK_TABLES}
+    started = time.perf_counter()
+    sink.begin()
+
+    departments = []
+    for start in range(0, students, chunk_size):
+        batch = generator.generate_students(min(chunk_size, students - start), ids['users'] + start)
+        sink.write('users', batch)
+        departments.append(batch['department_id'])
+        counts['users'] += len(batch['id'])
+
+    student_ids = np.arange(ids['users'], ids['users'] + students)
+    student_departments = np.concatenate(departments)
+    # A few students file most complaints
+    activity = generator.rng.lognormal(0, 1.0, students)
+    student_weights = activity / activity.sum()
+
+    comment_id = ids['comments']
+    for start in range(0, complaints, chunk_size):
+        batch = generator.generate_complaints(min(chunk_size, complaints - start), student_ids,
+                                              student_departments, student_weights, ids['complaints'] + start)
+        sink.write('complaints', batch)
+        counts['complaints'] += len(batch['id'])
+        comments = generator.generate_comments(batch, comment_id)
+        if comments is not None and len(comments['id']):
+            sink.write('comments', comments)
+            counts['comments'] += len(comments['id'])
+            comment_id += len(comments['id'])
+        if progress:
+            progress(counts)
+
+    load_seconds = time.perf_counter() - started
+    index_seconds = sink.finish()
+    rows = sum(counts.values())
+    return {
+        **counts,
+        'load_seconds': round(load_seconds, 2),
+        'index_seconds': round(index_seconds, 2),
+        'rows_per_second': int(rows / load_seconds) if load_seconds else rows
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic students, complaints and comments')
+    parser.add_argument('--complaints', type=int, default=100000)
+    parser.add_argument('--students', type=int, help=f'Default: {STUDENTS_PER_COMPLAINT:g} per complaint')
+    parser.add_argument('--days', type=int, default=365, help='Spread complaints over this many days up to now')
+    parser.add_argument('--end', help='Last day of the window, YYYY-MM-DD (default: now; fix it for identical reruns)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--database-url', help='Load into this database (default: DATABASE_URL)')
+    parser.add_argument('--csv-dir', help='Write users/complaints/comments CSVs here instead of a database')
+    parser.add_argument('--keep-indexes', action='store_true', help='Do not drop indexes during the load')
+    args = parser.parse_args()
+
+    def progress(counts):
+        print(f"   {counts['complaints']} complaints, {counts['comments']} comments...")
+
+    end = datetime.strptime(args.end, '%Y-%m-%d') if args.end else None
+    options = dict(complaints=args.complaints, students=args.students, seed=args.seed, days=args.days,
+                   chunk_size=args.chunk_size, end=end, progress=progress)
+
+    if args.csv_dir:
+        stats = generate_dataset(CsvSink(args.csv_dir), ReferenceData.from_csv(), **options)
+        target = args.csv_dir
+    else:
+        if args.database_url:
+            os.environ['DATABASE_URL'] = args.database_url
+        # Importing the app creates the tables and loads departments/categories
+        from app import app
+        from models import db
+        with app.app_context():
+            sink = DatabaseSink(db.engine, defer_indexes=not args.keep_indexes)
+            stats = generate_dataset(sink, ReferenceData.from_engine(db.engine), **options)
+            target = db.engine.url.render_as_string(hide_password=True)
+
+    print(f"✅ Generated {stats['users']} students, {stats['complaints']} complaints and {stats['comments']} "
+          f"comments into {target} in {stats['load_seconds']}s ({stats['rows_per_second']} rows/s)"
+          + (f", indexes rebuilt in {stats['index_seconds']}s" if stats['index_seconds'] else ''))
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,11 @@
 import csv
+import logging
 import os
 from datetime import datetime
-from models import db, Department, Course, ComplaintCategory, User, Complaint
-from app import app
+from models import db, Department, Course, ComplaintCategory, User, Complaint, Comment
+from reference_data import reference_data
+
+logger = logging.getLogger(__name__)
 
 def load_departments():
     """Load departments from CSV file"""
@@ -26,7 +29,7 @@ def load_departments():
                 db.session.add(department)
     
     db.session.commit()
-    print("✅ Departments loaded successfully!")
+    logger.info("✅ Departments loaded successfully!")
 
 def load_courses():
     """Load courses from CSV file"""
@@ -48,7 +51,7 @@ def load_courses():
                 db.session.add(course)
     
     db.session.commit()
-    print("✅ Courses loaded successfully!")
+    logger.info("✅ Courses loaded successfully!")
 
 def load_complaint_categories():
     """Load complaint categories from CSV file"""
@@ -70,7 +73,7 @@ def load_complaint_categories():
                 db.session.add(category)
     
     db.session.commit()
-    print("✅ Complaint categories loaded successfully!")
+    logger.info("✅ Complaint categories loaded successfully!")
 
 def load_students():
     """Load students from CSV file"""
@@ -116,16 +119,19 @@ def load_students():
                 db.session.add(student)
     
     db.session.commit()
-    print("✅ Students loaded successfully!")
+    logger.info("✅ Students loaded successfully!")
 
 def load_complaints():
     """Load complaints from CSV file"""
     csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'student_complaints.csv')
     
     if not os.path.exists(csv_path):
-        print("⚠️ student_complaints.csv not found, skipping complaint loading")
+        logger.warning("⚠️ student_complaints.csv not found, skipping complaint loading")
         return
     
+    # admin_comments become a comment by the first admin, so the DB-backed feed still shows them
+    admin = User.query.filter_by(role='admin').order_by(User.id).first()
+    
     with open(csv_path, 'r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
         loaded_count = 0
@@ -145,17 +151,13 @@ def load_complaints():
             # Find student by student_id
             student = User.query.filter_by(student_id=row['student_id']).first()
             if not student:
-                print(f"⚠️ Student {row['student_id']} not found for complaint {row['complaint_id']}")
+                logger.warning("⚠️ Student %s not found for complaint %s", row['student_id'], row['complaint_id'])
                 skipped_count += 1
                 continue
             
-            # Find category by name
-            category = ComplaintCategory.query.filter_by(name=row['category']).first()
-            category_id = category.id if category else 1  # Default to first category
-            
-            # Find department by name
-            department = Department.query.filter_by(name=row['department']).first()
-            department_id = department.id if department else 1  # Default to first department
+            # Find category and department by name
+            category_id = reference_data.category_id(row['category']) or 1  # Default to first category
+            department_id = reference_data.department_id(row['department']) or 1  # Default to first department
             
             # Parse dates
             try:
@@ -194,49 +196,53 @@ def load_complaints():
             )
             
             db.session.add(complaint)
+            if admin and row.get('admin_comments'):
+                complaint.comments.append(Comment(
+                    admin_id=admin.id,
+                    admin_name=admin.name,
+                    text=row['admin_comments'][:500],
+                    created_at=updated_at or created_at
+                ))
             loaded_count += 1
     
     try:
         db.session.commit()
-        print(f"✅ Complaints loaded successfully! ({loaded_count} loaded, {skipped_count} skipped)")
+        logger.info("✅ Complaints loaded successfully! (%d loaded, %d skipped)", loaded_count, skipped_count)
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Error loading complaints: {e}")
+        logger.error("❌ Error loading complaints: %s", e)
 
 def load_all_data():
-    """Load all data from CSV files"""
-    with app.app_context():
-        try:
-            print("🚀 Loading data from CSV files...")
-            
-            # Check if CSV files exist
-            data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-            required_files = ['departments.csv', 'courses.csv', 'complaint_categories.csv', 'students.csv']
-            
-            missing_files = []
-            for file in required_files:
-                if not os.path.exists(os.path.join(data_dir, file)):
-                    missing_files.append(file)
-            
-            if missing_files:
-                print(f"⚠️ Missing CSV files: {', '.join(missing_files)}")
-                print("📝 Creating sample data files...")
-                create_sample_data()
-                return
-            
-            # Load in order due to foreign key dependencies
-            load_departments()
-            load_courses()
-            load_complaint_categories()
-            load_students()
-            load_complaints()  # Load complaints after students and categories
-            
-            print("🎉 All data loaded successfully!")
-            
-        except Exception as e:
-            print(f"❌ Error loading data: {e}")
-            print("📝 Creating minimal sample data...")
-            create_minimal_data()
+    """Load all data from CSV files (runs in the caller's app context)"""
+    try:
+        logger.info("🚀 Loading data from CSV files...")
+        
+        # Check if CSV files exist
+        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        required_files = ['departments.csv', 'courses.csv', 'complaint_categories.csv', 'students.csv']
+        
+        missing_files = []
+        for file in required_files:
+            if not os.path.exists(os.path.join(data_dir, file)):
+                missing_files.append(file)
+        
+        if missing_files:
+            logger.warning("⚠️ Missing CSV files: %s; creating sample data files", ', '.join(missing_files))
+            create_sample_data()
+            return
+        
+        # Load in order due to foreign key dependencies
+        load_departments()
+        load_courses()
+        load_complaint_categories()
+        load_students()
+        load_complaints()  # Load complaints after students and categories
+        
+        logger.info("🎉 All data loaded successfully!")
+        
+    except Exception as e:
+        logger.exception("❌ Error loading data: %s; creating minimal sample data", e)
+        create_minimal_data()
 
 def create_minimal_data():
     """Create minimal data if CSV loading fails"""
@@ -285,10 +291,10 @@ def create_minimal_data():
                 db.session.add(category)
             
             db.session.commit()
-            print("✅ Minimal data created successfully!")
+            logger.info("✅ Minimal data created successfully!")
             
     except Exception as e:
-        print(f"❌ Error creating minimal data: {e}")
+        logger.exception("❌ Error creating minimal data: %s", e)
 
 def create_sample_data():
     """Create sample CSV files if they don't exist"""
@@ -322,8 +328,10 @@ def create_sample_data():
         writer.writeheader()
         writer.writerows(departments_data)
     
-    print("✅ Sample CSV files created!")
+    logger.info("✅ Sample CSV files created!")
     create_minimal_data()
 
 if __name__ == '__main__':
-    load_all_data()
\ No newline at end of file
+    from app import create_app
+    with create_app({'LOAD_CSV_ON_STARTUP': False}).app_context():
+        load_all_data()
\ No newline at end of file
@@ -0,0 +1,79 @@
+# Index Migration Module
+import argparse
+from sqlalchemy import inspect, text
+from models import db
+
+def declared_indexes():
+    """Indexes declared on the models, in table order"""
+    for table in db.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            yield table, index
+
+def _create_statement(table, index, concurrently):
+    columns = ', '.join(column.name for column in index.columns)
+    unique = 'UNIQUE ' if index.unique else ''
+    mode = 'CONCURRENTLY ' if concurrently else ''
+    return f"CREATE {unique}INDEX {mode}IF NOT EXISTS {index.name} ON {table.name} ({columns})"
+
+def _invalid_postgres_indexes(conn):
+    """Indexes left INVALID by an interrupted concurrent build"""
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE NOT i.indisvalid"
+    )).all()
+    return {row[0] for row in rows}
+
+def ensure_indexes(engine):
+    """Create any declared index the database is missing.
+
+    create_all() only builds indexes for new tables, so existing databases are
+    migrated here. PostgreSQL builds run CONCURRENTLY (outside a transaction)
+    so complaint submissions are not blocked while the index is built.
+    Returns the names of the indexes created.
+    """
+    postgres = engine.dialect.name == 'postgresql'
+    inspector = inspect(engine)
+    created = []
+
+    with engine.connect() as conn:
+        if postgres:
+            conn = conn.execution_options(isolation_level='AUTOCOMMIT')
+            invalid = _invalid_postgres_indexes(conn)
+        else:
+            invalid = set()
+
+        for table, index in declared_indexes():
+            if not inspector.has_table(table.name):
+                continue
+            existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+            if index.name in existing and index.name not in invalid:
+                continue
+            if index.name in invalid:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"))
+            conn.execute(text(_create_statement(table, index, concurrently=postgres)))
+            created.append(index.name)
+
+        if created:
+            # Refresh planner statistics so the new indexes get used
+            for table_name in sorted({table.name for table, index in declared_indexes() if index.name in created}):
+                conn.execute(text(f"ANALYZE {table_name}"))
+            if not postgres:
+                conn.commit()
+
+    return created
+
+def main():
+    parser = argparse.ArgumentParser(description='Create missing database indexes')
+    parser.add_argument('--dry-run', action='store_true', help='Only list the declared indexes')
+    args = parser.parse_args()
+
+    from app import app
+    with app.app_context():
+        if args.dry_run:
+            for table, index in declared_indexes():
+                print(_create_statement(table, index, concurrently=db.engine.dialect.name == 'postgresql'))
+            return
+        created = ensure_indexes(db.engine)
+    print(f"✅ Created {len(created)} indexes: {', '.join(created)}" if created else "✅ All indexes present")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# Database Connection Pool Sizing and Observability Module
+import logging
+import threading
+import time
+from collections import deque
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+def pool_sizing(workers, threads, max_connections):
+    """Split a total connection budget across worker processes.
+
+    Each request thread holds at most one connection, so the steady pool is
+    sized to the thread count; whatever budget is left per process becomes
+    overflow for background jobs and bursts.
+    """
+    workers = max(1, workers)
+    per_process = max(1, max_connections // workers)
+    pool_size = max(1, min(threads, per_process))
+    return {
+        'pool_size': pool_size,
+        'max_overflow': max(0, per_process - pool_size)
+    }
+
+class PoolMetrics:
+    """Checkout wait times and timeouts recorded for one connection pool"""
+    def __init__(self, name, registry, window=1000):
+        self.name = name
+        self.registry = registry
+        self.lock = threading.Lock()
+        self.waits_ms = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_checkouts = 0
+        self.max_wait_ms = 0.0
+        self.last_warning = 0.0
+
+    def record_wait(self, pool, wait_ms):
+        threshold = self.registry.warn_wait_ms
+        with self.lock:
+            self.checkouts += 1
+            self.waits_ms.append(wait_ms)
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            if wait_ms < threshold:
+                return
+            self.slow_checkouts += 1
+            now = time.time()
+            if now - self.last_warning < self.registry.warn_interval_seconds:
+                return
+            self.last_warning = now
+        logger.warning("⚠️ Slow DB pool checkout (%s): waited %.0fms (threshold %sms) - %s",
+                       self.name, wait_ms, threshold, pool.status())
+
+    def record_timeout(self, pool):
+        with self.lock:
+            self.timeouts += 1
+        logger.error("❌ DB pool checkout timed out (%s) - %s", self.name, pool.status())
+
+    def snapshot(self, pool=None):
+        with self.lock:
+            waits = sorted(self.waits_ms)
+            stats = {
+                'name': self.name,
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'slow_checkouts': self.slow_checkouts,
+                'warn_wait_ms': self.registry.warn_wait_ms,
+                'max_wait_ms': round(self.max_wait_ms, 2),
+                'avg_wait_ms': round(sum(waits) / len(waits), 2) if waits else 0,
+                'p95_wait_ms': round(waits[int(len(waits) * 0.95) - 1], 2) if waits else 0
+            }
+
+        if isinstance(pool, QueuePool):
+            stats.update({
+                'pool_size': pool.size(),
+                'max_overflow': pool._max_overflow,
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': max(0, pool.overflow())
+            })
+        return stats
+
+class PoolMetricsRegistry:
+    """Per-pool metrics, keyed by the pool's logging name (pool_logging_name)"""
+    def __init__(self, warn_wait_ms=200, warn_interval_seconds=60):
+        self.lock = threading.Lock()
+        self.pools = {}
+        self.warn_wait_ms = warn_wait_ms
+        self.warn_interval_seconds = warn_interval_seconds
+
+    def configure(self, warn_wait_ms=None):
+        if warn_wait_ms is not None:
+            self.warn_wait_ms = warn_wait_ms
+
+    def get(self, name):
+        with self.lock:
+            if name not in self.pools:
+                self.pools[name] = PoolMetrics(name, self)
+            return self.pools[name]
+
+    def snapshot(self, engine):
+        pool = engine.pool
+        return self.get(pool.logging_name or 'default').snapshot(pool)
+
+# Global pool metrics
+pool_metrics = PoolMetricsRegistry()
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.get(self.logging_name or 'default').record_timeout(self)
+            raise
+        pool_metrics.get(self.logging_name or 'default').record_wait(self, (time.perf_counter() - start) * 1000)
+        return connection
+
+# SQLAlchemy names pool loggers after the pool class, so ours fall outside the
+# "sqlalchemy" hierarchy (WARN by default); keep its INFO chatter out of the app log
+logging.getLogger(f'{__name__}.{InstrumentedQueuePool.__name__}').setLevel(logging.WARNING)
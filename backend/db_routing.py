@@ -0,0 +1,243 @@
+# Read/Write Session Routing Module
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from flask import current_app, g, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event, select, func, text, table, column, DateTime
+from db_pool import InstrumentedQueuePool
+from sqlite_profile import is_file_sqlite, install_pragmas
+
+logger = logging.getLogger(__name__)
+
+_read_only = ContextVar('db_read_only', default=False)
+
+# Lightweight table construct for the replication watermark (avoids importing models)
+_complaints = table('complaints', column('updated_at', DateTime))
+
+class RoutingSession(Session):
+    """Session that sends SELECTs from read-only contexts to a reader engine.
+
+    Writes, flushes and anything outside a read-only context use the primary.
+    """
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and _read_only.get() and not self._flushing:
+            if clause is None or getattr(clause, 'is_select', False):
+                router = _current_router()
+                engine = router.reader_engine() if router else None
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def _current_router():
+    return current_app.extensions.get('db_routing')
+
+def replica_lag_seconds(replica_engine, primary_engine):
+    """How far a replica is behind the primary, in seconds.
+
+    PostgreSQL standbys report their replay delay directly. Other backends
+    (e.g. a second SQLite file acting as a replica) compare the newest
+    complaints.updated_at on both sides.
+    """
+    if replica_engine.dialect.name == 'postgresql':
+        with replica_engine.connect() as conn:
+            lag = conn.execute(text(
+                "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+            )).scalar()
+        return float(lag or 0)
+
+    watermark = select(func.max(_complaints.c.updated_at))
+    with replica_engine.connect() as conn:
+        replica_mark = conn.execute(watermark).scalar()
+    with primary_engine.connect() as conn:
+        primary_mark = conn.execute(watermark).scalar()
+    if primary_mark is None or (replica_mark is not None and replica_mark >= primary_mark):
+        return 0.0
+    if replica_mark is None:
+        return float('inf')
+    return (primary_mark - replica_mark).total_seconds()
+
+class ReplicaReader:
+    """A read engine with its health and replication lag state"""
+    def __init__(self, name, engine, check_lag=True, max_lag_seconds=5, check_interval_seconds=10):
+        self.name = name
+        self.engine = engine
+        self.check_lag = check_lag
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.healthy = True
+        self.lag_seconds = 0.0
+        self.last_check = 0.0
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    def available(self, primary_engine):
+        if time.time() - self.last_check >= self.check_interval_seconds:
+            self.check(primary_engine)
+        return self.healthy
+
+    def check(self, primary_engine):
+        # One thread refreshes the state; the others keep using the last result
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            if self.check_lag:
+                self.lag_seconds = replica_lag_seconds(self.engine, primary_engine)
+            else:
+                with self.engine.connect() as conn:
+                    conn.execute(text('SELECT 1'))
+            was_healthy = self.healthy
+            self.healthy = self.lag_seconds <= self.max_lag_seconds
+            self.last_error = None if self.healthy else f'Replication lag {self.lag_seconds:.1f}s'
+            if was_healthy != self.healthy:
+                logger.log(logging.INFO if self.healthy else logging.WARNING, "%s Read replica %s %s (lag %.1fs)",
+                           '✅' if self.healthy else '⚠️', self.name,
+                           'back in rotation' if self.healthy else 'lagging, using primary', self.lag_seconds)
+        except Exception as e:
+            self.mark_failed(e)
+        finally:
+            self.last_check = time.time()
+            self.lock.release()
+
+    def mark_failed(self, error):
+        if self.healthy:
+            logger.warning("⚠️ Read replica %s unavailable, using primary: %s", self.name, error)
+        self.healthy = False
+        self.last_error = str(error)
+        self.last_check = time.time()
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'healthy': self.healthy,
+            'checks_lag': self.check_lag,
+            'lag_seconds': None if self.lag_seconds == float('inf') else round(self.lag_seconds, 2),
+            'max_lag_seconds': self.max_lag_seconds,
+            'last_error': self.last_error
+        }
+
+class DatabaseRouter:
+    """Picks a healthy reader for read-only work, or None to use the primary"""
+    def __init__(self, primary_engine, read_your_writes_seconds=10):
+        self.primary_engine = primary_engine
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.readers = []
+        self.counter = itertools.count()
+
+    def add_reader(self, name, engine, **options):
+        reader = ReplicaReader(name, engine, **options)
+
+        @event.listens_for(engine, 'handle_error')
+        def take_out_of_rotation(context):
+            # Connection failures take the reader out until its next check
+            if context.is_disconnect or context.connection is None:
+                reader.mark_failed(context.original_exception)
+
+        self.readers.append(reader)
+        return reader
+
+    @property
+    def tracks_writes(self):
+        """Read-your-writes only matters when a reader can lag behind"""
+        return any(reader.check_lag for reader in self.readers)
+
+    def recently_wrote(self):
+        if not self.tracks_writes or not has_request_context():
+            return False
+        last_write = session.get('_db_last_write')
+        return last_write is not None and time.time() - last_write < self.read_your_writes_seconds
+
+    def reader_engine(self):
+        if not self.readers or self.recently_wrote():
+            return None
+        candidates = [reader for reader in self.readers if reader.available(self.primary_engine)]
+        if not candidates:
+            return None
+        return candidates[next(self.counter) % len(candidates)].engine
+
+    def status(self):
+        return [reader.to_dict() for reader in self.readers]
+
+    def dispose(self, close=True):
+        for reader in self.readers:
+            reader.engine.dispose(close=close)
+
+def create_replica_engine(url, config, name):
+    """Engine for a read replica, pooled and instrumented like the primary"""
+    options = {key: value for key, value in config['SQLALCHEMY_ENGINE_OPTIONS'].items() if key != 'connect_args'}
+    options.update(poolclass=InstrumentedQueuePool, pool_logging_name=name)
+    if url.startswith('sqlite'):
+        options['max_overflow'] = min(options.get('max_overflow', 0), config['SQLITE_MAX_OVERFLOW'])
+        connect_args = {'check_same_thread': False, 'timeout': config['SQLITE_BUSY_TIMEOUT_MS'] / 1000}
+    else:
+        connect_args = {'connect_timeout': 10, 'application_name': 'smart_complaint_system'}
+    engine = create_engine(url, connect_args=connect_args, **options)
+    if is_file_sqlite(engine):
+        install_pragmas(engine, config, read_only=True)
+    return engine
+
+def init_routing(app, primary_engine):
+    """Set up the router with configured replicas and the request hooks"""
+    router = DatabaseRouter(primary_engine, app.config['READ_YOUR_WRITES_SECONDS'])
+    for index, url in enumerate(app.config['DATABASE_REPLICA_URLS']):
+        name = f'replica-{index + 1}'
+        router.add_reader(
+            name,
+            create_replica_engine(url, app.config, name),
+            max_lag_seconds=app.config['REPLICA_MAX_LAG_SECONDS'],
+            check_interval_seconds=app.config['REPLICA_CHECK_SECONDS']
+        )
+    app.extensions['db_routing'] = router
+
+    read_only_endpoints = set(app.config['READ_ONLY_ENDPOINTS'])
+
+    @app.before_request
+    def route_read_only_endpoints():
+        # Route metadata: endpoints listed in READ_ONLY_ENDPOINTS behave like @read_only
+        # (names may be given with or without the blueprint prefix)
+        endpoint = request.endpoint or ''
+        if endpoint in read_only_endpoints or endpoint.rsplit('.', 1)[-1] in read_only_endpoints:
+            g._db_read_only_token = _read_only.set(True)
+
+    @app.teardown_request
+    def reset_read_only(exc=None):
+        token = g.pop('_db_read_only_token', None)
+        if token is not None:
+            _read_only.reset(token)
+
+    @app.after_request
+    def remember_last_write(response):
+        # Read-your-writes: this client reads from the primary for a while
+        if g.pop('_db_wrote', False) and router.tracks_writes:
+            session['_db_last_write'] = time.time()
+        return response
+
+    return router
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _record_write(db_session, flush_context):
+    if has_request_context():
+        g._db_wrote = True
+
+@contextmanager
+def reading():
+    """Route queries inside the block to a reader engine"""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+def read_only(func):
+    """Mark a view as read-only so its queries can use a reader engine"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with reading():
+            return func(*args, **kwargs)
+    wrapper.read_only = True
+    return wrapper
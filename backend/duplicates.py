@@ -0,0 +1,228 @@
+# Near-Duplicate Detection Module
+"""
+MinHash/LSH index over recent complaints, used at submit time to link
+near-identical complaints (the same outage reported a hundred times) into
+one cluster that admins can resolve in a single action.
+
+Each complaint's normalized title + description is reduced to character
+5-gram shingles and a 64-value MinHash signature. The signature is split into
+16 bands of 4; complaints sharing any band in the same department are
+candidates, so lookups touch a few buckets instead of every complaint.
+Candidates are then kept when the estimated Jaccard similarity reaches
+DUPLICATE_THRESHOLD.
+
+The index holds only the last DUPLICATE_WINDOW_HOURS of complaints. It is
+built from the database at startup and then catches up incrementally before
+every lookup, reading ids above the highest one it has seen plus any unseen ids
+in the RESCAN_IDS just below it (ids are assigned at insert but become visible
+at commit, so a lower id can show up late). That is how complaints created by
+other processes get in.
+"""
+import heapq
+import logging
+import re
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, or_
+from sqlalchemy.orm import Session
+from models import db, Complaint, ComplaintDuplicate
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+MAX_MATCHES = 10
+RESCAN_IDS = 100  # ids below the highest seen that are re-checked for late commits
+_PRIME = 4294967291  # Largest prime below 2**32, so a * hash fits in uint64
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+def normalize(text):
+    return _NON_WORD.sub(' ', (text or '').lower()).strip()
+
+def shingles(text):
+    text = normalize(text)
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+_permutations = None
+
+def _hash_functions():
+    # numpy is imported on first use so importing the app stays cheap
+    global _permutations
+    if _permutations is None:
+        import numpy as np
+        rng = np.random.default_rng(20240101)  # Fixed seed: signatures are comparable across processes
+        _permutations = (
+            np,
+            rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)[:, None],
+            rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)[:, None]
+        )
+    return _permutations
+
+def signature(title, description):
+    """MinHash signature of the complaint text, or None when there is nothing to hash"""
+    grams = shingles(f'{title} {description}')
+    if not grams:
+        return None
+    np, a, b = _hash_functions()
+    hashes = np.fromiter((zlib.crc32(gram.encode()) for gram in grams), dtype=np.uint64, count=len(grams))
+    return ((a * hashes % _PRIME + b) % _PRIME).min(axis=1)
+
+def _bands(department_id, sig):
+    return [(department_id, band, sig[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes())
+            for band in range(BANDS)]
+
+class DuplicateIndex:
+    def __init__(self, threshold=0.6, window_hours=72):
+        self.threshold = threshold
+        self.window = timedelta(hours=window_hours)
+        self.entries = {}  # complaint id -> (department id, created_at, signature)
+        self.buckets = defaultdict(set)  # (department id, band, band bytes) -> complaint ids
+        self.expiry = []  # heap of (created_at, complaint id): expiring touches only what leaves the window
+        self.max_id = 0
+        self.seen = set()  # ids read within RESCAN_IDS of max_id, indexed or not
+        self.rebuild_ms = None
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        self.threshold = app.config['DUPLICATE_THRESHOLD']
+        self.window = timedelta(hours=app.config['DUPLICATE_WINDOW_HOURS'])
+        with app.app_context():
+            self.rebuild()
+
+    def rebuild(self):
+        started = time.perf_counter()
+        with self.lock:
+            self.entries, self.buckets, self.expiry = {}, defaultdict(set), []
+            self.max_id, self.seen = 0, set()
+            self._catch_up()
+        self.rebuild_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("🔁 Duplicate index rebuilt: %d complaints in %.1f ms", len(self.entries), self.rebuild_ms)
+
+    def _add(self, complaint_id, department_id, created_at, sig):
+        self.entries[complaint_id] = (department_id, created_at, sig)
+        heapq.heappush(self.expiry, (created_at, complaint_id))
+        for key in _bands(department_id, sig):
+            self.buckets[key].add(complaint_id)
+
+    def _remove(self, complaint_id):
+        department_id, _, sig = self.entries.pop(complaint_id)
+        for key in _bands(department_id, sig):
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.discard(complaint_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def _catch_up(self):
+        """Index complaints committed since the last call and drop those outside the window"""
+        cutoff = datetime.utcnow() - self.window
+        # Private session on the primary: sees every commit and leaves the request session alone
+        with Session(db.engine) as session:
+            floor = max(0, self.max_id - RESCAN_IDS)
+            unseen = [cid for cid in session.scalars(select(Complaint.id).where(Complaint.id > floor))
+                      if cid not in self.seen]
+            if unseen:
+                late = [cid for cid in unseen if cid <= self.max_id]
+                new = Complaint.id > self.max_id
+                rows = session.execute(
+                    select(Complaint.id, Complaint.department_id, Complaint.created_at,
+                           Complaint.title, Complaint.description)
+                    .where(or_(new, Complaint.id.in_(late)) if late else new, Complaint.created_at >= cutoff)
+                ).all()
+                for row in rows:
+                    sig = signature(row.title, row.description)
+                    if sig is not None and row.id not in self.entries:
+                        self._add(row.id, row.department_id, row.created_at, sig)
+                self.max_id = max(self.max_id, *unseen)
+                floor = self.max_id - RESCAN_IDS
+                self.seen = {cid for cid in (*self.seen, *unseen) if cid > floor}
+        while self.expiry and self.expiry[0][0] < cutoff:
+            _, complaint_id = heapq.heappop(self.expiry)
+            if complaint_id in self.entries:
+                self._remove(complaint_id)
+
+    def find(self, complaint):
+        """[(complaint id, similarity)] of recent same-department near-duplicates, closest first"""
+        sig = signature(complaint.title, complaint.description)
+        if sig is None:
+            return []
+        with self.lock:
+            self._catch_up()
+            candidates = set()
+            for key in _bands(complaint.department_id, sig):
+                candidates |= self.buckets.get(key, set())
+            candidates.discard(complaint.id)
+            matches = []
+            for candidate_id in candidates:
+                similarity = float((self.entries[candidate_id][2] == sig).mean())
+                if similarity >= self.threshold:
+                    matches.append((candidate_id, round(similarity, 3)))
+        matches.sort(key=lambda match: (-match[1], -match[0]))
+        return matches[:MAX_MATCHES]
+
+    def status(self):
+        return {
+            'indexed': len(self.entries),
+            'buckets': len(self.buckets),
+            'max_id': self.max_id,
+            'rebuild_ms': self.rebuild_ms
+        }
+
+duplicate_index = DuplicateIndex()
+
+def cluster_of(complaint_id):
+    """The cluster id of a complaint, or None if it is in no cluster"""
+    membership = db.session.get(ComplaintDuplicate, complaint_id)
+    if membership is not None:
+        return membership.cluster_id
+    has_members = db.session.execute(
+        select(ComplaintDuplicate.complaint_id).where(ComplaintDuplicate.cluster_id == complaint_id).limit(1)
+    ).first()
+    return complaint_id if has_members else None
+
+def link_duplicate(complaint_id, matches):
+    """Join the closest match's cluster (or start one on it); returns the cluster id.
+
+    Only the new complaint's row is written, so concurrent submissions never
+    contend on an existing complaint's row.
+    """
+    best_id, similarity = matches[0]
+    membership = db.session.get(ComplaintDuplicate, best_id)
+    cluster_id = membership.cluster_id if membership is not None else best_id
+    db.session.add(ComplaintDuplicate(complaint_id=complaint_id, cluster_id=cluster_id, similarity=similarity))
+    return cluster_id
+
+def cluster_members(cluster_id):
+    """The cluster's first complaint followed by its duplicates, oldest first"""
+    member_ids = select(ComplaintDuplicate.complaint_id).where(ComplaintDuplicate.cluster_id == cluster_id)
+    return db.session.scalars(
+        select(Complaint).where((Complaint.id == cluster_id) | Complaint.id.in_(member_ids))
+        .order_by(Complaint.created_at, Complaint.id)
+    ).all()
+
+def open_clusters(limit=50):
+    """Clusters with at least one unresolved complaint, largest first"""
+    unresolved = Complaint.status.notin_(['Resolved', 'Rejected'])
+    rows = db.session.execute(
+        select(ComplaintDuplicate.cluster_id, func.count(), func.max(ComplaintDuplicate.created_at))
+        .join(Complaint, Complaint.id == ComplaintDuplicate.complaint_id)
+        .where(unresolved)
+        .group_by(ComplaintDuplicate.cluster_id)
+        .order_by(func.count().desc(), ComplaintDuplicate.cluster_id.desc())
+        .limit(limit)
+    ).all()
+    roots = {c.id: c for c in db.session.scalars(select(Complaint).where(Complaint.id.in_([r[0] for r in rows])))}
+    return [{
+        'cluster_id': cluster_id,
+        'title': roots[cluster_id].title if cluster_id in roots else None,
+        'department_id': roots[cluster_id].department_id if cluster_id in roots else None,
+        'open_duplicates': count,
+        'last_reported_at': last_reported.isoformat()
+    } for cluster_id, count, last_reported in rows]
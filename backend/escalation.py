@@ -0,0 +1,170 @@
+# SLA Escalation Module
+"""
+Escalates open complaints once their expected_resolution_date passes, and
+alerts the admins through the notification inbox (pushed over the socket
+channel once the batch commits).
+
+The scheduler walks the expected_resolution_date index with a watermark: each
+run reads only the complaints that came due since the previous run (keyset
+on due date and id), escalates the open ones, and advances the watermark in
+the same transaction. A run's work therefore grows with the number of newly
+overdue complaints, not with the size of the table. After a run it sleeps
+until the next open complaint falls due, or SLA_CHECK_SECONDS at most, so
+complaints created by other processes are still picked up promptly.
+
+The watermark lives in the database, so a restarted or standby runner picks
+up where the last one stopped. The first run starts from the beginning and
+escalates every open complaint that is already overdue. A complaint whose
+due date is moved back behind the watermark, or that is reopened after it
+passed, is not revisited.
+
+Runs as a background service, so only one process escalates.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import select, update, and_, or_, bindparam
+from models import db, Complaint, User, SchedulerWatermark
+from notifications import add_notifications
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ('Pending', 'In Progress')
+WATERMARK = 'sla_escalation'
+MIN_SLEEP_SECONDS = 0.5
+
+def newly_due(watermark, now, limit):
+    """Complaints due after the watermark and by `now`, in (due date, id) order"""
+    due = Complaint.expected_resolution_date
+    stmt = select(Complaint.id, Complaint.complaint_id, Complaint.title, Complaint.status, Complaint.priority,
+                  Complaint.escalated, Complaint.department_id, due).where(due <= now)
+    if watermark.position is not None:
+        stmt = stmt.where(or_(due > watermark.position,
+                              and_(due == watermark.position, Complaint.id > watermark.last_id)))
+    return stmt.order_by(due, Complaint.id).limit(limit)
+
+def next_due(now):
+    """The due date of the next open, unescalated complaint to fall due after `now`"""
+    due = Complaint.expected_resolution_date
+    return (select(due).where(due > now, Complaint.status.in_(OPEN_STATUSES), Complaint.escalated.isnot(True))
+            .order_by(due).limit(1))
+
+_complaints = Complaint.__table__
+# Guarded per row: a complaint resolved or escalated since it was read is left alone
+# (an OR of equalities, since IN lists cannot be used with executemany)
+_escalate = (
+    update(_complaints)
+    .where(_complaints.c.id == bindparam('complaint_pk'),
+           or_(*(_complaints.c.status == status for status in OPEN_STATUSES)),
+           _complaints.c.escalated.isnot(True))
+    .values(escalated=True, escalation_reason=bindparam('reason'), updated_at=bindparam('now'))
+)
+
+class SlaEscalator:
+    """Background service that escalates complaints the moment they breach their SLA"""
+
+    def __init__(self, app, check_seconds=30, batch_size=500):
+        self.app = app
+        self.check_seconds = check_seconds
+        self.batch_size = batch_size
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.next_due = None
+        self.last_run = None
+        self.escalated_total = 0
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name='sla-escalation', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run_once(self, now=None):
+        """Escalate everything that came due since the last run; returns how many were escalated"""
+        now = now or datetime.utcnow()
+        started = time.perf_counter()
+        escalated = scanned = 0
+        # A fresh app context gives this run its own session, removed (and rolled back on error) on exit
+        with self.app.app_context():
+            watermark = db.session.get(SchedulerWatermark, WATERMARK)
+            if watermark is None:
+                watermark = SchedulerWatermark(name=WATERMARK, position=None, last_id=0)
+                db.session.add(watermark)
+            while True:
+                rows = db.session.execute(newly_due(watermark, now, self.batch_size)).all()
+                breached = [row for row in rows if row.status in OPEN_STATUSES and not row.escalated]
+                alerts = self._escalate(breached, now) if breached else []
+                if rows:
+                    watermark.position, watermark.last_id = rows[-1].expected_resolution_date, rows[-1].id
+                watermark.updated_at = now
+                db.session.commit()  # escalations and the watermark move together
+                self._push(alerts)
+                escalated += len(breached)
+                scanned += len(rows)
+                if len(rows) < self.batch_size:
+                    break
+            self.next_due = db.session.execute(next_due(now)).scalar()
+        self.escalated_total += escalated
+        self.last_run = {
+            'at': now.isoformat(),
+            'scanned': scanned,
+            'escalated': escalated,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+        if escalated:
+            logger.warning("🚨 Escalated %d complaints past their expected resolution date", escalated)
+        return escalated
+
+    def _escalate(self, rows, now):
+        """Escalate `rows` and add the admins' alerts; returns [(user id, alert dict)] to push after the commit"""
+        db.session.execute(_escalate, [{
+            'complaint_pk': row.id, 'now': now,
+            'reason': f"SLA breached: not resolved by {row.expected_resolution_date:%Y-%m-%d %H:%M} UTC"
+        } for row in rows])
+        admin_ids = db.session.scalars(select(User.id).where(User.role == 'admin')).all()
+        written = add_notifications([{
+            'user_id': admin_id, 'type': 'sla_breach',
+            'title': f'SLA Breached: {row.complaint_id}',
+            'message': f'{row.title} ({row.priority} priority) was due {row.expected_resolution_date:%Y-%m-%d %H:%M} UTC',
+            'complaint_id': row.id,
+            'data': {'department_id': row.department_id, 'priority': row.priority,
+                     'expected_resolution_date': row.expected_resolution_date.isoformat()}
+        } for row in rows for admin_id in admin_ids])
+        return [(n.user_id, n.to_dict()) for n in written]  # before the commit expires them
+
+    def _push(self, alerts):
+        if not alerts:
+            return
+        from monitoring import notification_manager  # SocketIO loads here, not on import
+        for user_id, alert in alerts:
+            notification_manager.push(user_id, alert)
+
+    def _sleep_seconds(self):
+        if self.next_due is None:
+            return self.check_seconds
+        until_due = (self.next_due - datetime.utcnow()).total_seconds()
+        return min(self.check_seconds, max(MIN_SLEEP_SECONDS, until_due))
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.exception("SLA escalation error: %s", e)
+            self.stop_event.wait(self._sleep_seconds())
+
+    def status(self):
+        """Progress as stored in the database, so any process can report on the runner"""
+        watermark = db.session.get(SchedulerWatermark, WATERMARK)
+        return {
+            'running': bool(self.thread and self.thread.is_alive()),
+            'watermark': watermark.position.isoformat() if watermark and watermark.position else None,
+            'next_due': self.next_due.isoformat() if self.next_due else None,
+            'last_run': self.last_run,
+            'escalated_total': self.escalated_total
+        }
@@ -0,0 +1,65 @@
+# Gunicorn configuration for production
+"""
+    gunicorn -c backend/gunicorn.conf.py
+
+Workers and threads come from WEB_CONCURRENCY / WEB_THREADS, the same values
+config.py uses to split DB_MAX_CONNECTIONS into per-worker pools. The app is
+preloaded in the master so workers fork with the code already imported; each
+worker then drops the inherited DB connections and opens its own.
+
+Background services are not started here; run `python backend/background.py`
+as a separate process.
+
+Signals:
+    HUP         restart workers gracefully (config changes)
+    USR2, QUIT  re-exec a new master for code changes (preload keeps the old code on HUP)
+    TERM        graceful shutdown, waiting up to graceful_timeout for requests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+
+chdir = os.path.dirname(os.path.abspath(__file__))
+wsgi_app = 'app:app'
+bind = os.getenv('BIND', f"0.0.0.0:{os.getenv('PORT', '5000')}")
+
+workers = Config.WEB_CONCURRENCY
+threads = Config.WEB_THREADS
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+preload_app = True
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = 5
+
+# Recycle workers periodically; jitter keeps them from restarting together
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '2000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '200'))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+
+def when_ready(server):
+    # Connections opened while preloading (init_db, default admin) are not needed in the master
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose()
+    app.extensions['db_routing'].dispose()
+    server.log.info(f"Serving with {workers} workers x {threads} threads ({worker_class})")
+
+def post_fork(server, worker):
+    # Never share a socket with the parent: forget inherited pooled connections without closing them
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
+    app.extensions['db_routing'].dispose(close=False)
+
+def worker_exit(server, worker):
+    from app import app, db
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
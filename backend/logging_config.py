@@ -0,0 +1,190 @@
+# Logging Configuration Module
+"""
+Process-wide logging setup. Every logger feeds a bounded in-memory queue; a
+QueueListener thread does the formatting and the console/file I/O, so request
+threads never block on a slow disk or pipe. When the queue is full, records
+are dropped and counted rather than stalling the caller.
+
+Records are JSON lines carrying the request id (X-Request-ID, generated when
+the client does not send one). The file handler rotates by size; LOG_FILE may
+contain {pid} for one file per process (rotation is not safe across processes
+sharing a file).
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime, timezone
+from flask import g, has_request_context, request
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'request_id'}
+
+class RequestContextFilter(logging.Filter):
+    """Stamps the current request id (or None outside a request) on each record"""
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = g.get('request_id') if has_request_context() else None
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+            'pid': record.process,
+            'thread': record.threadName
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class TextFormatter(logging.Formatter):
+    """Human-readable console lines for development"""
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)-7s [%(request_id)s] %(name)s: %(message)s')
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never waits: a full queue drops the record"""
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.addFilter(RequestContextFilter())
+
+    def prepare(self, record):
+        # Resolve the message and traceback here (the listener may run after the
+        # arguments changed) but leave the formatting to the listener's handlers
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class LoggingState:
+    def __init__(self):
+        self.settings = None
+        self.handler = None
+        self.listener = None
+        self.lock = threading.Lock()
+
+_state = LoggingState()
+
+def _settings_from(config):
+    keys = ('LOG_LEVEL', 'LOG_FILE', 'LOG_FORMAT', 'LOG_MAX_BYTES', 'LOG_BACKUP_COUNT', 'LOG_QUEUE_SIZE')
+    return {key: config[key] for key in keys}
+
+def _build_handlers(settings):
+    console = logging.StreamHandler()
+    console.setFormatter(JsonFormatter() if settings['LOG_FORMAT'] == 'json' else TextFormatter())
+    handlers = [console]
+    if settings['LOG_FILE']:
+        path = settings['LOG_FILE'].format(pid=os.getpid())
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=settings['LOG_MAX_BYTES'], backupCount=settings['LOG_BACKUP_COUNT'],
+            encoding='utf-8', delay=True
+        )
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    return handlers
+
+def _start(after_fork=False):
+    """Install a fresh queue, handler and listener on the root logger"""
+    settings = _state.settings
+    old_handler, old_listener = _state.handler, _state.listener
+    if old_listener is not None:
+        if after_fork:
+            # The listener thread did not survive the fork and its queue may be
+            # locked; only release this process's copies of the file handles
+            for handler in old_listener.handlers:
+                handler.close()
+        else:
+            old_listener.stop()
+            for handler in old_listener.handlers:
+                handler.close()
+
+    log_queue = queue.Queue(maxsize=settings['LOG_QUEUE_SIZE'])
+    listener = logging.handlers.QueueListener(log_queue, *_build_handlers(settings), respect_handler_level=True)
+    handler = NonBlockingQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    if old_handler is not None:
+        root.removeHandler(old_handler)
+    root.addHandler(handler)
+    root.setLevel(settings['LOG_LEVEL'].upper())
+
+    _state.handler, _state.listener = handler, listener
+    listener.start()
+
+def configure_logging(config):
+    """Route all logging through the queue. Idempotent for unchanged settings."""
+    settings = _settings_from(config)
+    with _state.lock:
+        if settings == _state.settings:
+            return
+        _state.settings = settings
+        _start()
+
+def stop_logging():
+    """Flush the queue and stop the listener thread"""
+    with _state.lock:
+        if _state.listener is not None:
+            _state.listener.stop()
+            for handler in _state.listener.handlers:
+                handler.close()
+            logging.getLogger().removeHandler(_state.handler)
+        _state.settings = _state.handler = _state.listener = None
+
+def logging_status():
+    handler = _state.handler
+    return {
+        'level': _state.settings['LOG_LEVEL'] if _state.settings else None,
+        'queued': handler.queue.qsize() if handler else 0,
+        'dropped': handler.dropped if handler else 0
+    }
+
+def _restart_after_fork():
+    # gunicorn preloads the app in the master and forks workers: each worker
+    # needs its own listener thread (and {pid} file)
+    if _state.listener is not None:
+        _state.lock = threading.Lock()
+        _start(after_fork=True)
+
+os.register_at_fork(after_in_child=_restart_after_fork)
+atexit.register(stop_logging)
+
+def init_request_ids(app):
+    """Accept or generate a request id per request and echo it back in X-Request-ID"""
+    @app.before_request
+    def assign_request_id():
+        g.request_id = request.headers.get('X-Request-ID', '')[:64] or uuid.uuid4().hex
+
+    @app.after_request
+    def echo_request_id(response):
+        request_id = g.get('request_id')
+        if request_id:
+            response.headers['X-Request-ID'] = request_id
+        return response
@@ -2,8 +2,9 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from datetime import datetime
 import uuid
+from db_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class Department(db.Model):
     __tablename__ = 'departments'
@@ -85,6 +86,14 @@ class ComplaintCategory(db.Model):
             'typical_resolution_days': self.typical_resolution_days
         }
 
+class ReferenceDataVersion(db.Model):
+    """Single-row stamp bumped whenever departments, courses or categories change"""
+    __tablename__ = 'reference_data_version'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
     
@@ -202,6 +211,16 @@ class Complaint(db.Model):
     comments = db.relationship('Comment', backref='complaint', lazy=True, cascade='all, delete-orphan')
     assigned_admin = db.relationship('User', foreign_keys=[assigned_to], backref='assigned_complaints')
 
+    # Hot-path indexes (existing databases get them from db_indexes.ensure_indexes)
+    __table_args__ = (
+        db.Index('ix_complaints_student_created', 'student_id', 'created_at'),  # Per-student lists
+        db.Index('ix_complaints_status_created', 'status', 'created_at'),  # Status counts and filters
+        db.Index('ix_complaints_department_created', 'department_id', 'created_at'),  # Department grouping
+        db.Index('ix_complaints_created_at', 'created_at'),  # Date windows
+        db.Index('ix_complaints_updated_at', 'updated_at'),  # Recent activity / notifications
+        db.Index('ix_complaints_expected_resolution', 'expected_resolution_date'),  # SLA escalation scans
+    )
+
     def generate_complaint_id(self):
         year = datetime.now().year
         month = datetime.now().month
@@ -228,15 +247,16 @@ class Complaint(db.Model):
         return f"CMP{year}{month:02d}{timestamp:04d}"
 
     def to_dict(self):
+        from reference_data import reference_data  # names from the registry, no per-row lazy loads
         return {
             'id': self.id,
             'complaint_id': self.complaint_id,
             'title': self.title,
             'description': self.description,
             'category_id': self.category_id,
-            'category_name': self.complaint_category.name if self.complaint_category else None,
+            'category_name': reference_data.category_name(self.category_id),
             'department_id': self.department_id,
-            'department_name': self.department.name if self.department else None,
+            'department_name': reference_data.department_name(self.department_id),
             'status': self.status,
             'priority': self.priority,
             'student_id': self.student_id,
@@ -267,6 +287,10 @@ class Comment(db.Model):
     text = db.Column(db.String(500), nullable=False)
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_comments_complaint_created', 'complaint_id', 'created_at'),  # Per-complaint threads
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -275,4 +299,64 @@ class Comment(db.Model):
             'admin_name': self.admin_name,
             'text': self.text,
             'created_at': self.created_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+class Notification(db.Model):
+    """One entry in a user's inbox, written in the same transaction as the change it reports"""
+    __tablename__ = 'notifications'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    type = db.Column(db.String(30), nullable=False)  # 'complaint_update', 'new_complaint', 'new_comment'
+    title = db.Column(db.String(200), nullable=False)
+    message = db.Column(db.String(500), nullable=False)
+    complaint_id = db.Column(db.Integer, db.ForeignKey('complaints.id'), nullable=True)
+    data = db.Column(db.JSON)
+    read_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_notifications_user_created', 'user_id', 'created_at'),  # Latest-N per user
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'type': self.type,
+            'title': self.title,
+            'message': self.message,
+            'complaint_id': self.complaint_id,
+            'data': self.data or {},
+            'timestamp': self.created_at.isoformat(),
+            'read': self.read_at is not None
+        }
+
+
+class ComplaintDuplicate(db.Model):
+    """A complaint found to near-duplicate an earlier one. cluster_id is the id of the cluster's
+    first complaint, which has no row of its own."""
+    __tablename__ = 'complaint_duplicates'
+    
+    complaint_id = db.Column(db.Integer, db.ForeignKey('complaints.id'), primary_key=True)
+    cluster_id = db.Column(db.Integer, db.ForeignKey('complaints.id'), nullable=False, index=True)
+    similarity = db.Column(db.Float, nullable=False)  # Estimated Jaccard similarity to the closest match
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class SchedulerWatermark(db.Model):
+    """How far a scheduler has got through a time-ordered scan: the (position, last_id) key of the
+    last row it handled, so it resumes where it stopped after a restart or hand-over"""
+    __tablename__ = 'scheduler_watermarks'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    position = db.Column(db.DateTime, nullable=True)
+    last_id = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class NotificationCounter(db.Model):
+    """Unread notifications per user, kept in step with the inbox so the badge is a key lookup"""
+    __tablename__ = 'notification_counters'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    unread = db.Column(db.Integer, nullable=False, default=0)
@@ -1,5 +1,6 @@
 # Real-time Monitoring and Analytics Module
 import json
+import logging
 import time
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
@@ -8,10 +9,15 @@ from flask_socketio import SocketIO, emit, join_room, leave_room
 import threading
 import psutil
 from models import db, Complaint, User, Department
+from analytics import average_resolution_hours
+from notifications import notify, latest_notifications
+
+logger = logging.getLogger(__name__)
 
 class RealTimeMonitor:
-    def __init__(self, socketio=None):
+    def __init__(self, socketio=None, app=None):
         self.socketio = socketio
+        self.app = app  # Gives the statistics thread an app context
         self.active_users = {}
         self.complaint_stats = {
             'total': 0,
@@ -30,14 +36,26 @@ class RealTimeMonitor:
         self.recent_activities = deque(maxlen=50)
         self.alerts = deque(maxlen=100)
         
-        # Start background monitoring
+        # Monitoring threads are started as the 'realtime-monitor' background
+        # service (registered by create_app), not on import
+        self.stop_event = threading.Event()
+        self.threads = []
+    
+    def start(self):
         self.start_monitoring()
     
+    def stop(self):
+        self.stop_event.set()
+    
     def start_monitoring(self):
         """Start background monitoring threads"""
+        if any(thread.is_alive() for thread in self.threads):
+            return
+        self.stop_event.clear()
+        
         # System metrics monitoring
         def monitor_system():
-            while True:
+            while not self.stop_event.is_set():
                 try:
                     now = datetime.now()
                     
@@ -72,28 +90,30 @@ class RealTimeMonitor:
                     # Check for alerts
                     self.check_system_alerts(cpu_percent, memory_percent)
                     
-                    time.sleep(60)  # Update every minute
-                    
                 except Exception as e:
-                    print(f"System monitoring error: {e}")
-                    time.sleep(60)
+                    logger.exception("System monitoring error: %s", e)
+                self.stop_event.wait(60)  # Update every minute
         
         # Complaint statistics monitoring
         def monitor_complaints():
-            while True:
+            while not self.stop_event.is_set():
                 try:
-                    self.update_complaint_stats()
-                    time.sleep(30)  # Update every 30 seconds
+                    if self.app is not None:
+                        with self.app.app_context():
+                            self.update_complaint_stats()
+                    else:
+                        self.update_complaint_stats()
                 except Exception as e:
-                    print(f"Complaint monitoring error: {e}")
-                    time.sleep(30)
+                    logger.exception("Complaint monitoring error: %s", e)
+                self.stop_event.wait(30)  # Update every 30 seconds
         
         # Start threads
-        system_thread = threading.Thread(target=monitor_system, daemon=True)
-        complaint_thread = threading.Thread(target=monitor_complaints, daemon=True)
-        
-        system_thread.start()
-        complaint_thread.start()
+        self.threads = [
+            threading.Thread(target=monitor_system, name='monitor-system', daemon=True),
+            threading.Thread(target=monitor_complaints, name='monitor-complaints', daemon=True)
+        ]
+        for thread in self.threads:
+            thread.start()
     
     def update_complaint_stats(self):
         """Update complaint statistics"""
@@ -108,9 +128,10 @@ class RealTimeMonitor:
                 resolved = session.query(Complaint).filter_by(status='Resolved').count()
                 
                 # Today's complaints
-                today = datetime.now().date()
+                today_start = datetime.combine(datetime.now().date(), datetime.min.time())
                 today_count = session.query(Complaint).filter(
-                    db.func.date(Complaint.created_at) == today
+                    Complaint.created_at >= today_start,
+                    Complaint.created_at < today_start + timedelta(days=1)
                 ).count()
                 
                 # Department-wise stats
@@ -133,7 +154,7 @@ class RealTimeMonitor:
                     self.socketio.emit('complaint_stats', self.complaint_stats, room='admin_dashboard')
                 
         except Exception as e:
-            print(f"Error updating complaint stats: {e}")
+            logger.exception("Error updating complaint stats: %s", e)
     
     def check_system_alerts(self, cpu_percent, memory_percent):
         """Check for system alerts"""
@@ -308,22 +329,8 @@ class RealTimeMonitor:
                     db.func.count(Complaint.id)
                 ).group_by(Complaint.priority).all()
                 
-                # Resolution time analysis
-                resolved_complaints = session.query(
-                    Complaint.created_at,
-                    Complaint.resolved_at
-                ).filter(
-                    Complaint.status == 'Resolved',
-                    Complaint.resolved_at.isnot(None)
-                ).all()
-                
-                avg_resolution_time = 0
-                if resolved_complaints:
-                    total_time = sum([
-                        (complaint.resolved_at - complaint.created_at).total_seconds()
-                        for complaint in resolved_complaints
-                    ])
-                    avg_resolution_time = total_time / len(resolved_complaints) / 3600  # Convert to hours
+                # Resolution time analysis (aggregated in the database)
+                avg_resolution_time, total_resolved = average_resolution_hours(session)
                 
                 return {
                     'daily_complaints': [
@@ -334,29 +341,36 @@ class RealTimeMonitor:
                     'department_distribution': dict(dept_distribution),
                     'priority_distribution': dict(priority_distribution),
                     'avg_resolution_time_hours': round(avg_resolution_time, 2),
-                    'total_resolved': len(resolved_complaints),
+                    'total_resolved': total_resolved,
                     'period_days': days
                 }
                 
         except Exception as e:
-            print(f"Error getting analytics data: {e}")
+            logger.exception("Error getting analytics data: %s", e)
             return {}
 
 # Global monitor instance
 monitor = RealTimeMonitor()
 
 # WebSocket event handlers
-def setup_socketio_events(socketio):
-    """Setup WebSocket event handlers"""
-    monitor.socketio = socketio
+def setup_socketio_events(socketio, app=None):
+    """Setup WebSocket event handlers and let the monitor emit on `socketio`.
+
+    The monitor and the SLA escalator (which pushes through notification_manager)
+    run where the background services run; a dedicated runner reaches the
+    sockets only when SocketIO is given a message_queue.
+    """
+    monitor.socketio = notification_manager.socketio = socketio
+    if app is not None:
+        monitor.app = app
     
     @socketio.on('connect')
     def handle_connect():
-        print(f'Client connected: {request.sid}')
+        logger.debug('Client connected: %s', request.sid)
     
     @socketio.on('disconnect')
     def handle_disconnect():
-        print(f'Client disconnected: {request.sid}')
+        logger.debug('Client disconnected: %s', request.sid)
     
     @socketio.on('join_admin_dashboard')
     def handle_join_admin(data):
@@ -401,24 +415,20 @@ def setup_socketio_events(socketio):
 
 # Notification system
 class NotificationManager:
+    """Pushes inbox notifications over WebSocket; storage lives in notifications.py"""
     def __init__(self, socketio=None):
         self.socketio = socketio
-        self.notification_queue = deque(maxlen=1000)
     
     def send_notification(self, user_id, notification_type, title, message, data=None):
-        """Send notification to specific user"""
-        notification = {
-            'id': f"{int(time.time())}_{user_id}",
-            'type': notification_type,
-            'title': title,
-            'message': message,
-            'data': data or {},
-            'timestamp': datetime.now().isoformat(),
-            'read': False
-        }
-        
-        self.notification_queue.append(notification)
-        
+        """Add a notification for one user to the current transaction and push it to their room;
+        the caller commits"""
+        notification, = notify([user_id], notification_type, title, message, data=data)
+        notification = notification.to_dict()
+        self.push(user_id, notification)
+        return notification
+    
+    def push(self, user_id, notification):
+        """Push a stored notification (its to_dict()) to the user's room"""
         if self.socketio:
             self.socketio.emit('notification', notification, room=f"student_{user_id}")
     
@@ -436,12 +446,8 @@ class NotificationManager:
             self.socketio.emit('broadcast_notification', notification, room=room)
     
     def get_user_notifications(self, user_id, limit=20):
-        """Get notifications for specific user"""
-        user_notifications = [
-            notif for notif in self.notification_queue
-            if str(user_id) in notif['id']
-        ]
-        return user_notifications[-limit:]
+        """Get notifications for specific user, newest first"""
+        return [n.to_dict() for n in latest_notifications(user_id, limit)]
 
 # Global notification manager
 notification_manager = NotificationManager()
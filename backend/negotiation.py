@@ -0,0 +1,78 @@
+# Response Encoding Module
+"""
+Content negotiation for API responses. The app's JSON provider is
+NegotiatingJSONProvider, so every jsonify() response answers
+`Accept: application/msgpack` with MessagePack when the msgpack package is
+installed. JSON stays the default, including for `*/*`.
+
+Datetimes are packed as the standard timestamp extension (type -1, UTC)
+rather than ISO strings. `?layout=columnar` turns lists of records, at the
+top level or one level down, into one array per field ("struct of arrays")
+so repeated keys are sent once; it applies to both encodings.
+"""
+import decimal
+import uuid
+from datetime import date, datetime, timezone
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+def wants_msgpack():
+    """Whether the current request prefers MessagePack over JSON (and it can be produced)"""
+    if not MSGPACK_AVAILABLE or not has_request_context():
+        return False
+    return request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE
+
+def wants_columnar():
+    return has_request_context() and request.args.get('layout') == 'columnar'
+
+def _is_records(value):
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+def _to_columns(records):
+    fields = dict.fromkeys(key for record in records for key in record)
+    return {field: [record.get(field) for record in records] for field in fields}
+
+def columnar(obj):
+    """Lists of records (the payload itself or a value of a top-level dict) as {field: [values]}"""
+    if _is_records(obj):
+        return _to_columns(obj)
+    if isinstance(obj, dict):
+        return {key: _to_columns(value) if _is_records(value) else value for key, value in obj.items()}
+    return obj
+
+def _msgpack_default(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)  # naive datetimes are UTC throughout the app
+        return msgpack.Timestamp.from_datetime(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+def packb(obj):
+    return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+
+class NegotiatingJSONProvider(DefaultJSONProvider):
+    """jsonify() that honours Accept: application/msgpack and ?layout=columnar"""
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if wants_columnar():
+            obj = columnar(obj)
+        if wants_msgpack():
+            response = self._app.response_class(packb(obj), mimetype=MSGPACK_MIMETYPE)
+        else:
+            response = super().response(obj)
+        if has_request_context():
+            response.vary.add('Accept')
+        return response
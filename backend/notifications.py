@@ -0,0 +1,100 @@
+# Notification Inbox Module
+"""
+Persisted per-user notifications. Producers add rows inside the transaction
+that makes the change, so a rolled-back update never notifies anyone.
+
+The latest page comes from the (user_id, created_at) index and the unread
+badge from notification_counters, which every insert and mark-read adjusts
+in the same transaction.
+"""
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import select, insert, update
+from models import db, User, Notification, NotificationCounter
+
+MAX_PAGE_SIZE = 100
+
+def _upsert_counters(deltas):
+    """Add each user's delta to their unread counter, creating missing rows"""
+    table = NotificationCounter.__table__
+    rows = [{'user_id': user_id, 'unread': delta} for user_id, delta in sorted(deltas.items())]
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table).values(rows)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={'unread': table.c.unread + stmt.excluded.unread}
+        ))
+        return
+    for row in rows:
+        changed = db.session.execute(
+            table.update().where(table.c.user_id == row['user_id']).values(unread=table.c.unread + row['unread'])
+        ).rowcount
+        if not changed:
+            db.session.execute(table.insert().values(row))
+
+def add_notifications(rows):
+    """Insert notification rows (user_id, type, title, message, complaint_id, data) in the
+    current transaction and bump the recipients' unread counters; the caller commits.
+    Returns the Notification objects written, in the order of `rows`."""
+    rows = [row for row in rows if row.get('user_id') is not None]
+    if not rows:
+        return []
+    now = datetime.utcnow()
+    params = [{
+        'complaint_id': None, 'data': None, **row, 'message': row['message'][:500], 'created_at': now
+    } for row in rows]
+    if db.session.get_bind().dialect.insert_executemany_returning:
+        written = db.session.scalars(
+            insert(Notification).returning(Notification, sort_by_parameter_order=True), params
+        ).all()
+    else:
+        written = [Notification(**row) for row in params]
+        db.session.add_all(written)
+        db.session.flush()
+    _upsert_counters(Counter(row['user_id'] for row in rows))
+    return written
+
+def notify(user_ids, notification_type, title, message, complaint_id=None, data=None):
+    """The same notification for each of `user_ids`; returns the rows written"""
+    return add_notifications([{
+        'user_id': user_id, 'type': notification_type, 'title': title, 'message': message,
+        'complaint_id': complaint_id, 'data': data
+    } for user_id in user_ids])
+
+def notify_admins(notification_type, title, message, complaint_id=None, data=None):
+    admin_ids = db.session.scalars(select(User.id).where(User.role == 'admin')).all()
+    notify(admin_ids, notification_type, title, message, complaint_id=complaint_id, data=data)
+
+def latest_notifications_query(user_id, limit=20):
+    """Newest notifications first, from the (user_id, created_at) index"""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    return (select(Notification).where(Notification.user_id == user_id)
+            .order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit))
+
+def latest_notifications(user_id, limit=20):
+    return db.session.scalars(latest_notifications_query(user_id, limit)).all()
+
+def unread_count(user_id):
+    counter = db.session.get(NotificationCounter, user_id)
+    return counter.unread if counter else 0
+
+def mark_read(user_id, ids=None):
+    """Mark the given (or all) unread notifications read; returns how many changed"""
+    stmt = update(Notification).where(Notification.user_id == user_id, Notification.read_at.is_(None))
+    if ids is not None:
+        stmt = stmt.where(Notification.id.in_(ids))
+    changed = db.session.execute(
+        stmt.values(read_at=datetime.utcnow()).execution_options(synchronize_session=False)
+    ).rowcount
+    if changed:
+        # Only rows this statement flipped count, so concurrent mark-reads never double-decrement
+        db.session.execute(
+            update(NotificationCounter).where(NotificationCounter.user_id == user_id)
+            .values(unread=NotificationCounter.unread - changed).execution_options(synchronize_session=False)
+        )
+    return changed
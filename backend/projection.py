@@ -0,0 +1,159 @@
+# Sparse Fieldsets Module
+"""
+`?fields=a,b,c` support for list endpoints.
+
+A projection maps every output field of a model's to_dict() to the columns it
+reads, how to render them and the outer join it needs (student and admin
+names). Only the requested columns and joins are selected, so trimmed rows are
+never loaded in full first. `id` is always included; without `fields` the
+endpoints keep returning to_dict().
+
+MessagePack responses always go through the projection (every field when
+`fields` is absent) and keep timestamps as datetimes, which the encoder packs
+as timestamp extensions instead of ISO strings.
+"""
+from flask import request
+from sqlalchemy import Select
+from sqlalchemy.orm import aliased
+from models import db, User, Complaint, Comment, Notification
+from negotiation import wants_msgpack
+from reference_data import reference_data
+
+class FieldsError(ValueError):
+    """Unknown field requested (reported as 400)"""
+
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+class Field:
+    """One output field: the columns it reads, how to render them, an optional outer join"""
+    def __init__(self, columns, render=None, join=None, timestamp=False):
+        self.columns = tuple(columns)
+        self.raw = lambda row: row[self.columns[0].key]
+        self.render = render or self.raw
+        self.join = join
+        self.timestamp = timestamp
+
+def _column(attr):
+    return Field([attr])
+
+def _timestamp(attr):
+    return Field([attr], lambda row: _iso(row[attr.key]), timestamp=True)
+
+def _lookup(attr, lookup):
+    return Field([attr], lambda row: lookup(row[attr.key]))
+
+def _joined(join, attr, key):
+    return Field([attr.label(key)], join=join)
+
+class Projection:
+    def __init__(self, fields):
+        self.fields = fields
+
+    def parse(self, raw):
+        """Field names for a comma-separated `fields` value (None when absent or blank)"""
+        if raw is None or not raw.strip():
+            return None
+        wanted = {name.strip() for name in raw.split(',') if name.strip()}
+        unknown = sorted(wanted - self.fields.keys())
+        if unknown:
+            raise FieldsError(f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(self.fields)}")
+        wanted.add('id')
+        return [name for name in self.fields if name in wanted]
+
+    def requested(self):
+        """Field names from the current request's ?fields= (all of them for MessagePack), or None"""
+        names = self.parse(request.args.get('fields'))
+        if names is None and wants_msgpack():
+            names = list(self.fields)
+        return names
+
+    def rows(self, query, names):
+        """Run `query` (a Query or select(), filters and ordering kept) reading only what `names` need"""
+        columns, joins = {}, []
+        for name in names:
+            field = self.fields[name]
+            for column in field.columns:
+                columns.setdefault(column.key, column)
+            if field.join is not None and all(field.join is not join for join in joins):
+                joins.append(field.join)
+
+        if isinstance(query, Select):
+            query = query.with_only_columns(*columns.values())
+        else:
+            query = query.with_entities(*columns.values())
+        for target, onclause in joins:
+            query = query.outerjoin(target, onclause)
+        result = db.session.execute(query) if isinstance(query, Select) else query
+        native = wants_msgpack()
+        renders = []
+        for name in names:
+            field = self.fields[name]
+            renders.append((name, field.raw if native and field.timestamp else field.render))
+        return [{name: render(row._mapping) for name, render in renders} for row in result]
+
+_student = aliased(User, name='student')
+_admin = aliased(User, name='assigned_admin')
+_STUDENT_JOIN = (_student, Complaint.student_id == _student.id)
+_ADMIN_JOIN = (_admin, Complaint.assigned_to == _admin.id)
+
+# Field order and rendering mirror Complaint.to_dict()
+complaint_projection = Projection({
+    'id': _column(Complaint.id),
+    'complaint_id': _column(Complaint.complaint_id),
+    'title': _column(Complaint.title),
+    'description': _column(Complaint.description),
+    'category_id': _column(Complaint.category_id),
+    'category_name': _lookup(Complaint.category_id, reference_data.category_name),
+    'department_id': _column(Complaint.department_id),
+    'department_name': _lookup(Complaint.department_id, reference_data.department_name),
+    'status': _column(Complaint.status),
+    'priority': _column(Complaint.priority),
+    'student_id': _column(Complaint.student_id),
+    'student_name': _joined(_STUDENT_JOIN, _student.name, 'student_name'),
+    'student_unique_id': _joined(_STUDENT_JOIN, _student.student_id, 'student_unique_id'),
+    'urgency_level': _column(Complaint.urgency_level),
+    'expected_resolution_date': _timestamp(Complaint.expected_resolution_date),
+    'actual_resolution_date': _timestamp(Complaint.actual_resolution_date),
+    'satisfaction_rating': _column(Complaint.satisfaction_rating),
+    'feedback': _column(Complaint.feedback),
+    'assigned_to': _column(Complaint.assigned_to),
+    'assigned_admin_name': _joined(_ADMIN_JOIN, _admin.name, 'assigned_admin_name'),
+    'escalated': _column(Complaint.escalated),
+    'escalation_reason': _column(Complaint.escalation_reason),
+    'created_at': _timestamp(Complaint.created_at),
+    'updated_at': _timestamp(Complaint.updated_at),
+    'resolved_at': _timestamp(Complaint.resolved_at)
+})
+
+_USER_TIMESTAMPS = ('date_of_birth', 'last_login', 'created_at', 'updated_at')
+
+# Field order mirrors User.to_dict()
+user_projection = Projection({
+    name: _timestamp(getattr(User, name)) if name in _USER_TIMESTAMPS else _column(getattr(User, name))
+    for name in ('id', 'unique_id', 'student_id', 'name', 'email', 'phone', 'role', 'course_id',
+                 'course_name', 'department_id', 'department_name', 'year', 'semester', 'roll_number',
+                 'admission_year', 'address', 'parent_name', 'parent_phone', 'hostel_room', 'blood_group',
+                 'date_of_birth', 'gender', 'category', 'designation', 'is_active', 'last_login',
+                 'created_at', 'updated_at')
+})
+
+comment_projection = Projection({
+    'id': _column(Comment.id),
+    'complaint_id': _column(Comment.complaint_id),
+    'admin_id': _column(Comment.admin_id),
+    'admin_name': _column(Comment.admin_name),
+    'text': _column(Comment.text),
+    'created_at': _timestamp(Comment.created_at)
+})
+
+notification_projection = Projection({
+    'id': _column(Notification.id),
+    'type': _column(Notification.type),
+    'title': _column(Notification.title),
+    'message': _column(Notification.message),
+    'complaint_id': _column(Notification.complaint_id),
+    'data': Field([Notification.data], lambda row: row['data'] or {}),
+    'timestamp': _timestamp(Notification.created_at),
+    'read': Field([Notification.read_at], lambda row: row['read_at'] is not None)
+})
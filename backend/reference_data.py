@@ -0,0 +1,176 @@
+# Reference Data Registry Module
+"""
+Process-wide cache of the small, rarely changing lookup tables (departments,
+courses, complaint categories). Loaded once, served as dicts with O(1) id and
+name lookups plus pre-serialized JSON lists.
+
+Writes to those tables bump a version row in the same transaction; the
+writing process invalidates immediately, other processes notice the new
+version within REFERENCE_DATA_CHECK_SECONDS.
+"""
+import itertools
+import threading
+import time
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, joinedload
+from db_routing import RoutingSession
+from models import db, Department, Course, ComplaintCategory, ReferenceDataVersion
+
+REFERENCE_MODELS = (Department, Course, ComplaintCategory)
+_version_table = ReferenceDataVersion.__table__
+
+def _stored_version(conn):
+    return conn.execute(select(_version_table.c.version).where(_version_table.c.id == 1)).scalar()
+
+class ReferenceSnapshot:
+    """Immutable view of the reference tables at one version"""
+    def __init__(self, version, departments, courses, categories):
+        self.version = version
+        self.departments = {d['id']: d for d in departments}
+        self.courses = {c['id']: c for c in courses}
+        self.categories = {c['id']: c for c in categories}
+        # Name lookups keep the lowest id when names repeat, like filter_by(name=...).first()
+        self.department_ids = {}
+        for department in departments:
+            self.department_ids.setdefault(department['name'], department['id'])
+            self.department_ids.setdefault(department['code'], department['id'])
+        self.course_ids = {}
+        for course in courses:
+            self.course_ids.setdefault(course['code'], course['id'])
+            self.course_ids.setdefault(course['name'], course['id'])
+        self.category_ids = {}
+        for category in categories:
+            self.category_ids.setdefault(category['name'], category['id'])
+        self.serialized = {}
+
+    def json(self, kind, department_id=None):
+        """Pre-serialized JSON list of 'departments', 'courses' or 'categories'"""
+        key = (kind, department_id)
+        body = self.serialized.get(key)
+        if body is None:
+            items = list({'departments': self.departments, 'courses': self.courses,
+                          'categories': self.categories}[kind].values())
+            if department_id is not None:
+                items = [item for item in items if item.get('department_id') == department_id]
+            body = self.serialized[key] = current_app.json.dumps(items).encode('utf-8')
+        return body
+
+class ReferenceDataRegistry:
+    def __init__(self, check_seconds=30):
+        self.check_seconds = check_seconds
+        self.snapshot = None
+        self.stale = True
+        self.checked_at = 0.0
+        self.loads = 0
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        self.check_seconds = app.config['REFERENCE_DATA_CHECK_SECONDS']
+        with app.app_context(), db.engine.begin() as conn:
+            if _stored_version(conn) is None:
+                conn.execute(_version_table.insert().values(id=1, version=0, updated_at=datetime.utcnow()))
+        self.invalidate()
+
+    def invalidate(self):
+        self.stale = True
+
+    def current(self):
+        """The latest snapshot, reloading if this process wrote or the stored version moved"""
+        snapshot = self.snapshot
+        if snapshot is not None and not self.stale:
+            now = time.monotonic()
+            if now - self.checked_at < self.check_seconds:
+                return snapshot
+            self.checked_at = now
+            with db.engine.connect() as conn:
+                if _stored_version(conn) == snapshot.version:
+                    return snapshot
+
+        with self.lock:
+            if self.snapshot is snapshot:
+                self.stale = False
+                self.snapshot = self._load()
+                self.checked_at = time.monotonic()
+                self.loads += 1
+            return self.snapshot
+
+    def _load(self):
+        # Private session on the primary: never touches the request session's state
+        with Session(db.engine) as session:
+            version = _stored_version(session.connection())
+            departments = [d.to_dict() for d in session.scalars(select(Department).order_by(Department.id))]
+            courses = [c.to_dict() for c in session.scalars(
+                select(Course).options(joinedload(Course.department)).order_by(Course.id))]
+            categories = [c.to_dict() for c in session.scalars(
+                select(ComplaintCategory).options(joinedload(ComplaintCategory.department))
+                .order_by(ComplaintCategory.id))]
+        return ReferenceSnapshot(version, departments, courses, categories)
+
+    # Lookups
+    def department(self, department_id):
+        return self.current().departments.get(_as_id(department_id))
+
+    def course(self, course_id):
+        return self.current().courses.get(_as_id(course_id))
+
+    def category(self, category_id):
+        return self.current().categories.get(_as_id(category_id))
+
+    def department_name(self, department_id):
+        department = self.department(department_id)
+        return department['name'] if department else None
+
+    def category_name(self, category_id):
+        category = self.category(category_id)
+        return category['name'] if category else None
+
+    def department_id(self, name_or_code):
+        return self.current().department_ids.get(name_or_code)
+
+    def course_id(self, code_or_name):
+        return self.current().course_ids.get(code_or_name)
+
+    def category_id(self, name):
+        return self.current().category_ids.get(name)
+
+    def json(self, kind, department_id=None):
+        return self.current().json(kind, department_id)
+
+    def status(self):
+        snapshot = self.snapshot
+        return {
+            'version': snapshot.version if snapshot else None,
+            'loads': self.loads,
+            'departments': len(snapshot.departments) if snapshot else 0,
+            'courses': len(snapshot.courses) if snapshot else 0,
+            'categories': len(snapshot.categories) if snapshot else 0
+        }
+
+def _as_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+reference_data = ReferenceDataRegistry()
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _bump_reference_version(session, flush_context):
+    changed = itertools.chain(session.new, session.dirty, session.deleted)
+    if any(isinstance(obj, REFERENCE_MODELS) for obj in changed):
+        session.connection().execute(
+            _version_table.update().where(_version_table.c.id == 1)
+            .values(version=_version_table.c.version + 1, updated_at=datetime.utcnow())
+        )
+        session.info['reference_data_changed'] = True
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _invalidate_after_commit(session):
+    if session.info.pop('reference_data_changed', False):
+        reference_data.invalidate()
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop('reference_data_changed', None)
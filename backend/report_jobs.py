@@ -0,0 +1,183 @@
+# Background Report Generation Module
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from models import db, Complaint, Department, ComplaintCategory
+from analytics import average_resolution_hours
+from db_routing import reading
+
+logger = logging.getLogger(__name__)
+
+def data_version(session):
+    """Cheap stamp that changes whenever complaints are added, updated or deleted"""
+    count, max_id, last_update = session.execute(
+        select(func.count(Complaint.id), func.max(Complaint.id), func.max(Complaint.updated_at))
+    ).one()
+    return f"{count}:{max_id or 0}:{last_update or ''}"
+
+def _breakdown(session, label_column, join_model=None):
+    stmt = select(label_column, func.count(Complaint.id)).select_from(Complaint)
+    if join_model is not None:
+        stmt = stmt.join(join_model)
+    return {label or 'Unknown': count for label, count in session.execute(stmt.group_by(label_column)).all()}
+
+def build_summary_report(session, progress=None):
+    """Complaint summary built from aggregate queries (no per-row lookups)"""
+    steps = [
+        ('status_breakdown', lambda: _breakdown(session, Complaint.status)),
+        ('priority_breakdown', lambda: _breakdown(session, Complaint.priority)),
+        ('department_breakdown', lambda: _breakdown(session, Department.name, Department)),
+        ('category_breakdown', lambda: _breakdown(session, ComplaintCategory.name, ComplaintCategory)),
+        ('monthly_trend', lambda: _monthly_trend(session)),
+        ('resolution', lambda: _resolution_summary(session))
+    ]
+
+    report = {}
+    for index, (key, step) in enumerate(steps):
+        report[key] = step()
+        if progress:
+            progress(int((index + 1) / len(steps) * 100))
+
+    report['total_complaints'] = sum(report['status_breakdown'].values())
+    report['generated_at'] = datetime.utcnow().isoformat()
+    return report
+
+def _monthly_trend(session):
+    if session.get_bind().dialect.name == 'postgresql':
+        month = func.to_char(Complaint.created_at, 'YYYY-MM')
+    else:
+        month = func.strftime('%Y-%m', Complaint.created_at)
+    rows = session.execute(
+        select(month, func.count(Complaint.id)).group_by(month).order_by(month)
+    ).all()
+    return [{'month': m, 'count': count} for m, count in rows]
+
+def _resolution_summary(session):
+    avg_hours, resolved = average_resolution_hours(session)
+    escalated = session.execute(
+        select(func.count(Complaint.id)).where(Complaint.escalated.is_(True))
+    ).scalar()
+    return {
+        'resolved': resolved,
+        'avg_resolution_hours': round(avg_hours, 1),
+        'escalated': escalated
+    }
+
+REPORT_BUILDERS = {
+    'summary': build_summary_report
+}
+
+class ReportJobManager:
+    """Runs report builds on a small thread pool and caches results by data version.
+
+    Concurrent requests for the same report and data version share one job.
+    Versions are read through the read routing, and each build runs on one
+    engine and is cached under the version that engine reported, so a lagging
+    replica never files an old report under a newer version.
+    """
+    def __init__(self, max_workers=2, max_jobs=200):
+        self.app = None
+        self.max_jobs = max_jobs
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report-job')
+        self.lock = threading.Lock()
+        self.jobs = OrderedDict()   # job_id -> job
+        self.in_flight = {}         # (report_type, version) -> job_id
+        self.cache = {}             # report_type -> (version, report)
+
+    def init_app(self, app):
+        self.app = app
+
+    def submit(self, report_type='summary'):
+        """Start (or join) a report job for the current data version"""
+        if report_type not in REPORT_BUILDERS:
+            raise ValueError(f'Unknown report type: {report_type}')
+
+        with reading():
+            version = data_version(db.session)
+        key = (report_type, version)
+
+        with self.lock:
+            if key in self.in_flight:
+                return self.jobs[self.in_flight[key]]
+
+            job = self._new_job(report_type, version)
+            cached = self.cache.get(report_type)
+            if cached and cached[0] == version:
+                job.update(status='completed', progress=100, cached=True, result=cached[1],
+                           finished_at=datetime.utcnow().isoformat())
+                job['done'].set()
+                return job
+
+            self.in_flight[key] = job['id']
+
+        self.executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def wait(self, job, timeout=None):
+        job['done'].wait(timeout)
+        return job
+
+    def _new_job(self, report_type, version):
+        job = {
+            'id': uuid.uuid4().hex,
+            'report_type': report_type,
+            'data_version': version,
+            'status': 'queued',
+            'progress': 0,
+            'cached': False,
+            'created_at': datetime.utcnow().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None,
+            'done': threading.Event()
+        }
+        self.jobs[job['id']] = job
+        while len(self.jobs) > self.max_jobs:
+            self.jobs.popitem(last=False)
+        return job
+
+    def _run(self, job):
+        job['status'] = 'running'
+        job['started_at'] = datetime.utcnow().isoformat()
+
+        def progress(percent):
+            job['progress'] = percent
+
+        with self.app.app_context():
+            try:
+                # One engine for the version and every query of the build (readers are picked per query)
+                router = self.app.extensions.get('db_routing')
+                engine = (router.reader_engine() if router else None) or db.engine
+                with Session(engine) as session:
+                    version = data_version(session)
+                    report = REPORT_BUILDERS[job['report_type']](session, progress)
+                report['data_version'] = version
+                with self.lock:
+                    self.cache[job['report_type']] = (version, report)
+                job.update(status='completed', progress=100, result=report)
+            except Exception as e:
+                logger.exception("Report job %s failed: %s", job['id'], e)
+                job.update(status='failed', error=str(e))
+            finally:
+                job['finished_at'] = datetime.utcnow().isoformat()
+                with self.lock:
+                    self.in_flight.pop((job['report_type'], job['data_version']), None)
+                job['done'].set()
+
+def job_to_dict(job, include_result=True):
+    data = {key: value for key, value in job.items() if key not in ('done', 'result')}
+    if include_result and job['status'] == 'completed':
+        data['report'] = job['result']
+    return data
+
+# Global report job manager
+report_manager = ReportJobManager()
@@ -1,4 +1,7 @@
+import argparse
 import os
+import time
+from collections import defaultdict
 from dotenv import load_dotenv
 import subprocess
 import sys
@@ -11,7 +14,8 @@ print(f"DATABASE_URL: {os.getenv('DATABASE_URL')[:50]}...")
 print(f"SECRET_KEY: {os.getenv('SECRET_KEY')}")
 
 # Import and run the app after loading env vars
-from app import app
+from models import db
+from background import background_services
 
 
 def maybe_run_docker_check():
@@ -30,7 +34,39 @@ def maybe_run_docker_check():
         print("Docker pre-check failed. Aborting server start.")
         sys.exit(res.returncode)
 
+def print_startup_profile(limit=15):
+    """Import time per top-level package (python -X importtime) and the create_app() phases"""
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            cwd=backend_dir, capture_output=True, text=True)
+    packages = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        packages[name.split('.')[0]] += int(self_us)
+
+    total_ms = sum(packages.values()) / 1000
+    print(f"⏱️ import app: {total_ms:.1f} ms (self time by package, top {limit})")
+    for package, micros in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:limit]:
+        print(f"   {package:<28} {micros / 1000:8.1f} ms")
+
+    from app import create_app
+    start = time.perf_counter()
+    app = create_app()
+    print(f"⏱️ create_app(): {(time.perf_counter() - start) * 1000:.1f} ms")
+    for phase, ms in app.extensions['startup_timings'].items():
+        print(f"   {phase:<28} {ms:8.1f} ms")
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the Smart Complaint System development server')
+    parser.add_argument('--startup-profile', action='store_true',
+                        help='Print an import/startup time breakdown and exit')
+    args = parser.parse_args()
+    if args.startup_profile:
+        print_startup_profile()
+        sys.exit(0)
+
     try:
         print("\n🚀 Starting Smart Complaint System Backend...")
         print("="*60)
@@ -61,6 +97,15 @@ if __name__ == '__main__':
         print("="*60)
         print("🟢 Server starting...")
         
+        from app import create_app
+        app = create_app()
+        
+        # Single-process development server: run the background services here
+        # unless a dedicated runner (background.py) already owns them
+        with app.app_context():
+            if not background_services.start(db.engine, app.config['BACKGROUND_LOCK_FILE']):
+                print("⚙️ Background services are running in another process")
+        
         # Start the Flask app
         app.run(
             host='0.0.0.0',
@@ -72,6 +117,7 @@ if __name__ == '__main__':
         
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
+        background_services.stop()
     except Exception as e:
         print(f"\n❌ Server error: {e}")
         print("💡 Check your database connection and environment variables")
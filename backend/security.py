@@ -65,7 +65,8 @@ VALIDATION_RULES = {
         'title': {'required': True, 'min_length': 5, 'max_length': 200},
         'description': {'required': True, 'min_length': 10, 'max_length': 2000},
         'category_id': {'required': True, 'type': 'int'},
-        'department_id': {'required': True, 'type': 'int'}
+        'department_id': {'required': True, 'type': 'int'},
+        'urgency_level': {'type': 'int', 'min': 1, 'max': 5}
     }
 }
 
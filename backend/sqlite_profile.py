@@ -0,0 +1,119 @@
+# SQLite Performance Profile Module
+import logging
+import os
+import threading
+import time
+from sqlalchemy import create_engine, event
+from db_pool import InstrumentedQueuePool
+
+logger = logging.getLogger(__name__)
+
+def is_file_sqlite(engine):
+    return engine.dialect.name == 'sqlite' and engine.url.database not in (None, '', ':memory:')
+
+def pragma_statements(config, read_only=False):
+    """Connect-time PRAGMAs for the writer or for read-only connections"""
+    statements = [
+        f"PRAGMA busy_timeout = {int(config['SQLITE_BUSY_TIMEOUT_MS'])}",
+        f"PRAGMA cache_size = {int(config['SQLITE_CACHE_SIZE'])}",
+        f"PRAGMA mmap_size = {int(config['SQLITE_MMAP_SIZE'])}",
+        f"PRAGMA temp_store = {config['SQLITE_TEMP_STORE']}"
+    ]
+    if read_only:
+        statements.append("PRAGMA query_only = ON")
+    else:
+        # journal_mode is persistent in the database file; set it from the writer only
+        statements.extend([
+            f"PRAGMA journal_mode = {config['SQLITE_JOURNAL_MODE']}",
+            f"PRAGMA synchronous = {config['SQLITE_SYNCHRONOUS']}",
+            f"PRAGMA journal_size_limit = {int(config['SQLITE_WAL_SIZE_LIMIT'])}"
+        ])
+    return statements
+
+def install_pragmas(engine, config, read_only=False):
+    """Run the pragma profile on every new DBAPI connection of an engine"""
+    statements = pragma_statements(config, read_only)
+
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+def create_read_engine(write_engine, config):
+    """Separate read-only connection pool on the same database file.
+
+    In WAL mode readers see the last committed snapshot and never block (or
+    get blocked by) the single writer.
+    """
+    path = os.path.abspath(write_engine.url.database)
+    engine = create_engine(
+        f"sqlite:///file:{path}?mode=ro&uri=true",
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name='sqlite-reader',
+        pool_size=config['SQLITE_READ_POOL_SIZE'],
+        max_overflow=0,
+        pool_timeout=config['DB_POOL_TIMEOUT'],
+        pool_pre_ping=True,
+        connect_args={
+            'check_same_thread': False,
+            'timeout': config['SQLITE_BUSY_TIMEOUT_MS'] / 1000
+        }
+    )
+    install_pragmas(engine, config, read_only=True)
+    return engine
+
+class WalCheckpointer:
+    """Periodically checkpoints the WAL so it does not grow without bound.
+
+    A PASSIVE checkpoint runs every interval; once the WAL file grows past the
+    size limit a TRUNCATE checkpoint resets it to zero bytes.
+    """
+    def __init__(self, engine, interval_seconds=60, size_limit=64 * 1024 * 1024):
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self.size_limit = size_limit
+        self.wal_path = os.path.abspath(engine.url.database) + '-wal'
+        self.stop_event = threading.Event()
+        self.last_result = None
+        self.thread = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name='sqlite-wal-checkpoint', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def wal_size(self):
+        try:
+            return os.path.getsize(self.wal_path)
+        except OSError:
+            return 0
+
+    def checkpoint(self):
+        mode = 'TRUNCATE' if self.wal_size() > self.size_limit else 'PASSIVE'
+        with self.engine.connect() as conn:
+            busy, wal_frames, checkpointed = conn.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})").one()
+        self.last_result = {
+            'mode': mode,
+            'busy': bool(busy),
+            'wal_frames': wal_frames,
+            'checkpointed_frames': checkpointed,
+            'wal_size_bytes': self.wal_size(),
+            'timestamp': time.time()
+        }
+        return self.last_result
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval_seconds):
+            try:
+                self.checkpoint()
+            except Exception as e:
+                logger.exception("WAL checkpoint error: %s", e)
@@ -0,0 +1,374 @@
+# Category Suggestion Module
+"""
+Suggests a complaint category and department for a draft title and
+description, so students file complaints where they will be handled.
+
+Text is turned into hashed word and word-bigram features weighted by TF-IDF,
+and two linear (multinomial logistic) classifiers score them: one over
+category names, one over department names. Names rather than ids are learnt
+so a model trained on data/student_complaints.csv, or on another database,
+still maps onto this database's ComplaintCategory and Department rows.
+Only features seen in training keep weights, which keeps the model small.
+Inference for a whole batch is a handful of NumPy operations.
+
+Training runs offline (`python backend/suggestions.py --source db|csv`) and
+writes the model atomically to SUGGESTION_MODEL_PATH. Running processes
+notice the new file within SUGGESTION_CHECK_SECONDS, or at once through
+POST /api/admin/suggestions/reload, and swap it in without a restart.
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+N_FEATURES = 2 ** 20
+HEADS = ('category', 'department')
+DEFAULT_EPOCHS = 8
+BATCH_SIZE = 256
+LEARNING_RATE = 0.5
+L2 = 1e-6
+HOLDOUT = 0.1  # Share of samples kept aside to report accuracy, when there are at least MIN_HOLDOUT_SAMPLES
+MIN_HOLDOUT_SAMPLES = 200
+DEFAULT_SEED = 7
+MAX_BATCH_ITEMS = 500
+_WORD = re.compile(r'[a-z0-9]+')
+
+def _features(text):
+    """Hashed word unigram and bigram counts"""
+    words = _WORD.findall((text or '').lower())
+    terms = words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+    return Counter(zlib.crc32(term.encode()) & (N_FEATURES - 1) for term in terms)
+
+def complaint_text(title, description):
+    return f'{title or ""} {description or ""}'
+
+class SuggestionModel:
+    """Vocabulary, IDF weights and one linear head per label kind; read-only once built"""
+
+    def __init__(self, vocab, idf, heads, meta):
+        self.vocab = vocab  # sorted hashed feature ids seen in training
+        self.idf = idf
+        self.heads = heads  # kind -> (class names, weights [features x classes], bias)
+        self.meta = meta
+
+    def _matrix(self, counters, np):
+        """Sparse TF-IDF rows as (row, column, value) arrays, rows ascending, each row L2-normalized"""
+        if not len(self.vocab):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        lengths = [len(c) for c in counters]
+        rows = np.repeat(np.arange(len(counters)), lengths)
+        hashes = np.fromiter((h for c in counters for h in c), dtype=np.int64, count=sum(lengths))
+        counts = np.fromiter((n for c in counters for n in c.values()), dtype=np.float32, count=sum(lengths))
+        columns = np.minimum(np.searchsorted(self.vocab, hashes), len(self.vocab) - 1)
+        known = self.vocab[columns] == hashes
+        rows, columns, counts = rows[known], columns[known], counts[known]
+        values = (1 + np.log(counts)) * self.idf[columns]
+        norms = np.sqrt(np.bincount(rows, values * values, minlength=len(counters)))
+        return rows, columns, (values / norms[rows]).astype(np.float32)
+
+    def probabilities(self, texts):
+        """{kind: [len(texts) x classes] softmax probabilities}"""
+        import numpy as np
+        rows, columns, values = self._matrix([_features(text) for text in texts], np)
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]]) if len(rows) else rows
+        result = {}
+        for kind, (classes, weights, bias) in self.heads.items():
+            scores = np.tile(bias, (len(texts), 1))
+            if len(rows):
+                scores[rows[starts]] += np.add.reduceat(weights[columns] * values[:, None], starts, axis=0)
+            result[kind] = _softmax(scores, np)
+        return result
+
+    def save(self, path):
+        """Write to a temporary file and rename it into place, so readers never see a partial model"""
+        import numpy as np
+        arrays = {'vocab': self.vocab, 'idf': self.idf, 'meta': np.array(json.dumps(self.meta))}
+        for kind, (classes, weights, bias) in self.heads.items():
+            arrays.update({f'{kind}_classes': classes, f'{kind}_weights': weights, f'{kind}_bias': bias})
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = os.path.join(directory, f'.{os.path.basename(path)}.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+        with np.load(path, allow_pickle=False) as data:
+            heads = {kind: (data[f'{kind}_classes'], data[f'{kind}_weights'], data[f'{kind}_bias'])
+                     for kind in HEADS if f'{kind}_classes' in data}
+            return cls(data['vocab'], data['idf'], heads, json.loads(str(data['meta'])))
+
+def _softmax(scores, np):
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp = np.exp(scores)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+def _train_head(columns, values, doc_starts, doc_ends, labels, n_vocab, epochs, rng, np):
+    """Multinomial logistic regression by minibatch Adagrad over the documents' sparse rows"""
+    classes, y = np.unique(labels, return_inverse=True)
+    weights = np.zeros((n_vocab, len(classes)), dtype=np.float32)
+    bias = np.zeros(len(classes), dtype=np.float32)
+    weight_sq = np.full_like(weights, 1e-8)
+    bias_sq = np.full_like(bias, 1e-8)
+    for _ in range(epochs):
+        order = rng.permutation(len(y))
+        for start in range(0, len(order), BATCH_SIZE):
+            docs = order[start:start + BATCH_SIZE]
+            # Gather the batch's nonzeros, renumbering its documents 0..len(docs)-1
+            spans = [np.arange(doc_starts[d], doc_ends[d]) for d in docs]
+            index = np.concatenate(spans)
+            batch_rows = np.repeat(np.arange(len(docs)), [len(span) for span in spans])
+            batch_columns, batch_values = columns[index], values[index]
+
+            scores = np.tile(bias, (len(docs), 1))
+            contributions = weights[batch_columns] * batch_values[:, None]
+            np.add.at(scores, batch_rows, contributions)
+            error = _softmax(scores, np)
+            error[np.arange(len(docs)), y[docs]] -= 1
+            error /= len(docs)
+
+            touched, inverse = np.unique(batch_columns, return_inverse=True)
+            gradient = np.zeros((len(touched), len(classes)), dtype=np.float32)
+            np.add.at(gradient, inverse, error[batch_rows] * batch_values[:, None])
+            gradient += L2 * weights[touched]
+            weight_sq[touched] += gradient * gradient
+            weights[touched] -= LEARNING_RATE * gradient / np.sqrt(weight_sq[touched])
+            bias_gradient = error.sum(axis=0)
+            bias_sq += bias_gradient * bias_gradient
+            bias -= LEARNING_RATE * bias_gradient / np.sqrt(bias_sq)
+    return classes, weights, bias
+
+def train(samples, epochs=DEFAULT_EPOCHS, seed=DEFAULT_SEED, source=None):
+    """Train a model from (text, category name, department name) samples.
+
+    A missing label leaves the sample out of that head only; a head with no
+    labelled samples is left out of the model.
+    """
+    import numpy as np
+    samples = [s for s in samples if s[1] or s[2]]
+    if not samples:
+        raise ValueError('No labelled complaints to train on')
+    rng = np.random.default_rng(seed)
+    holdout = []
+    if len(samples) >= MIN_HOLDOUT_SAMPLES:
+        order = rng.permutation(len(samples))
+        cut = int(len(samples) * HOLDOUT)
+        holdout = [samples[i] for i in order[:cut]]
+        samples = [samples[i] for i in order[cut:]]
+
+    counters = [_features(text) for text, _, _ in samples]
+    vocab, document_frequency = np.unique(
+        np.fromiter((h for c in counters for h in c), dtype=np.int64), return_counts=True)
+    idf = (np.log((1 + len(samples)) / (1 + document_frequency)) + 1).astype(np.float32)
+    model = SuggestionModel(vocab, idf, {}, {})
+    rows, columns, values = model._matrix(counters, np)
+    doc_starts = np.searchsorted(rows, np.arange(len(samples)))
+    doc_ends = np.r_[doc_starts[1:], len(rows)]
+
+    for position, kind in enumerate(HEADS):
+        labelled = np.array([i for i, sample in enumerate(samples) if sample[position + 1]], dtype=np.int64)
+        if len(labelled):
+            labels = np.array([samples[i][position + 1] for i in labelled])
+            model.heads[kind] = _train_head(columns, values, doc_starts[labelled], doc_ends[labelled], labels,
+                                            len(vocab), epochs, rng, np)
+
+    model.meta = {
+        'trained_at': datetime.utcnow().isoformat(),
+        'source': source,
+        'samples': len(samples),
+        'features': int(len(vocab)),
+        'epochs': epochs,
+        'accuracy': evaluate(model, holdout) if holdout else None
+    }
+    return model
+
+def evaluate(model, samples):
+    """Top-1 and top-3 accuracy per head on (text, category name, department name) samples"""
+    import numpy as np
+    probabilities = model.probabilities([text for text, _, _ in samples])
+    accuracy = {}
+    for position, kind in enumerate(HEADS):
+        labelled = [i for i, sample in enumerate(samples) if sample[position + 1]]
+        if kind not in model.heads or not labelled:
+            continue
+        classes = model.heads[kind][0]
+        top = np.argsort(-probabilities[kind][labelled], axis=1)[:, :3]
+        truth = np.array([samples[i][position + 1] for i in labelled])
+        hits = classes[top] == truth[:, None]
+        accuracy[kind] = {'top1': round(float(hits[:, 0].mean()), 3), 'top3': round(float(hits.any(axis=1).mean()), 3)}
+    return accuracy
+
+def samples_from_csv(path, categories_path=None):
+    """(text, category, department) from a student_complaints.csv style file.
+
+    Categories that are not rows of complaint_categories.csv (looked for next to
+    the file) are dropped, since suggestions can only point at real categories.
+    """
+    categories_path = categories_path or os.path.join(os.path.dirname(path), 'complaint_categories.csv')
+    known = None
+    if os.path.exists(categories_path):
+        with open(categories_path, 'r', encoding='utf-8') as file:
+            known = {row['name'] for row in csv.DictReader(file)}
+    with open(path, 'r', encoding='utf-8') as file:
+        return [(complaint_text(row.get('title'), row.get('description')),
+                 row.get('category') if known is None or row.get('category') in known else None,
+                 row.get('department'))
+                for row in csv.DictReader(file)]
+
+def samples_from_db(session):
+    """(text, category name, department name) for every complaint, fetched in chunks"""
+    from sqlalchemy import select
+    from models import Complaint, ComplaintCategory, Department
+    result = session.execute(
+        select(Complaint.title, Complaint.description, ComplaintCategory.name, Department.name)
+        .join(ComplaintCategory, Complaint.category_id == ComplaintCategory.id)
+        .join(Department, Complaint.department_id == Department.id)
+        .execution_options(yield_per=5000)
+    )
+    return [(complaint_text(title, description), category, department)
+            for title, description, category, department in result]
+
+class CategorySuggester:
+    """Holds the current model and swaps in a retrained one when the file changes"""
+
+    def __init__(self, path=None, check_seconds=30):
+        self.path = path
+        self.check_seconds = check_seconds
+        self.model = None
+        self.mtime = None
+        self.checked_at = 0.0
+        self.loads = 0
+        self.last_batch_ms = None
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        self.path = app.config['SUGGESTION_MODEL_PATH']
+        self.check_seconds = app.config['SUGGESTION_CHECK_SECONDS']
+        self.model, self.mtime, self.checked_at = None, None, 0.0
+        self.reload()
+
+    def reload(self):
+        """Load the model file if it changed; returns whether a model is available"""
+        with self.lock:
+            self.checked_at = time.monotonic()
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except (OSError, TypeError):
+                if self.model is not None:
+                    logger.warning("⚠️ Suggestion model %s is gone, keeping the loaded one", self.path)
+                return self.model is not None
+            if mtime != self.mtime:
+                try:
+                    model = SuggestionModel.load(self.path)
+                except Exception as e:
+                    logger.error("❌ Could not load suggestion model %s: %s", self.path, e)
+                    return self.model is not None
+                # One reference assignment: requests in flight keep the model they started with
+                self.model, self.mtime = model, mtime
+                self.loads += 1
+                logger.info("🧠 Suggestion model loaded (%s samples, trained %s)",
+                            model.meta.get('samples'), model.meta.get('trained_at'))
+            return True
+
+    def current(self):
+        if time.monotonic() - self.checked_at >= self.check_seconds:
+            self.reload()
+        return self.model
+
+    def suggest(self, texts, limit=3):
+        """Per text, the top categories and departments that exist in this database; None without a model"""
+        from reference_data import reference_data
+        model = self.current()
+        if model is None:
+            return None
+        started = time.perf_counter()
+        probabilities = model.probabilities(texts)
+        suggestions = [{'categories': [], 'departments': []} for _ in texts]
+        for kind, key in (('category', 'categories'), ('department', 'departments')):
+            if kind not in model.heads:
+                continue
+            classes = model.heads[kind][0]
+            ranked = (-probabilities[kind]).argsort(axis=1)
+            for position, order in enumerate(ranked):
+                picked = suggestions[position][key]
+                for class_index in order:
+                    item = self._describe(kind, str(classes[class_index]), reference_data)
+                    if item is None:
+                        continue
+                    item['score'] = round(float(probabilities[kind][position, class_index]), 4)
+                    picked.append(item)
+                    if len(picked) >= limit:
+                        break
+        self.last_batch_ms = round((time.perf_counter() - started) * 1000, 2)
+        return suggestions
+
+    @staticmethod
+    def _describe(kind, name, reference_data):
+        if kind == 'department':
+            department_id = reference_data.department_id(name)
+            return {'department_id': department_id, 'department': name} if department_id else None
+        category = reference_data.category(reference_data.category_id(name))
+        if category is None:
+            return None
+        return {
+            'category_id': category['id'], 'category': name,
+            'department_id': category['department_id'],
+            'department': reference_data.department_name(category['department_id'])
+        }
+
+    def status(self):
+        model = self.model
+        return {
+            'loaded': model is not None,
+            'path': self.path,
+            'loads': self.loads,
+            'last_batch_ms': self.last_batch_ms,
+            **({key: model.meta.get(key) for key in ('trained_at', 'source', 'samples', 'features', 'accuracy')}
+               if model else {})
+        }
+
+category_suggester = CategorySuggester()
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the category/department suggestion model')
+    parser.add_argument('--source', choices=['db', 'csv'], default='db')
+    parser.add_argument('--csv', help='Training CSV (default: data/student_complaints.csv)')
+    parser.add_argument('--output', help='Model file (default: SUGGESTION_MODEL_PATH)')
+    parser.add_argument('--epochs', type=int, default=DEFAULT_EPOCHS)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    from config import Config
+    output = args.output or Config.SUGGESTION_MODEL_PATH
+    start = datetime.now()
+    if args.source == 'csv':
+        path = args.csv or os.path.join(os.path.dirname(__file__), '..', 'data', 'student_complaints.csv')
+        samples = samples_from_csv(path)
+    else:
+        from app import app
+        from models import db
+        with app.app_context():
+            samples = samples_from_db(db.session)
+    model = train(samples, epochs=args.epochs, seed=args.seed, source=args.source)
+    model.save(output)
+    elapsed = (datetime.now() - start).total_seconds()
+
+    accuracy = model.meta['accuracy']
+    summary = ', '.join(f"{kind} top-1 {scores['top1']:.1%} / top-3 {scores['top3']:.1%}"
+                        for kind, scores in accuracy.items()) if accuracy else 'too few samples for a holdout'
+    print(f"✅ Trained on {model.meta['samples']} complaints ({model.meta['features']} features) in "
+          f"{elapsed:.1f}s: {summary}. Saved to {output}")
+
+if __name__ == '__main__':
+    main()
@@ -116,29 +116,41 @@ function hideLoadingScreen() {
     }
 }
 
+// Fetch several GET endpoints in one round trip; resolves to {path: {status, body}}
+async function batchGet(paths) {
+    const response = await fetch(`${API_BASE}/batch`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        credentials: 'include',
+        body: JSON.stringify({ requests: paths.map(path => ({ id: path, path: `/api${path}` })) })
+    });
+    if (!response.ok) {
+        throw new Error(`Batch request failed: ${response.status}`);
+    }
+    const { responses } = await response.json();
+    return Object.fromEntries(responses.map(item => [item.id, item]));
+}
+
 // Load Initial Data
 async function loadInitialData() {
     try {
         console.log('📊 Loading initial data...');
         
-        // Load departments
-        const deptResponse = await fetch(`${API_BASE}/departments`);
-        if (deptResponse.ok) {
-            departments = await deptResponse.json();
+        // Departments, courses and categories in a single request
+        const results = await batchGet(['/departments', '/courses', '/complaint-categories']);
+        
+        if (results['/departments'].status === 200) {
+            departments = results['/departments'].body;
             console.log(`✅ Loaded ${departments.length} departments`);
         }
         
-        // Load courses
-        const courseResponse = await fetch(`${API_BASE}/courses`);
-        if (courseResponse.ok) {
-            courses = await courseResponse.json();
+        if (results['/courses'].status === 200) {
+            courses = results['/courses'].body;
             console.log(`✅ Loaded ${courses.length} courses`);
         }
         
-        // Load categories
-        const catResponse = await fetch(`${API_BASE}/complaint-categories`);
-        if (catResponse.ok) {
-            categories = await catResponse.json();
+        if (results['/complaint-categories'].status === 200) {
+            categories = results['/complaint-categories'].body;
             console.log(`✅ Loaded ${categories.length} categories`);
         }
         
@@ -824,7 +836,7 @@ async function loadAdminData() {
         }
         
         // Load students
-        const studentsResponse = await fetch(`${API_BASE}/students`);
+        const studentsResponse = await fetch(`${API_BASE}/students?fields=name,email,student_id,year,semester`);
         if (studentsResponse.ok) {
             students = await studentsResponse.json();
             console.log(`✅ Loaded ${students.length} students`);
@@ -2291,7 +2303,7 @@ async function loadAdminDataEnhanced() {
         }
         
         // Load students
-        const studentsResponse = await fetch(`${API_BASE}/students`);
+        const studentsResponse = await fetch(`${API_BASE}/students?fields=name,email,student_id,year,semester`);
         if (studentsResponse.ok) {
             students = await studentsResponse.json();
             updateStudentsList();
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Smart Complaint System - API Benchmark Harness
+Seeds an isolated database at each scale (backend/data_generator.py) and drives every API endpoint through
+the Flask test client, recording latency percentiles, queries per request and
+peak memory. Results are saved as JSON and can be compared against a baseline.
+
+Usage:
+    python scripts/benchmark.py --scales 10000 100000 --output benchmark_results.json
+    python scripts/benchmark.py --scales 10000 --baseline benchmark_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = PROJECT_ROOT / 'backend'
+DATA_DIR = PROJECT_ROOT / 'data'
+
+DEFAULT_SCALES = [10000, 100000, 1000000]
+
+# Every endpoint the harness drives. Paths are formatted with sample ids from
+# the seeded database; 'admin' endpoints run with an admin session.
+ENDPOINTS = [
+    {'name': 'health', 'method': 'GET', 'path': '/api/health'},
+    {'name': 'me', 'method': 'GET', 'path': '/api/me', 'admin': True},
+    {'name': 'departments', 'method': 'GET', 'path': '/api/departments'},
+    {'name': 'department_categories', 'method': 'GET', 'path': '/api/departments/{department_id}/categories'},
+    {'name': 'courses', 'method': 'GET', 'path': '/api/courses'},
+    {'name': 'courses_by_department', 'method': 'GET', 'path': '/api/courses/{department_id}'},
+    {'name': 'complaint_categories', 'method': 'GET', 'path': '/api/complaint-categories'},
+    {'name': 'complaints_all', 'method': 'GET', 'path': '/api/complaints'},
+    {'name': 'complaints_by_student', 'method': 'GET', 'path': '/api/complaints?user_id={user_id}'},
+    {'name': 'complaint_comments', 'method': 'GET', 'path': '/api/complaints/{complaint_id}/comments'},
+    {'name': 'students', 'method': 'GET', 'path': '/api/students'},
+    {'name': 'student_info', 'method': 'GET', 'path': '/api/student/{student_id}'},
+    {'name': 'student_complaints_csv', 'method': 'GET', 'path': '/api/student-complaints/{student_id}'},
+    {'name': 'all_student_complaints_csv', 'method': 'GET', 'path': '/api/all-student-complaints'},
+    {'name': 'search', 'method': 'GET', 'path': '/api/complaints/search?q=wifi&status=Pending'},
+    {'name': 'export', 'method': 'GET', 'path': '/api/complaints/export'},
+    {'name': 'export_columnar', 'method': 'GET', 'path': '/api/complaints/export/columnar?format=parquet'},
+    {'name': 'stats', 'method': 'GET', 'path': '/api/stats'},
+    {'name': 'resolution_times', 'method': 'GET', 'path': '/api/analytics/resolution-times?group_by=department'},
+    {'name': 'notifications_student', 'method': 'GET', 'path': '/api/notifications/{user_id}'},
+    {'name': 'notifications_admin', 'method': 'GET', 'path': '/api/notifications/{admin_id}'},
+    {'name': 'admin_performance', 'method': 'GET', 'path': '/api/admin/performance'},
+    {'name': 'admin_db_pool', 'method': 'GET', 'path': '/api/admin/db-pool'},
+    {'name': 'export_complaints_csv', 'method': 'GET', 'path': '/api/export/complaints/csv', 'admin': True},
+    {'name': 'export_complaints_json', 'method': 'GET', 'path': '/api/export/complaints/json', 'admin': True},
+    {'name': 'export_students_csv', 'method': 'GET', 'path': '/api/export/students/csv', 'admin': True},
+    {'name': 'report_summary', 'method': 'GET', 'path': '/api/reports/summary', 'admin': True},
+    {'name': 'create_complaint', 'method': 'POST', 'path': '/api/complaints', 'json': lambda ids: {
+        'title': 'Benchmark complaint', 'description': 'Projector in room 101 is not working properly',
+        'category_id': ids['category_id'], 'department_id': ids['department_id'], 'user_id': ids['user_id']}},
+    {'name': 'update_status', 'method': 'PATCH', 'path': '/api/complaints/{complaint_id}/status',
+     'json': lambda ids: {'status': 'In Progress', 'admin_comment': 'Looking into it'}},
+    {'name': 'update_priority', 'method': 'PATCH', 'path': '/api/complaints/{complaint_id}/priority',
+     'json': lambda ids: {'priority': 'High'}},
+    {'name': 'add_comment', 'method': 'POST', 'path': '/api/complaints/{complaint_id}/comments',
+     'json': lambda ids: {'admin_id': ids['admin_id'], 'text': 'Benchmark comment'}},
+    {'name': 'bulk_update', 'method': 'POST', 'path': '/api/complaints/bulk-update',
+     'json': lambda ids: {'complaint_ids': ids['bulk_ids'], 'action': 'priority', 'value': 'Medium',
+                          'admin_id': ids['admin_id']}},
+]
+
+# Endpoints deliberately not driven (side effects outside the database)
+SKIPPED_ENDPOINTS = {'register', 'login', 'logout', 'send_notification',
+                     'start_complaint_summary_job', 'get_report_job', 'static'}
+
+def sample_ids(engine):
+    """Ids of real rows used to fill endpoint paths"""
+    from sqlalchemy import select, func
+    from models import User, Complaint, Department, ComplaintCategory
+
+    with engine.connect() as conn:
+        user_id, student_id = conn.execute(
+            select(User.id, User.student_id).where(User.role == 'student').order_by(User.id.desc()).limit(1)
+        ).one()
+        complaint_id = conn.execute(select(func.max(Complaint.id))).scalar()
+        return {
+            'user_id': user_id,
+            'student_id': student_id,
+            'admin_id': conn.execute(select(User.id).where(User.role == 'admin')).scalar(),
+            'complaint_id': complaint_id,
+            'bulk_ids': list(range(complaint_id - 49, complaint_id + 1)),
+            'department_id': conn.execute(select(func.min(Department.id))).scalar(),
+            'category_id': conn.execute(select(func.min(ComplaintCategory.id))).scalar()
+        }
+
+class QueryCounter:
+    """Counts SQL statements executed on a set of engines"""
+    def __init__(self, engines):
+        from sqlalchemy import event
+        self.count = 0
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args, **kwargs):
+        self.count += 1
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def run_endpoint(client, endpoint, ids, counter, requests_per_endpoint, warmup, max_seconds):
+    """Time one endpoint; peak memory comes from the first (untimed, traced) warmup request"""
+    path = endpoint['path'].format(**ids)
+    body = endpoint['json'](ids) if 'json' in endpoint else None
+
+    def call():
+        response = client.open(path, method=endpoint['method'], json=body)
+        response.get_data()
+        return response.status_code
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for _ in range(warmup - 1):
+        if time.perf_counter() - started > max_seconds:
+            break
+        call()
+
+    latencies, statuses = [], {}
+    queries_before = counter.count
+    started = time.perf_counter()
+    for _ in range(requests_per_endpoint):
+        t0 = time.perf_counter()
+        status = call()
+        latencies.append((time.perf_counter() - t0) * 1000)
+        statuses[status] = statuses.get(status, 0) + 1
+        if time.perf_counter() - started > max_seconds:
+            break
+    queries = (counter.count - queries_before) / len(latencies)
+
+    latencies.sort()
+    return {
+        'method': endpoint['method'],
+        'path': endpoint['path'],
+        'requests': len(latencies),
+        'statuses': {str(code): count for code, count in statuses.items()},
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'max_ms': round(latencies[-1], 3),
+        'queries_per_request': round(queries, 2),
+        'peak_memory_kb': round(peak / 1024, 1)
+    }
+
+@contextmanager
+def preserved_data_files():
+    """Some endpoints mirror writes into data/*.csv; restore them afterwards"""
+    snapshot = {path: path.read_bytes() for path in DATA_DIR.glob('*.csv')}
+    try:
+        yield
+    finally:
+        for path, content in snapshot.items():
+            path.write_bytes(content)
+
+def run_scale(scale, db_path, args):
+    """Worker: seed one isolated database and benchmark every endpoint"""
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    os.environ['REPORT_WAIT_SECONDS'] = '120'
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    with preserved_data_files():
+        import app as app_module
+        from models import db
+        app = app_module.app
+        if getattr(app_module, 'limiter', None):
+            app_module.limiter.enabled = False
+
+        with app.app_context():
+            from data_generator import DatabaseSink, ReferenceData, generate_dataset
+            seed_start = time.perf_counter()
+            generate_dataset(DatabaseSink(db.engine), ReferenceData.from_engine(db.engine), complaints=scale,
+                             seed=args.seed)
+            seed_seconds = time.perf_counter() - seed_start
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql('ANALYZE')
+            ids = sample_ids(db.engine)
+            router = app.extensions['db_routing']
+            counter = QueryCounter([db.engine] + [reader.engine for reader in router.readers])
+
+        print(f"📊 Seeded {scale} complaints in {seed_seconds:.1f}s")
+
+        client = app.test_client()
+        anonymous = app.test_client()
+        login = client.post('/api/login', json={'login_type': 'admin', 'email': 'admin@college.edu', 'password': 'admin123'})
+        if login.status_code != 200:
+            raise RuntimeError(f'Admin login failed: {login.status_code}')
+
+        results = {}
+        for endpoint in ENDPOINTS:
+            if args.endpoints and endpoint['name'] not in args.endpoints:
+                continue
+            # The app prints debug output on some paths; keep it out of the report
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                result = run_endpoint(client if endpoint.get('admin') else anonymous, endpoint, ids, counter,
+                                      args.requests, args.warmup, args.max_seconds)
+            results[endpoint['name']] = result
+            errors = [code for code in result['statuses'] if not code.startswith('2')]
+            print(f"  {endpoint['name']:<30} p50 {result['p50_ms']:>9.2f}ms  p95 {result['p95_ms']:>9.2f}ms  "
+                  f"{result['queries_per_request']:>6.1f} q/req  {result['peak_memory_kb']:>10.1f} KB"
+                  f"{'  ⚠️ HTTP ' + ','.join(errors) if errors else ''}")
+
+        # Flag routes added to the app but missing from ENDPOINTS
+        adapter = app.url_map.bind('localhost')
+        def view_name(endpoint):
+            return endpoint.rsplit('.', 1)[-1]  # drop the blueprint prefix
+        driven = {view_name(adapter.match(e['path'].format(**ids).split('?')[0], method=e['method'])[0])
+                  for e in ENDPOINTS}
+        not_benchmarked = sorted({view_name(rule.endpoint) for rule in app.url_map.iter_rules()}
+                                 - driven - SKIPPED_ENDPOINTS)
+        if not_benchmarked:
+            print(f"⚠️ Not benchmarked: {', '.join(not_benchmarked)}")
+
+    return {
+        'complaints': scale,
+        'seed_seconds': round(seed_seconds, 2),
+        'not_benchmarked': not_benchmarked,
+        'endpoints': results
+    }
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Regressions: slower p50/p95 beyond the threshold, or more queries per request"""
+    regressions = []
+    for scale, scale_result in results['scales'].items():
+        base_scale = baseline.get('scales', {}).get(scale)
+        if not base_scale:
+            continue
+        for name, current in scale_result['endpoints'].items():
+            previous = base_scale['endpoints'].get(name)
+            if not previous:
+                continue
+            for metric in ('p50_ms', 'p95_ms'):
+                delta = current[metric] - previous[metric]
+                if delta > min_delta_ms and current[metric] > previous[metric] * (1 + threshold):
+                    regressions.append(f"{scale} {name}: {metric} {previous[metric]:.2f} -> {current[metric]:.2f}")
+            if current['queries_per_request'] > previous['queries_per_request']:
+                regressions.append(f"{scale} {name}: queries/request {previous['queries_per_request']} -> "
+                                   f"{current['queries_per_request']}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every API endpoint at several data scales')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES, help='Complaint counts to seed')
+    parser.add_argument('--requests', type=int, default=30, help='Timed requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=2, help='Untimed requests first (at least 1)')
+    parser.add_argument('--max-seconds', type=float, default=30, help='Time budget per endpoint')
+    parser.add_argument('--endpoints', nargs='+', help='Only run these endpoint names')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown before flagging (0.25 = 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=2.0, help='Ignore slowdowns smaller than this')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--worker-db', help=argparse.SUPPRESS)
+    parser.add_argument('--worker-output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        result = run_scale(args.worker, args.worker_db, args)
+        Path(args.worker_output).write_text(json.dumps(result))
+        return
+
+    results = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'requests_per_endpoint': args.requests
+        },
+        'scales': {}
+    }
+
+    # Each scale runs in its own process so the database and memory start clean
+    with tempfile.TemporaryDirectory(prefix='complaint-bench-') as workdir:
+        for scale in args.scales:
+            print(f"🚀 Benchmarking at {scale} complaints...")
+            db_path = os.path.join(workdir, f'bench_{scale}.db')
+            output = os.path.join(workdir, f'bench_{scale}.json')
+            command = [sys.executable, __file__, '--worker', str(scale), '--worker-db', db_path,
+                       '--worker-output', output, '--requests', str(args.requests), '--warmup', str(args.warmup),
+                       '--max-seconds', str(args.max_seconds), '--seed', str(args.seed)]
+            if args.endpoints:
+                command += ['--endpoints', *args.endpoints]
+            subprocess.run(command, check=True, cwd=BACKEND_DIR)
+            results['scales'][str(scale)] = json.loads(Path(output).read_text())
+
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f"✅ Results saved to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"✅ No regressions against {args.baseline}")
+
+if __name__ == '__main__':
+    main()
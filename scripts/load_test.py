@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Smart Complaint System - Open-Loop Load Generator
+Issues requests at a fixed arrival rate (independent of response times) from a
+weighted mix of traffic scenarios and reports throughput, error rate and
+latency percentiles. Latency is measured from each request's *intended* send
+time, so queueing delay is not hidden (no coordinated omission).
+
+Usage:
+    python scripts/load_test.py --rate 50 --duration 60
+    python scripts/load_test.py --rates 10 20 40 80 160 --duration 30 --slo-ms 500
+    python scripts/load_test.py --profile my_profile.json --output load_results.json
+
+Note: complaint submissions and status updates write to the target server's
+database (and its data/*.csv mirrors) - point it at a disposable instance.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+PERCENTILES = (50, 90, 99, 99.9)
+SEARCH_TERMS = ['wifi', 'hostel', 'library', 'exam', 'fees', 'projector', 'water', 'canteen']
+
+# Default traffic mix for a term-start peak. Paths are formatted with ids
+# discovered from the server; 'admin' scenarios use a logged-in admin session.
+DEFAULT_PROFILE = [
+    {'name': 'student_submit', 'weight': 15, 'method': 'POST', 'path': '/api/complaints',
+     'json': {'title': 'Load test complaint', 'description': 'The projector in the lecture hall is not working',
+              'category_id': '{category_id}', 'department_id': '{department_id}', 'user_id': '{user_id}'}},
+    {'name': 'student_list', 'weight': 15, 'method': 'GET', 'path': '/api/complaints?user_id={user_id}'},
+    {'name': 'student_notifications', 'weight': 10, 'method': 'GET', 'path': '/api/notifications/{user_id}'},
+    {'name': 'admin_status_update', 'weight': 10, 'method': 'PATCH', 'path': '/api/complaints/{complaint_id}/status',
+     'json': {'status': 'In Progress', 'admin_comment': 'Being handled'}, 'admin': True},
+    {'name': 'dashboard_stats', 'weight': 20, 'method': 'GET', 'path': '/api/stats', 'admin': True},
+    {'name': 'dashboard_notifications', 'weight': 5, 'method': 'GET', 'path': '/api/notifications/{admin_id}',
+     'admin': True},
+    {'name': 'search', 'weight': 15, 'method': 'GET', 'path': '/api/complaints/search?q={search_term}&status=Pending',
+     'admin': True},
+    {'name': 'resolution_analytics', 'weight': 5, 'method': 'GET',
+     'path': '/api/analytics/resolution-times?group_by=department', 'admin': True},
+    {'name': 'export', 'weight': 5, 'method': 'GET', 'path': '/api/complaints/export',
+     'admin': True},
+]
+
+def load_profile(path):
+    """Traffic mix from a JSON file: a list of scenarios like DEFAULT_PROFILE"""
+    if not path:
+        return DEFAULT_PROFILE
+    profile = json.loads(Path(path).read_text())
+    for scenario in profile:
+        missing = {'name', 'weight', 'method', 'path'} - set(scenario)
+        if missing:
+            raise ValueError(f"Scenario {scenario.get('name', '?')} is missing {', '.join(sorted(missing))}")
+    return profile
+
+def _fill(template, ids):
+    if isinstance(template, str):
+        if template.startswith('{') and template.endswith('}') and template[1:-1] in ids:
+            return ids[template[1:-1]]
+        return template.format(**ids)
+    if isinstance(template, dict):
+        return {key: _fill(value, ids) for key, value in template.items()}
+    if isinstance(template, list):
+        return [_fill(value, ids) for value in template]
+    return template
+
+class RequestFactory:
+    """Picks scenarios by weight and fills in ids discovered from the server"""
+    def __init__(self, profile, pools, seed=None):
+        self.profile = profile
+        self.pools = pools
+        self.rng = random.Random(seed)
+        total = sum(scenario['weight'] for scenario in profile)
+        self.weights = [scenario['weight'] / total for scenario in profile]
+
+    def next(self):
+        scenario = self.rng.choices(self.profile, weights=self.weights)[0]
+        ids = {name: self.rng.choice(values) for name, values in self.pools.items() if values}
+        ids['search_term'] = self.rng.choice(SEARCH_TERMS)
+        return scenario, scenario['method'], _fill(scenario['path'], ids), _fill(scenario.get('json'), ids)
+
+class AiohttpTransport:
+    def __init__(self, base_url, connections, timeout):
+        self.base_url = base_url
+        self.connections = connections
+        self.timeout = timeout
+        self.sessions = {}
+
+    async def start(self):
+        for role in ('anonymous', 'admin'):
+            self.sessions[role] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
+    async def request(self, method, path, json_body=None, admin=False):
+        session = self.sessions['admin' if admin else 'anonymous']
+        async with session.request(method, self.base_url + path, json=json_body) as response:
+            body = await response.read()
+            return response.status, body
+
+    async def close(self):
+        for session in self.sessions.values():
+            await session.close()
+
+class ThreadedTransport:
+    """Fallback when aiohttp is not installed: requests.Session calls on a thread pool"""
+    def __init__(self, base_url, connections, timeout):
+        import requests
+        self.requests = requests
+        self.base_url = base_url
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=connections, thread_name_prefix='load')
+        self.local = threading.local()
+        self.admin_cookies = None
+
+    async def start(self):
+        pass
+
+    def _session(self, admin):
+        key = 'admin' if admin else 'anonymous'
+        session = getattr(self.local, key, None)
+        if session is None:
+            session = self.requests.Session()
+            if admin and self.admin_cookies is not None:
+                session.cookies.update(self.admin_cookies)
+            setattr(self.local, key, session)
+        return session
+
+    def _call(self, method, path, json_body, admin):
+        response = self._session(admin).request(method, self.base_url + path, json=json_body, timeout=self.timeout)
+        if admin and self.admin_cookies is None:
+            self.admin_cookies = response.cookies
+        return response.status_code, response.content
+
+    async def request(self, method, path, json_body=None, admin=False):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._call, method, path, json_body, admin)
+
+    async def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+async def discover_ids(transport, admin_email, admin_password):
+    """Log in as admin and collect ids of real students, complaints, departments and categories"""
+    status, body = await transport.request('POST', '/api/login', {
+        'login_type': 'admin', 'email': admin_email, 'password': admin_password
+    }, admin=True)
+    if status != 200:
+        raise RuntimeError(f'Admin login failed ({status}): {body[:200]!r}')
+    admin_id = json.loads(body)['user']['id']
+
+    async def get(path):
+        status, body = await transport.request('GET', path, admin=True)
+        if status != 200:
+            raise RuntimeError(f'GET {path} failed ({status})')
+        return json.loads(body)
+
+    departments = [d['id'] for d in await get('/api/departments')]
+    categories = await get('/api/complaint-categories')
+    students = [s['id'] for s in await get('/api/students')][:1000]
+    complaint_ids = []
+    for user_id in students[:20]:
+        complaint_ids.extend(c['id'] for c in await get(f'/api/complaints?user_id={user_id}'))
+
+    return {
+        'admin_id': [admin_id],
+        'user_id': students,
+        'complaint_id': complaint_ids or [1],
+        'department_id': departments,
+        'category_id': [c['id'] for c in categories]
+    }
+
+def summarize(latencies_ms):
+    if not len(latencies_ms):
+        return {f'p{p:g}_ms': None for p in PERCENTILES} | {'max_ms': None, 'mean_ms': None}
+    values = np.asarray(latencies_ms)
+    summary = {f'p{p:g}_ms': round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+    summary.update(max_ms=round(float(values.max()), 2), mean_ms=round(float(values.mean()), 2))
+    return summary
+
+async def run_rate(transport, factory, rate, duration, warmup, arrivals, seed):
+    """Fire requests at `rate` per second for `duration` seconds (open loop)"""
+    rng = np.random.default_rng(seed)
+    total = int(rate * (warmup + duration))
+    if arrivals == 'poisson':
+        offsets = np.cumsum(rng.exponential(1 / rate, total))
+    else:
+        offsets = np.arange(total) / rate
+
+    records = []
+    max_lag = 0.0
+    tasks = []
+    start = time.perf_counter()
+
+    async def fire(scenario, method, path, body, intended):
+        sent = time.perf_counter()
+        try:
+            status, _ = await transport.request(method, path, body, admin=scenario.get('admin', False))
+            error = None if status < 400 else f'HTTP {status}'
+        except Exception as e:
+            status, error = None, type(e).__name__
+        done = time.perf_counter()
+        records.append((scenario['name'], intended - start, (done - intended) * 1000, (done - sent) * 1000, error))
+
+    for offset in offsets:
+        intended = start + offset
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            max_lag = max(max_lag, -delay)
+        tasks.append(asyncio.create_task(fire(*factory.next(), intended)))
+    await asyncio.gather(*tasks)
+    wall = time.perf_counter() - start
+
+    measured = [r for r in records if r[1] >= warmup]
+    errors = [r for r in measured if r[4]]
+    completed_window = max(r[1] for r in measured) - warmup if measured else duration
+    result = {
+        'target_rate': rate,
+        'requests': len(measured),
+        'throughput_rps': round(len(measured) / max(duration, completed_window), 2),
+        'error_rate': round(len(errors) / len(measured), 4) if measured else 0,
+        'errors': _count(r[4] for r in errors),
+        'latency': summarize([r[2] for r in measured]),
+        'service_time': summarize([r[3] for r in measured]),
+        'max_schedule_lag_ms': round(max_lag * 1000, 2),
+        'drain_seconds': round(wall - (warmup + duration), 2),
+        'scenarios': {}
+    }
+    for name in sorted({r[0] for r in measured}):
+        rows = [r for r in measured if r[0] == name]
+        result['scenarios'][name] = {
+            'requests': len(rows),
+            'error_rate': round(sum(1 for r in rows if r[4]) / len(rows), 4),
+            'latency': summarize([r[2] for r in rows])
+        }
+    return result
+
+def _count(values):
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+def find_knee(results, slo_ms, max_error_rate):
+    """Highest tested rate that kept p99 under the SLO, errors low and throughput on target"""
+    knee = None
+    for result in results:
+        p99 = result['latency']['p99_ms']
+        healthy = (p99 is not None and p99 <= slo_ms and result['error_rate'] <= max_error_rate
+                   and result['throughput_rps'] >= 0.95 * result['target_rate'])
+        if not healthy:
+            break
+        knee = result['target_rate']
+    return knee
+
+def print_result(result):
+    latency, service = result['latency'], result['service_time']
+    print(f"  {result['target_rate']:>7g} req/s -> {result['throughput_rps']:>7.1f} req/s  "
+          f"errors {result['error_rate'] * 100:5.1f}%  "
+          f"p50 {latency['p50_ms'] or 0:>8.1f}  p90 {latency['p90_ms'] or 0:>8.1f}  "
+          f"p99 {latency['p99_ms'] or 0:>8.1f}  p99.9 {latency['p99.9_ms'] or 0:>8.1f} ms  "
+          f"(uncorrected p99 {service['p99_ms'] or 0:.1f} ms)")
+    if result['max_schedule_lag_ms'] > 50:
+        print(f"  ⚠️ Load generator fell {result['max_schedule_lag_ms']:.0f}ms behind schedule; "
+              f"results at this rate are client-bound")
+
+async def run(args):
+    transport_class = AiohttpTransport if AIOHTTP_AVAILABLE else ThreadedTransport
+    if not AIOHTTP_AVAILABLE:
+        print("⚠️ aiohttp not installed; using a thread pool of requests sessions (pip install aiohttp)")
+    transport = transport_class(args.base_url.rstrip('/'), args.connections, args.timeout)
+    await transport.start()
+    try:
+        pools = await discover_ids(transport, args.admin_email, args.admin_password)
+        factory = RequestFactory(load_profile(args.profile), pools, seed=args.seed)
+        results = []
+        for rate in args.rates or [args.rate]:
+            print(f"🚀 {rate:g} req/s for {args.duration:g}s (+{args.warmup:g}s warmup, {args.arrivals} arrivals)...")
+            result = await run_rate(transport, factory, rate, args.duration, args.warmup, args.arrivals, args.seed)
+            print_result(result)
+            results.append(result)
+        return results
+    finally:
+        await transport.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Open-loop load test with a mixed traffic profile')
+    parser.add_argument('--base-url', default='http://localhost:5000')
+    parser.add_argument('--rate', type=float, default=20, help='Arrival rate in requests per second')
+    parser.add_argument('--rates', type=float, nargs='+', help='Sweep several rates to find the capacity knee')
+    parser.add_argument('--duration', type=float, default=30, help='Measured seconds per rate')
+    parser.add_argument('--warmup', type=float, default=5, help='Seconds at the start of each rate excluded from stats')
+    parser.add_argument('--arrivals', choices=['constant', 'poisson'], default='poisson')
+    parser.add_argument('--connections', type=int, default=200, help='Max concurrent connections')
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds')
+    parser.add_argument('--profile', help='JSON traffic mix (default: term-start mix)')
+    parser.add_argument('--slo-ms', type=float, default=1000, help='p99 latency target used to locate the knee')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    parser.add_argument('--admin-email', default='admin@college.edu')
+    parser.add_argument('--admin-password', default='admin123')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Save results as JSON')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if len(results) > 1:
+        knee = find_knee(results, args.slo_ms, args.max_error_rate)
+        if knee is None:
+            print(f"❌ Even {results[0]['target_rate']:g} req/s missed the p99 {args.slo_ms:g}ms / "
+                  f"{args.max_error_rate:.0%} error target")
+        else:
+            print(f"📈 Capacity knee: about {knee:g} req/s (p99 <= {args.slo_ms:g}ms, errors <= {args.max_error_rate:.0%})")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            'timestamp': datetime.utcnow().isoformat(),
+            'base_url': args.base_url,
+            'arrivals': args.arrivals,
+            'profile': [{key: value for key, value in s.items() if key != 'json'} for s in load_profile(args.profile)],
+            'results': results
+        }, indent=2))
+        print(f"✅ Results saved to {args.output}")
+
+if __name__ == '__main__':
+    sys.exit(main())
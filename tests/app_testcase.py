@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Shared setup for test suites that run against a temporary SQLite app from create_app().
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from models import db
+
+ADMIN_LOGIN = {'login_type': 'admin', 'email': 'admin@college.edu', 'password': 'admin123'}
+
+def reset_singletons():
+    """Unbind the process-wide services that create_app() binds to the app it builds, so no suite
+    depends on the one that ran before it"""
+    from assignment import auto_assigner
+    from background import background_services
+    from monitoring import monitor, notification_manager
+    from report_jobs import report_manager
+    from suggestions import category_suggester
+
+    if background_services.running:
+        background_services.stop()
+    background_services.services.clear()
+    background_services.lock = None
+    with report_manager.lock:
+        report_manager.app = None
+        report_manager.jobs.clear()
+        report_manager.in_flight.clear()
+        report_manager.cache.clear()
+    with auto_assigner.lock:
+        auto_assigner.loads, auto_assigner.departments, auto_assigner.pools = {}, {}, {}
+        auto_assigner.reconciled_at = None
+    with category_suggester.lock:
+        category_suggester.path, category_suggester.model, category_suggester.mtime = None, None, None
+        category_suggester.checked_at = 0.0
+    monitor.app = monitor.socketio = notification_manager.socketio = None
+
+class AppTestCase(unittest.TestCase):
+    """One app per suite on a database in a temporary directory (which also receives the CSV
+    mirror). Suites set CONFIG overrides and add their rows in seed()."""
+
+    CONFIG = {}
+
+    @classmethod
+    def setUpClass(cls):
+        from app import create_app
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(cls.tmpdir.name, 'test.db')}",
+            'LOAD_CSV_ON_STARTUP': False,
+            'RATELIMIT_ENABLED': False,
+            'CSV_MIRROR_DIR': cls.tmpdir.name,
+            'LOG_FILE': '',  # console only: no app log in the working directory
+            'TESTING': True,
+            **cls.config()
+        })
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            cls.seed()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        cls.app.extensions['db_routing'].dispose()
+        reset_singletons()
+        cls.tmpdir.cleanup()
+
+    @classmethod
+    def config(cls):
+        """Config overrides; override this instead of CONFIG when they depend on cls.tmpdir"""
+        return dict(cls.CONFIG)
+
+    @classmethod
+    def seed(cls):
+        """Add the suite's rows (runs in an app context before any test)"""
+
+    def login_admin(self, client=None):
+        """Log a test client (default self.client) in as the default admin"""
+        response = (client or self.client).post('/api/login', json=ADMIN_LOGIN)
+        self.assertEqual(response.status_code, 200)
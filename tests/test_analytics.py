@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Resolution-time analytics tests: percentiles, SLA breaches, date ranges and missing departments.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+import numpy as np
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint
+
+CSE_HOURS = [2, 4, 6, 8, 100]
+EE_HOURS = [10, 20]
+
+class AnalyticsTestSuite(AppTestCase):
+    """/api/analytics/resolution-times against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        cse, ee = Department(name='Computer Science', code='CSE'), Department(name='Electrical', code='EE')
+        db.session.add_all([cse, ee])
+        db.session.flush()
+        lab = ComplaintCategory(name='Lab Equipment', department_id=cse.id, typical_resolution_days=1)
+        power = ComplaintCategory(name='Power Supply', department_id=ee.id, typical_resolution_days=3)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([lab, power, student])
+        db.session.flush()
+        rows = [(cse.id, lab.id, hours, datetime(2026, 3, 1, 9)) for hours in CSE_HOURS]
+        rows += [(ee.id, power.id, hours, datetime(2026, 3, 2, 9)) for hours in EE_HOURS]
+        rows.append((cse.id, lab.id, 30, datetime(2026, 3, 10, 15)))  # afternoon of the last day in range
+        rows.append((cse.id, lab.id, 5, datetime(2026, 3, 11, 0)))  # first moment after it
+        for index, (department_id, category_id, hours, created) in enumerate(rows):
+            db.session.add(Complaint(
+                complaint_id=f'CMP{index:04d}', title=f'Complaint {index}', description='Resolved complaint',
+                category_id=category_id, department_id=department_id, student_id=student.id,
+                status='Resolved', created_at=created, resolved_at=created + timedelta(hours=hours)
+            ))
+        db.session.add(Complaint(complaint_id='CMPOPEN', title='Still open', description='Pending complaint',
+                                 category_id=lab.id, department_id=cse.id, student_id=student.id,
+                                 created_at=datetime(2026, 3, 1, 9)))
+        db.session.commit()
+        cls.cse_id, cls.ee_id, cls.lab_id, cls.student_id = cse.id, ee.id, lab.id, student.id
+
+    def stats(self, **params):
+        response = self.client.get('/api/analytics/resolution-times', query_string=params)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_01_percentiles_per_department(self):
+        """Test that per-department percentiles, means and breaches match NumPy over the raw hours"""
+        body = self.stats(date_from='2026-03-01', date_to='2026-03-05')
+        groups = {g['department_id']: g for g in body['groups']}
+        self.assertEqual(set(groups), {self.cse_id, self.ee_id})
+        for department_id, hours in ((self.cse_id, CSE_HOURS), (self.ee_id, EE_HOURS)):
+            group = groups[department_id]
+            self.assertEqual(group['count'], len(hours))
+            self.assertEqual(group['mean_hours'], round(float(np.mean(hours)), 1))
+            for p in (50, 90, 99):
+                self.assertAlmostEqual(group[f'p{p}_hours'], round(float(np.percentile(hours, p)), 1), places=1)
+        self.assertEqual(groups[self.cse_id]['department_name'], 'Computer Science')
+        self.assertEqual(groups[self.cse_id]['sla_breaches'], 1)  # only the 100h one exceeds a 1-day target
+        self.assertEqual(groups[self.ee_id]['sla_breaches'], 0)
+        self.assertEqual(body['overall']['count'], len(CSE_HOURS) + len(EE_HOURS))
+        self.assertEqual([g['department_id'] for g in body['groups']], [self.cse_id, self.ee_id])  # by p90
+        print("✅ Resolution percentiles passed")
+
+    def test_02_date_to_includes_the_whole_day(self):
+        """Test that date_to covers complaints created later on that day, and nothing after it"""
+        body = self.stats(group_by='category', date_from='2026-03-10', date_to='2026-03-10')
+        self.assertEqual(body['overall']['count'], 1)
+        self.assertEqual(body['overall']['mean_hours'], 30.0)
+        self.assertEqual(body['groups'][0]['category_name'], 'Lab Equipment')
+        self.assertEqual(self.stats(date_from='2026-03-11')['overall']['count'], 1)
+        self.assertEqual(self.client.get('/api/analytics/resolution-times?group_by=student').status_code, 400)
+        print("✅ Inclusive date range passed")
+
+    def test_03_missing_department_still_counted(self):
+        """Test that a complaint whose department row is gone is counted, with no name"""
+        with self.app.app_context():
+            db.session.add(Complaint(complaint_id='CMPGONE', title='Orphan', description='Department deleted',
+                                     category_id=self.lab_id, department_id=9999, student_id=self.student_id,
+                                     status='Resolved', created_at=datetime(2026, 4, 1, 9),
+                                     resolved_at=datetime(2026, 4, 1, 12)))
+            db.session.commit()
+        body = self.stats(group_by='department_category', date_from='2026-04-01', date_to='2026-04-01')
+        self.assertEqual(body['overall']['count'], 1)
+        self.assertEqual(len(body['groups']), 1)
+        group = body['groups'][0]
+        self.assertEqual((group['department_id'], group['department_name']), (9999, None))
+        self.assertEqual((group['category_name'], group['p50_hours']), ('Lab Equipment', 3.0))
+        print("✅ Missing department passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -386,6 +386,115 @@ class APITestSuite(unittest.TestCase):
             print("✅ Performance metrics passed")
         else:
             print("⚠️ Performance metrics endpoint not available")
+    
+    def test_21_resolution_time_analytics(self):
+        """Test resolution-time percentile analytics"""
+        for group_by in ['department', 'category', 'department_category']:
+            response = self.session.get(f'{self.base_url}/analytics/resolution-times', params={'group_by': group_by})
+            self.assertEqual(response.status_code, 200)
+            
+            data = response.json()
+            self.assertEqual(data['group_by'], group_by)
+            for field in ['count', 'p50_hours', 'p90_hours', 'p99_hours', 'sla_breach_rate']:
+                self.assertIn(field, data['overall'])
+            
+            for group in data['groups']:
+                self.assertLessEqual(group['p50_hours'], group['p90_hours'])
+                self.assertLessEqual(group['p90_hours'], group['p99_hours'])
+        
+        response = self.session.get(f'{self.base_url}/analytics/resolution-times', params={'group_by': 'invalid'})
+        self.assertEqual(response.status_code, 400)
+        print("✅ Resolution-time analytics passed")
+    
+    def test_22_columnar_export(self):
+        """Test Parquet / Arrow IPC complaint export"""
+        response = self.session.get(f'{self.base_url}/complaints/export/columnar', params={'format': 'parquet'})
+        if response.status_code == 501:
+            self.skipTest("pyarrow not installed on the server")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content.startswith(b'PAR1'))
+        self.assertTrue(response.content.endswith(b'PAR1'))
+        
+        response = self.session.get(f'{self.base_url}/complaints/export/columnar', params={'format': 'arrow', 'date_from': '2020-01-01'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content.startswith(b'ARROW1'))
+        
+        response = self.session.get(f'{self.base_url}/complaints/export/columnar', params={'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+        print("✅ Columnar export passed")
+    
+    def test_23_report_jobs(self):
+        """Test background summary report jobs"""
+        if 'admin' not in self.test_data:
+            self.skipTest("Admin login test failed")
+        
+        response = self.session.post(f'{self.base_url}/reports/summary')
+        self.assertIn(response.status_code, [200, 202])
+        job = response.json()
+        self.assertIn('id', job)
+        
+        # Poll until the job finishes
+        for _ in range(30):
+            response = self.session.get(f'{self.base_url}/reports/jobs/{job["id"]}')
+            self.assertEqual(response.status_code, 200)
+            job = response.json()
+            if job['status'] in ['completed', 'failed']:
+                break
+            time.sleep(0.5)
+        
+        self.assertEqual(job['status'], 'completed')
+        self.assertIn('total_complaints', job['report'])
+        
+        # Unchanged data is served from the cache
+        response = self.session.post(f'{self.base_url}/reports/summary')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['cached'])
+        
+        response = self.session.get(f'{self.base_url}/reports/jobs/unknown')
+        self.assertEqual(response.status_code, 404)
+        print("✅ Report jobs passed")
+    
+    def test_24_db_pool_metrics(self):
+        """Test connection pool observability"""
+        response = self.session.get(f'{self.base_url}/admin/db-pool')
+        self.assertEqual(response.status_code, 200)
+        
+        data = response.json()
+        for field in ['checkouts', 'timeouts', 'avg_wait_ms', 'p95_wait_ms', 'max_wait_ms']:
+            self.assertIn(field, data['pool'])
+        self.assertGreaterEqual(data['sizing']['pool_size'], 1)
+        self.assertLessEqual(
+            (data['sizing']['pool_size'] + data['sizing']['max_overflow']) * data['sizing']['workers'],
+            data['sizing']['max_connections']
+        )
+        print(f"✅ DB pool metrics passed ({data['pool']['checkouts']} checkouts)")
+
+    def test_25_read_routing_status(self):
+        """Test read replica status reporting"""
+        response = self.session.get(f'{self.base_url}/admin/db-pool')
+        self.assertEqual(response.status_code, 200)
+        
+        readers = response.json()['readers']
+        for reader in readers:
+            for field in ['name', 'healthy', 'lag_seconds', 'max_lag_seconds', 'last_error']:
+                self.assertIn(field, reader)
+        
+        # Read-only endpoints still answer whichever engine serves them
+        response = self.session.get(f'{self.base_url}/departments')
+        self.assertEqual(response.status_code, 200)
+        print(f"✅ Read routing status passed ({len(readers)} readers)")
+
+    def test_26_background_services_status(self):
+        """Test background services report their owning process"""
+        response = self.session.get(f'{self.base_url}/admin/performance')
+        self.assertEqual(response.status_code, 200)
+
+        services = response.json()['background_services']
+        for field in ['owner', 'pid', 'started_at', 'services']:
+            self.assertIn(field, services)
+        # Only the owning process has started them
+        self.assertEqual(services['owner'], services['started_at'] is not None)
+        print(f"✅ Background services status passed (owner={services['owner']}, {services['services']})")
 
 class LoadTestSuite(unittest.TestCase):
     """Load testing for performance validation"""
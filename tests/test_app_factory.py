@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Application factory tests: cheap imports and isolated app instances.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+HEAVY_MODULES = ['pandas', 'numpy', 'pyarrow', 'psutil', 'flask_socketio']
+
+class AppFactoryTestSuite(unittest.TestCase):
+    """create_app() and lazy import checks"""
+
+    def test_01_import_is_lazy(self):
+        """Test that importing the app module neither builds an app nor loads heavy modules"""
+        code = (
+            "import sys, app, data_loader\n"
+            "assert 'app' not in vars(app), 'default app built on import'\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=BACKEND_DIR, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), '[]', f"Heavy modules imported on startup: {result.stdout}")
+        print("✅ Lazy import passed")
+
+    def test_02_create_app_with_overrides(self):
+        """Test that create_app() applies config overrides and records startup phases"""
+        from app import create_app
+        with tempfile.TemporaryDirectory() as tmpdir:
+            app = create_app({
+                'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmpdir, 'factory.db')}",
+                'LOAD_CSV_ON_STARTUP': False,
+                'LOG_FILE': '',
+                'TESTING': True
+            })
+            try:
+                self.assertIn('api.get_departments', app.view_functions)
+                self.assertEqual(list(app.extensions['startup_timings']),
+                                 ['extensions', 'create_tables', 'default_admin'])
+
+                response = app.test_client().get('/api/departments')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.get_json(), [])
+            finally:
+                from app_testcase import reset_singletons
+                from models import db
+                with app.app_context():
+                    db.session.remove()
+                    db.engine.dispose()
+                app.extensions['db_routing'].dispose()
+                reset_singletons()
+        print("✅ App factory passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
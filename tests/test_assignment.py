@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Auto-assignment tests: least-loaded assignment, incremental counters, rollback and rebalancing.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy.orm import Session
+from models import db, User, Department, ComplaintCategory, Complaint, Notification
+
+class AssignmentTestSuite(AppTestCase):
+    """AutoAssigner and its endpoints against a temporary SQLite app"""
+
+    CONFIG = {
+        'ASSIGNMENT_RECONCILE_SECONDS': 3600
+    }
+
+    @classmethod
+    def seed(cls):
+        from assignment import auto_assigner
+        cls.assigner = auto_assigner
+        cse, ee = Department(name='Computer Science', code='CSE'), Department(name='Electrical', code='EE')
+        db.session.add_all([cse, ee])
+        db.session.flush()
+        lab = ComplaintCategory(name='Lab Equipment', department_id=cse.id, priority_level='High')
+        power = ComplaintCategory(name='Power Supply', department_id=ee.id, priority_level='Low')
+        admins = [User(name=f'CSE Admin {i}', email=f'cse{i}@college.edu', role='admin', department_id=cse.id)
+                  for i in range(2)]
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([lab, power, student, *admins])
+        db.session.commit()
+        cls.cse_id, cls.ee_id, cls.lab_id, cls.power_id = cse.id, ee.id, lab.id, power.id
+        cls.student_id = student.id
+        cls.cse_admins = sorted(u.id for u in User.query.filter_by(role='admin', department_id=cse.id))
+        cls.all_admins = sorted(u.id for u in User.query.filter_by(role='admin'))
+
+    def submit(self, category='lab', urgency=1):
+        category_id, department_id = (self.lab_id, self.cse_id) if category == 'lab' else (self.power_id, self.ee_id)
+        response = self.client.post('/api/complaints', json={
+            'title': 'Broken equipment', 'description': 'Something in the lab is broken again',
+            'category_id': category_id, 'department_id': department_id, 'user_id': self.student_id,
+            'urgency_level': urgency
+        })
+        self.assertEqual(response.status_code, 201)
+        return response.get_json()
+
+    def test_01_new_complaints_go_to_least_loaded_admin(self):
+        """Test that submissions spread over the department's admins by weighted load"""
+        from assignment import workload
+        reconciles = self.assigner.reconciles
+        assigned = [self.submit()['assigned_to'] for _ in self.cse_admins]
+        self.assertEqual(sorted(assigned), self.cse_admins)  # one each
+        urgent = self.submit(urgency=5)  # High x urgency 5 = 6.0
+        self.assertEqual(urgent['assigned_to'], self.cse_admins[0])
+        self.assertEqual(self.submit()['assigned_to'], self.cse_admins[1])
+
+        self.assertEqual(self.assigner.loads[self.cse_admins[0]], workload('High', 1) + workload('High', 5))
+        self.assertEqual(self.assigner.reconciles, reconciles + 1)  # counted once, then kept incrementally
+
+        # A department without admins of its own falls back to every admin
+        self.assertIn(self.submit('power')['assigned_to'], self.all_admins)
+        with self.app.app_context():
+            alert = Notification.query.filter_by(type='complaint_assigned', complaint_id=urgent['id']).one()
+            self.assertEqual(alert.user_id, self.cse_admins[0])
+        self.__class__.urgent_id = urgent['id']
+        print("✅ Least-loaded assignment passed")
+
+    def test_02_counters_follow_status_changes_and_rollbacks(self):
+        """Test that closing a complaint lowers the load and a rolled-back assignment is released"""
+        from assignment import workload
+        admin_id = self.cse_admins[0]
+        before = self.assigner.loads[admin_id]
+        response = self.client.post('/api/complaints/bulk-update', json={
+            'complaint_ids': [self.urgent_id], 'action': 'status', 'value': 'Resolved'
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.assigner.loads[admin_id], before - workload('High', 5))
+
+        loads = dict(self.assigner.loads)
+        with self.app.test_request_context():
+            complaint = Complaint(complaint_id='ROLLBACK1', title='Rolled back', description='Never committed',
+                                  category_id=self.lab_id, department_id=self.cse_id, student_id=self.student_id,
+                                  priority='Critical')
+            self.assertIsNotNone(self.assigner.assign(complaint))
+            self.assertNotEqual(self.assigner.loads, loads)
+            db.session.add(complaint)
+            db.session.flush()
+            db.session.rollback()
+        self.assertEqual(self.assigner.loads, loads)
+        print("✅ Incremental counters passed")
+
+    def test_03_rebalance_evens_out_loads(self):
+        """Test that rebalance sees other processes' writes and moves Pending work to idle admins"""
+        from assignment import workload
+        busy = self.cse_admins[-1]
+        with self.app.app_context(), Session(db.engine) as other_process:
+            other_process.add_all([Complaint(
+                complaint_id=f'EXT{i:04d}', title='Assigned elsewhere', description='Written by another worker',
+                category_id=self.lab_id, department_id=self.cse_id, student_id=self.student_id,
+                priority='Medium', assigned_to=busy
+            ) for i in range(6)] + [Complaint(
+                complaint_id='EXTEE01', title='Unassigned', description='No admin yet',
+                category_id=self.power_id, department_id=self.ee_id, student_id=self.student_id, priority='Low'
+            )])
+            other_process.commit()
+
+        rebalance = '/api/admin/assignments/rebalance'
+        self.assertNotEqual(self.client.post(rebalance, json={}).status_code, 200)  # admins only
+        self.assertNotEqual(self.client.get('/api/admin/assignments/workload').status_code, 200)
+        self.login_admin()
+        self.assertEqual(self.client.post(rebalance, json={'max_moves': 'lots'}).status_code, 400)
+        self.assertEqual(self.client.post(rebalance, json={'department_id': 'CSE'}).status_code, 400)
+
+        body = self.client.post(rebalance, json={'department_id': str(self.cse_id)}).get_json()
+        self.assertGreater(body['moved'], 0)
+        self.assertEqual(body['assigned'], 0)  # the EE complaint is outside this department
+        self.assertTrue(all(change['from'] == busy for change in body['changes']))
+        cse_loads = [w['load'] for w in body['workload'] if w['admin_id'] in self.cse_admins]
+        self.assertLessEqual(max(cse_loads) - min(cse_loads), workload('High', 5))
+
+        with self.app.app_context():
+            self.assigner.reconcile()
+        self.assertEqual([w['load'] for w in self.client.get('/api/admin/assignments/workload').get_json()
+                          if w['admin_id'] in self.cse_admins], sorted(cse_loads, reverse=True))
+
+        body = self.client.post(rebalance, json={}).get_json()
+        self.assertEqual(body['assigned'], 1)
+        self.assertIn(body['changes'][0]['to'], self.all_admins)
+        print("✅ Rebalance passed")
+
+    def test_04_form_values_are_assigned(self):
+        """Test that string values, as the browser form posts them, are converted and assigned"""
+        from assignment import workload
+        loads = dict(self.assigner.loads)
+        response = self.client.post('/api/complaints', json={
+            'title': 'Broken equipment', 'description': 'Something in the lab is broken again',
+            'category_id': str(self.lab_id), 'department_id': str(self.cse_id), 'user_id': str(self.student_id),
+            'urgency_level': '3'
+        })
+        self.assertEqual(response.status_code, 201)
+        body = response.get_json()
+        self.assertEqual(body['urgency_level'], 3)
+        self.assertIn(body['assigned_to'], self.cse_admins)
+        self.assertEqual(self.assigner.loads[body['assigned_to']],
+                         loads[body['assigned_to']] + workload('High', 3))
+
+        response = self.client.post('/api/complaints', json={
+            'title': 'Broken equipment', 'description': 'Something in the lab is broken again',
+            'category_id': str(self.lab_id), 'department_id': str(self.cse_id), 'user_id': str(self.student_id),
+            'urgency_level': 'urgent'
+        })
+        self.assertEqual(response.status_code, 400)
+        print("✅ Form value assignment passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Background service tests: the single-owner lock, start/stop order and service registration.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint
+from background import BackgroundLock, BackgroundServices
+
+class Recorder:
+    """Service that records start/stop calls in a shared log"""
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def start(self):
+        self.log.append(('start', self.name))
+
+    def stop(self):
+        self.log.append(('stop', self.name))
+
+class BackgroundServicesTestSuite(AppTestCase):
+    """BackgroundLock and BackgroundServices against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        db.session.add_all([Complaint(complaint_id=f'CMP{i:04d}', title=f'Complaint {i}', description='Monitored',
+                                      category_id=category.id, department_id=department.id,
+                                      student_id=student.id) for i in range(3)])
+        db.session.commit()
+        cls.engine = db.engine
+
+    def lock_file(self, name='background.lock'):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_01_lock_has_one_owner(self):
+        """Test that a second process (another lock on the same file) waits until the owner releases"""
+        owner, standby = BackgroundLock(self.engine, self.lock_file()), BackgroundLock(self.engine, self.lock_file())
+        self.assertTrue(owner.acquire())
+        self.assertTrue(owner.acquire())  # re-entrant for the owner
+        self.assertFalse(standby.acquire())
+        self.assertFalse(standby.held)
+        with open(self.lock_file()) as handle:
+            self.assertEqual(handle.read(), str(os.getpid()))
+        owner.release()
+        self.assertTrue(standby.acquire())
+        standby.release()
+        self.assertEqual(BackgroundLock(self.engine).lock_file,
+                         os.path.join(self.tmpdir.name, 'test.db') + '.background.lock')
+        print("✅ Background lock passed")
+
+    def test_02_only_the_owner_starts_services(self):
+        """Test that services start once, in order, and stop in reverse when the owner stops"""
+        log = []
+        owner, standby = BackgroundServices(), BackgroundServices()
+        for services in (owner, standby):
+            services.register('first', Recorder('first', log))
+            services.register('second', Recorder('second', log))
+
+        self.assertTrue(owner.start(self.engine, self.lock_file('services.lock')))
+        self.assertTrue(owner.start(self.engine, self.lock_file('services.lock')))  # already running
+        self.assertFalse(standby.start(self.engine, self.lock_file('services.lock')))
+        self.assertEqual(log, [('start', 'first'), ('start', 'second')])
+        self.assertEqual(standby.status()['owner'], False)
+
+        owner.register('late', Recorder('late', log))  # registered while running: starts at once
+        self.assertEqual(log[-1], ('start', 'late'))
+        self.assertEqual(owner.status()['services'], ['first', 'second', 'late'])
+
+        del log[:]
+        owner.stop()
+        self.assertEqual(log, [('stop', 'late'), ('stop', 'second'), ('stop', 'first')])
+        self.assertTrue(standby.start(self.engine, self.lock_file('services.lock')))
+        standby.stop()
+        print("✅ Service ownership passed")
+
+    def test_03_startup_runs_the_realtime_monitor(self):
+        """Test that create_app registers the monitor and the runners' start call runs it in the app context"""
+        from background import background_services
+        from monitoring import monitor
+        self.assertIs(background_services.services['realtime-monitor'], monitor)
+        self.assertIs(monitor.app, self.app)
+        self.assertFalse(any(thread.is_alive() for thread in monitor.threads))  # not started by create_app
+
+        try:
+            # What run_server.py and background.py do once the app is built
+            self.assertTrue(background_services.start(self.engine, self.lock_file('runner.lock')))
+            self.assertTrue(all(thread.is_alive() for thread in monitor.threads))
+            deadline = time.time() + 5
+            while monitor.complaint_stats.get('total') != 3 and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            background_services.stop()
+            background_services.lock = None
+        self.assertEqual(monitor.complaint_stats['total'], 3)
+        self.assertEqual(monitor.complaint_stats['departments'], {'Computer Science': 3})
+        for thread in monitor.threads:
+            thread.join(5)
+        self.assertFalse(any(thread.is_alive() for thread in monitor.threads))
+        print("✅ Realtime monitor service passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Batch endpoint tests: combined responses, shared user/session, cost limits.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import event
+from models import db, User, Department, Course, ComplaintCategory
+
+class BatchTestSuite(AppTestCase):
+    """/api/batch against a temporary SQLite app"""
+
+    CONFIG = {
+        'BATCH_MAX_COST': 10
+    }
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        db.session.add_all([
+            Course(name='B.Tech CSE', code='BTCSE', duration_years=4, department_id=department.id, degree_type='UG'),
+            ComplaintCategory(name='Lab Equipment', department_id=department.id),
+            User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        ])
+        db.session.commit()
+
+    def test_01_batch_matches_individual_requests(self):
+        """Test that each item carries the same status and body as a direct GET"""
+        client = self.app.test_client()
+        paths = ['/api/departments', '/api/courses', '/api/complaint-categories', '/api/courses/1', '/api/nope']
+        for concurrent in (False, True):
+            response = client.post('/api/batch', json={
+                'requests': [{'id': path, 'path': path} for path in paths], 'concurrent': concurrent})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers['X-Batch-Cost'], '5')
+            items = response.get_json()['responses']
+            self.assertEqual([item['id'] for item in items], paths)
+            for item in items:
+                direct = client.get(item['id'])
+                self.assertEqual(item['status'], direct.status_code, item['id'])
+                self.assertEqual(item['body'], direct.get_json(), item['id'])
+        print("✅ Batch responses passed")
+
+    def test_02_logged_in_user_is_loaded_once(self):
+        """Test that sub-requests see the caller's login and reuse the loaded user"""
+        client = self.app.test_client()
+        client.post('/api/login', json={'student_id': '24CSE001'})
+
+        user_queries = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if 'FROM users' in statement:
+                user_queries.append(statement)
+        with self.app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            response = client.post('/api/batch', json={'requests': ['/api/me', '/api/me', '/api/me']})
+        finally:
+            with self.app.app_context():
+                event.remove(db.engine, 'before_cursor_execute', record)
+        items = response.get_json()['responses']
+        self.assertEqual({item['status'] for item in items}, {200})
+        self.assertEqual({item['body']['student_id'] for item in items}, {'24CSE001'})
+        self.assertEqual(len(user_queries), 1)
+
+        response = client.post('/api/batch', json={'requests': ['/api/me', '/api/me'], 'concurrent': True})
+        self.assertEqual([item['body']['student_id'] for item in response.get_json()['responses']],
+                         ['24CSE001', '24CSE001'])
+        print("✅ Shared login passed")
+
+    def test_03_invalid_batches_are_rejected(self):
+        """Test cost limit, nesting, methods and payload validation"""
+        client = self.app.test_client()
+        cases = {
+            'cost': {'requests': ['/api/complaints', '/api/complaints', '/api/departments']},  # 5 + 5 + 1 > 10
+            'method': {'requests': [{'path': '/api/complaints', 'method': 'POST'}]},
+            'path': {'requests': [{'path': 'api/departments'}]},
+            'empty': {'requests': []}
+        }
+        for name, payload in cases.items():
+            response = client.post('/api/batch', json=payload)
+            self.assertEqual(response.status_code, 400, name)
+            self.assertIn('error', response.get_json())
+        self.assertIn('exceeds the limit of 10', client.post('/api/batch', json=cases['cost']).get_json()['error'])
+
+        # Sub-requests are GETs, so a nested batch is just a 405 item
+        response = client.post('/api/batch', json={'requests': ['/api/batch']})
+        self.assertEqual(response.get_json()['responses'][0]['status'], 405)
+        print("✅ Batch validation passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
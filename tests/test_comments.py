@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Batched comment retrieval tests: grouping, latest-K, query count and index use.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from models import db, User, Department, ComplaintCategory, Complaint, Comment
+
+class BatchedCommentsTestSuite(AppTestCase):
+    """/api/comments against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        now = datetime.utcnow()
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        admin = User.query.filter_by(role='admin').first()
+        complaints = [
+            Complaint(complaint_id=f'CMP{i:04d}', title=f'Complaint {i}', description='Broken',
+                      category_id=category.id, department_id=department.id, student_id=student.id)
+            for i in range(4)
+        ]
+        db.session.add_all(complaints)
+        db.session.flush()
+        for index, complaint in enumerate(complaints[:3]):
+            for n in range(index * 2):  # 0, 2 and 4 comments
+                db.session.add(Comment(complaint_id=complaint.id, admin_id=admin.id, admin_name=admin.name,
+                                       text=f'Update {n}', created_at=now + timedelta(minutes=n)))
+        db.session.commit()
+        cls.ids = [c.id for c in complaints]
+
+    def batch(self, query):
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(Engine, 'before_cursor_execute', record)  # reads may go to the read engine
+        try:
+            response = self.client.get(f'/api/comments?{query}')
+        finally:
+            event.remove(Engine, 'before_cursor_execute', record)
+        return response, statements
+
+    def test_01_grouped_like_individual_requests(self):
+        """Test that each group equals the per-complaint endpoint, in two queries"""
+        missing_id = max(self.ids) + 100
+        response, statements = self.batch(f"complaint_ids={','.join(map(str, self.ids))},{missing_id}")
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body['missing'], [missing_id])
+        self.assertEqual(set(body['comments']), {str(i) for i in self.ids})
+        for complaint_id in self.ids:
+            single = self.client.get(f'/api/complaints/{complaint_id}/comments').get_json()
+            self.assertEqual(body['comments'][str(complaint_id)], single)
+        self.assertEqual(len([s for s in statements if 'FROM comments' in s or 'FROM complaints' in s]), 2)
+        print("✅ Grouped comments passed")
+
+    def test_02_latest_k_per_complaint(self):
+        """Test that latest=K keeps each complaint's newest K comments, oldest first"""
+        response, _ = self.batch(f"complaint_ids={','.join(map(str, self.ids))}&latest=2")
+        groups = response.get_json()['comments']
+        self.assertEqual([c['text'] for c in groups[str(self.ids[2])]], ['Update 2', 'Update 3'])
+        self.assertEqual([c['text'] for c in groups[str(self.ids[1])]], ['Update 0', 'Update 1'])
+        self.assertEqual(groups[str(self.ids[0])], [])
+        print("✅ Latest K passed")
+
+    def test_03_validation_and_index(self):
+        """Test bad parameters and that the IN query searches the complaint index"""
+        for query in ('', 'complaint_ids=', 'complaint_ids=a,b', 'complaint_ids=1&latest=0',
+                      'complaint_ids=' + ','.join(str(i) for i in range(101))):
+            response, _ = self.batch(query)
+            self.assertEqual(response.status_code, 400, query)
+        with self.app.app_context():
+            plan = db.session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM comments WHERE complaint_id IN (1, 2, 3) "
+                "ORDER BY complaint_id, created_at"
+            )).all()
+        self.assertIn('ix_comments_complaint_created', ' '.join(str(row[-1]) for row in plan))
+        print("✅ Validation and index passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
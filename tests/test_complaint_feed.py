@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Complaint feed tests: CSV-compatible records from the DB, keyset pages and NDJSON.
+"""
+
+import json
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint, Comment
+
+CSV_FIELDS = ['complaint_id', 'student_id', 'student_name', 'title', 'description', 'category', 'department',
+              'status', 'priority', 'urgency_level', 'created_at', 'updated_at', 'resolved_at', 'admin_comments']
+
+class ComplaintFeedTestSuite(AppTestCase):
+    """/api/all-student-complaints and /api/student-complaints against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        created = datetime(2024, 12, 10, 9, 30)
+        department = Department(name='Hostel Management', code='HM')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Infrastructure', department_id=department.id)
+        students = [User(name=f'Student {i}', email=f's{i}@college.edu', role='student',
+                         student_id=f'21CSE00{i}') for i in (1, 2)]
+        db.session.add_all([category, *students])
+        db.session.flush()
+        admin = User.query.filter_by(role='admin').first()
+        for i in range(5):
+            complaint = Complaint(
+                complaint_id=f'COMP00{i}', title=f'Complaint {i}', description='WiFi is down',
+                category_id=category.id, department_id=department.id, student_id=students[i % 2].id,
+                urgency_level=3, created_at=created + timedelta(hours=i), updated_at=created + timedelta(hours=i),
+                status='Resolved' if i == 0 else 'Pending',
+                resolved_at=created + timedelta(days=2) if i == 0 else None
+            )
+            db.session.add(complaint)
+            if i == 0:
+                for n, text in enumerate(['Checking the router', 'Router replaced']):
+                    complaint.comments.append(Comment(admin_id=admin.id, admin_name=admin.name, text=text,
+                                                      created_at=created + timedelta(days=n)))
+        db.session.commit()
+
+    def test_01_full_feed_keeps_csv_fields(self):
+        """Test the streamed array: CSV field names, id order, nulls and the latest comment"""
+        response = self.client.get('/api/all-student-complaints')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Length', response.headers)  # streamed
+        feed = response.get_json()
+        self.assertEqual([c['complaint_id'] for c in feed], [f'COMP00{i}' for i in range(5)])
+        self.assertEqual(set(feed[0]), set(CSV_FIELDS))
+        self.assertEqual(feed[0], {
+            'complaint_id': 'COMP000', 'student_id': '21CSE001', 'student_name': 'Student 1',
+            'title': 'Complaint 0', 'description': 'WiFi is down', 'category': 'Infrastructure',
+            'department': 'Hostel Management', 'status': 'Resolved', 'priority': 'Medium', 'urgency_level': 3,
+            'created_at': '2024-12-10 09:30:00', 'updated_at': '2024-12-10 09:30:00',
+            'resolved_at': '2024-12-12 09:30:00', 'admin_comments': 'Router replaced'
+        })
+        self.assertIsNone(feed[1]['resolved_at'])
+        self.assertIsNone(feed[1]['admin_comments'])
+        print("✅ Full feed passed")
+
+    def test_02_keyset_pages(self):
+        """Test that following X-Next-Cursor walks the whole feed once"""
+        full = self.client.get('/api/all-student-complaints').get_json()
+        pages, path = [], '/api/all-student-complaints?limit=2'
+        while path:
+            response = self.client.get(path)
+            self.assertIn('Content-Length', response.headers)
+            pages.append(response.get_json())
+            cursor = response.headers.get('X-Next-Cursor')
+            path = f'/api/all-student-complaints?limit=2&cursor={cursor}' if cursor else None
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual([c for page in pages for c in page], full)
+        print("✅ Keyset pages passed")
+
+    def test_03_ndjson_and_student_filter(self):
+        """Test NDJSON via ?format= and Accept, and the per-student feed"""
+        full = self.client.get('/api/all-student-complaints').get_json()
+        for query, headers in (('?format=ndjson', {}), ('', {'Accept': 'application/x-ndjson'})):
+            response = self.client.get(f'/api/all-student-complaints{query}', headers=headers)
+            self.assertEqual(response.mimetype, 'application/x-ndjson')
+            lines = response.get_data(as_text=True).splitlines()
+            self.assertEqual([json.loads(line) for line in lines], full)
+
+        mine = self.client.get('/api/student-complaints/21CSE002').get_json()
+        self.assertEqual([c['complaint_id'] for c in mine], ['COMP001', 'COMP003'])
+        self.assertEqual(self.client.get('/api/student-complaints/nobody').get_json(), [])
+        print("✅ NDJSON and student feed passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
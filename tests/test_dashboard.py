@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Admin dashboard payload tests: contents, conditional GETs and invalidation.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint
+
+class DashboardTestSuite(AppTestCase):
+    """/api/admin/dashboard against a temporary SQLite app"""
+
+    CONFIG = {
+        'DASHBOARD_RECENT_LIMIT': 3,
+        'DASHBOARD_CHECK_SECONDS': 3600
+    }
+
+    @classmethod
+    def seed(cls):
+        from dashboard import dashboard_cache
+        cls.cache = dashboard_cache
+        now = datetime.utcnow()
+        cse, ee = Department(name='Computer Science', code='CSE'), Department(name='Electrical', code='EE')
+        db.session.add_all([cse, ee])
+        db.session.flush()
+        lab = ComplaintCategory(name='Lab Equipment', department_id=cse.id, priority_level='High')
+        power = ComplaintCategory(name='Power Supply', department_id=ee.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([lab, power, student])
+        db.session.flush()
+        rows = [  # (days ago, department, category, status, priority)
+            (0, cse, lab, 'Pending', 'High'),
+            (2, cse, lab, 'In Progress', 'High'),
+            (5, ee, power, 'Resolved', 'Medium'),
+            (9, ee, power, 'Resolved', 'Low'),
+            (40, cse, lab, 'Rejected', 'Medium')
+        ]
+        for index, (days_ago, department, category, status, priority) in enumerate(rows):
+            created = now - timedelta(days=days_ago, minutes=index)
+            db.session.add(Complaint(
+                complaint_id=f'CMP{index:04d}', title=f'Complaint {index}', description='x' * 300,
+                category_id=category.id, department_id=department.id, student_id=student.id,
+                status=status, priority=priority, created_at=created, updated_at=created,
+                resolved_at=created + timedelta(hours=10) if status == 'Resolved' else None
+            ))
+        db.session.commit()
+        cls.cse_id = cse.id
+
+    def setUp(self):
+        self.admin = self.app.test_client()
+        self.login_admin(self.admin)
+
+    def dashboard(self):
+        response = self.admin.get('/api/admin/dashboard')
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_01_payload_matches_stats(self):
+        """Test counts against /api/stats plus recent complaints, departments and charts"""
+        payload = self.dashboard()
+        stats = self.client.get('/api/stats').get_json()
+        counts = payload['counts']
+        for key in ('total', 'pending', 'in_progress', 'resolved', 'rejected', 'avg_resolution_hours', 'resolution_rate'):
+            self.assertEqual(counts[key], stats[key], key)
+        self.assertEqual((counts['today'], counts['this_week'], counts['this_month']), (1, 3, 4))
+        self.assertEqual(counts['students'], 1)
+
+        recent = payload['recent_complaints']
+        self.assertEqual([c['complaint_id'] for c in recent], ['CMP0000', 'CMP0001', 'CMP0002'])
+        self.assertEqual(recent[0]['department'], 'Computer Science')
+        self.assertEqual(recent[0]['student_name'], 'Student 1')
+        self.assertEqual(len(recent[0]['description']), 200)
+
+        cse = next(d for d in payload['departments'] if d['id'] == self.cse_id)
+        self.assertEqual((cse['total'], cse['Pending'], cse['In Progress'], cse['Rejected']), (3, 1, 1, 1))
+        ee = next(d for d in payload['departments'] if d['name'] == 'Electrical')
+        self.assertEqual(ee['avg_resolution_hours'], 10.0)
+
+        charts = payload['charts']
+        self.assertEqual(dict(zip(charts['status']['labels'], charts['status']['values'])),
+                         {'Pending': 1, 'In Progress': 1, 'Resolved': 2, 'Rejected': 1})
+        self.assertEqual(dict(zip(charts['category']['labels'], charts['category']['values'])), stats['categories'])
+        self.assertEqual(len(charts['daily']['values']), 31)
+        self.assertEqual(sum(charts['daily']['values']), 4)
+        print("✅ Dashboard payload passed")
+
+    def test_02_conditional_get(self):
+        """Test that an unchanged payload answers If-None-Match with 304"""
+        etag = self.admin.get('/api/admin/dashboard').headers['ETag']
+        response = self.admin.get('/api/admin/dashboard', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        print("✅ Conditional GET passed")
+
+    def test_03_writes_invalidate(self):
+        """Test local invalidation on commit, and that logins do not rebuild"""
+        self.dashboard()
+        builds = self.cache.builds
+        self.client.post('/api/login', json={'student_id': '24CSE001'})  # touches users.last_login
+        self.dashboard()
+        self.assertEqual(self.cache.builds, builds)
+
+        with self.app.app_context():
+            complaint_id = Complaint.query.filter_by(complaint_id='CMP0000').one().id
+        self.client.patch(f'/api/complaints/{complaint_id}/status', json={'status': 'Resolved'})
+        counts = self.dashboard()['counts']
+        self.assertEqual((counts['pending'], counts['resolved']), (0, 3))
+        self.assertEqual(self.cache.builds, builds + 1)
+        print("✅ Local invalidation passed")
+
+    def test_04_other_process_write_is_noticed(self):
+        """Test that a write from elsewhere is picked up after the check interval"""
+        self.dashboard()
+        with self.app.app_context():
+            table = Complaint.__table__
+            with db.engine.begin() as conn:
+                conn.execute(table.update().where(table.c.complaint_id == 'CMP0001')
+                             .values(status='Rejected', updated_at=datetime.utcnow() + timedelta(seconds=1)))
+        rejected = self.dashboard()['counts']['rejected']
+        self.cache.checked_at -= self.cache.check_seconds
+        self.assertEqual(self.dashboard()['counts']['rejected'], rejected + 1)
+        print("✅ Cross-process check passed")
+
+    def test_05_admins_only_and_daily_rollover(self):
+        """Test that only admins get the payload and that a new day rebuilds it without any write"""
+        self.assertNotEqual(self.app.test_client().get('/api/admin/dashboard').status_code, 200)
+        student = self.app.test_client()
+        student.post('/api/login', json={'student_id': '24CSE001'})
+        self.assertEqual(student.get('/api/admin/dashboard').status_code, 403)
+
+        etag = self.admin.get('/api/admin/dashboard').headers['ETag']
+        builds = self.cache.builds
+        today = datetime.utcnow().date().isoformat()
+        self.assertTrue(self.cache.snapshot.version.startswith(today))
+        yesterday = (datetime.utcnow().date() - timedelta(days=1)).isoformat()
+        self.cache.snapshot.version = self.cache.snapshot.version.replace(today, yesterday, 1)  # built before midnight
+        self.cache.checked_at -= self.cache.check_seconds
+        response = self.admin.get('/api/admin/dashboard', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.cache.builds, builds + 1)
+        print("✅ Dashboard access and rollover passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
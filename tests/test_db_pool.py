@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Connection pool tests: sizing math, checkout wait metrics, timeouts and the pool endpoint.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from db_pool import pool_sizing, pool_metrics, InstrumentedQueuePool
+
+class DbPoolTestSuite(AppTestCase):
+    """Pool sizing and metrics against a temporary SQLite app"""
+
+    CONFIG = {
+        'WEB_CONCURRENCY': 4,
+        'WEB_THREADS': 8,
+        'DB_MAX_CONNECTIONS': 90,
+        'DB_POOL_SIZING': pool_sizing(4, 8, 90)
+    }
+
+    def small_engine(self, name):
+        return create_engine(f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}",
+                             poolclass=InstrumentedQueuePool, pool_logging_name=name,
+                             pool_size=1, max_overflow=0, pool_timeout=0.1)
+
+    def test_01_sizing_splits_the_budget(self):
+        """Test that the connection budget is split per process, one pooled connection per thread"""
+        self.assertEqual(pool_sizing(1, 8, 90), {'pool_size': 8, 'max_overflow': 82})
+        self.assertEqual(pool_sizing(4, 8, 90), {'pool_size': 8, 'max_overflow': 14})
+        self.assertEqual(pool_sizing(12, 8, 90), {'pool_size': 7, 'max_overflow': 0})  # budget below threads
+        self.assertEqual(pool_sizing(200, 8, 90), {'pool_size': 1, 'max_overflow': 0})
+        self.assertEqual(pool_sizing(0, 8, 90), pool_sizing(1, 8, 90))
+        for workers in range(1, 20):
+            sizing = pool_sizing(workers, 8, 90)
+            self.assertLessEqual(workers * (sizing['pool_size'] + sizing['max_overflow']), max(90, workers))
+        print("✅ Pool sizing passed")
+
+    def test_02_slow_checkouts_and_timeouts_are_recorded(self):
+        """Test that waits past the threshold warn once and exhausted pools count timeouts"""
+        engine = self.small_engine('test-waits')
+        metrics = pool_metrics.get('test-waits')
+        warn_wait_ms = pool_metrics.warn_wait_ms
+        pool_metrics.configure(warn_wait_ms=50)
+        try:
+            held = engine.connect()
+            release = threading.Timer(0.1, held.close)
+            release.start()
+            with self.assertLogs('db_pool', 'WARNING') as logs:
+                engine.pool.timeout = 5
+                with engine.connect():
+                    pass
+            release.join()
+            self.assertIn('Slow DB pool checkout (test-waits)', logs.output[0])
+            self.assertEqual((metrics.checkouts, metrics.slow_checkouts), (2, 1))
+            self.assertGreaterEqual(metrics.max_wait_ms, 50)
+
+            engine.pool.timeout = 0.1
+            with engine.connect(), self.assertLogs('db_pool', 'ERROR'):
+                self.assertRaises(PoolTimeoutError, engine.connect)
+            snapshot = metrics.snapshot(engine.pool)
+            self.assertEqual(snapshot['timeouts'], 1)
+            self.assertEqual((snapshot['pool_size'], snapshot['max_overflow'], snapshot['checked_out']), (1, 0, 0))
+        finally:
+            pool_metrics.configure(warn_wait_ms=warn_wait_ms)
+            engine.dispose()
+        print("✅ Pool wait metrics passed")
+
+    def test_03_pool_endpoint_reports_sizing_and_usage(self):
+        """Test that the pool endpoint is for admins, and the primary pool is instrumented and sized"""
+        self.assertNotEqual(self.client.get('/api/admin/db-pool').status_code, 200)
+        self.login_admin()
+        checkouts = self.client.get('/api/admin/db-pool').get_json()['pool']['checkouts']
+        self.client.get('/api/departments')
+        body = self.client.get('/api/admin/db-pool').get_json()
+        self.assertEqual(body['pool']['name'], 'primary')
+        self.assertGreater(body['pool']['checkouts'], checkouts)
+        self.assertEqual(body['sizing'], {'workers': 4, 'threads': 8, 'max_connections': 90,
+                                          'pool_size': 8, 'max_overflow': 14})
+        self.assertEqual([pool['name'] for pool in body['read_pools']], ['sqlite-reader'])
+        self.assertLessEqual(body['pool']['max_overflow'], self.app.config['SQLITE_MAX_OVERFLOW'])  # one writer
+        print("✅ Pool endpoint passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Read replica routing tests: replica reads, read-your-writes and the lag fallback to the primary.
+"""
+
+import os
+import sqlite3
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint
+
+class DbRoutingTestSuite(AppTestCase):
+    """A second SQLite file as a read replica of a temporary app"""
+
+    @classmethod
+    def config(cls):
+        cls.primary_path = os.path.join(cls.tmpdir.name, 'test.db')
+        cls.replica_path = os.path.join(cls.tmpdir.name, 'replica.db')
+        return {
+            'DATABASE_REPLICA_URLS': [f'sqlite:///{cls.replica_path}'],
+            'REPLICA_MAX_LAG_SECONDS': 5,
+            'REPLICA_CHECK_SECONDS': 0,  # re-check on every read
+            'SQLITE_READ_POOL_SIZE': 0
+        }
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        complaint = Complaint(complaint_id='CMP0001', title='Broken projector', description='Lab 2 projector',
+                              category_id=category.id, department_id=department.id, student_id=student.id)
+        marker = User(name='Replica Only', email='replica@college.edu', role='student', student_id='REPLICA')
+        db.session.add_all([complaint, marker])
+        db.session.commit()
+        cls.complaint_id = complaint.id
+        cls.replicate()
+        db.session.delete(marker)  # left on the replica only, so it shows which side served a read
+        db.session.commit()
+        cls.router = cls.app.extensions['db_routing']
+
+    @classmethod
+    def replicate(cls):
+        with sqlite3.connect(cls.primary_path) as primary, sqlite3.connect(cls.replica_path) as replica:
+            primary.backup(replica)
+
+    def served_by_replica(self, client=None):
+        students = (client or self.app.test_client()).get('/api/students').get_json()
+        return 'REPLICA' in {s['student_id'] for s in students}
+
+    def test_01_reads_go_to_the_replica(self):
+        """Test that read-only endpoints use an in-sync replica"""
+        self.assertTrue(self.served_by_replica())
+        self.assertEqual(self.router.status(), [{
+            'name': 'replica-1', 'healthy': True, 'checks_lag': True, 'lag_seconds': 0.0,
+            'max_lag_seconds': 5, 'last_error': None
+        }])
+        print("✅ Replica reads passed")
+
+    def test_02_writers_read_their_writes_from_the_primary(self):
+        """Test that a client that just wrote reads from the primary, and other clients do not"""
+        writer = self.app.test_client()
+        self.assertTrue(self.served_by_replica(writer))
+        response = writer.patch(f'/api/complaints/{self.complaint_id}/status', json={'status': 'In Progress'})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.served_by_replica(writer))
+        self.assertTrue(self.served_by_replica())
+        print("✅ Read-your-writes passed")
+
+    def test_03_lagging_replica_falls_back_to_the_primary(self):
+        """Test that a replica behind by more than the limit leaves rotation until it catches up"""
+        with self.app.app_context():
+            complaint = db.session.get(Complaint, self.complaint_id)
+            complaint.updated_at = datetime.utcnow() + timedelta(minutes=1)
+            db.session.commit()
+            primary_mark = complaint.updated_at
+
+        with self.assertLogs('db_routing', 'WARNING'):
+            self.assertFalse(self.served_by_replica())
+        status = self.router.status()[0]
+        self.assertFalse(status['healthy'])
+        self.assertGreater(status['lag_seconds'], 5)
+        self.assertIn('Replication lag', status['last_error'])
+        self.login_admin()
+        self.assertEqual(self.client.get('/api/admin/db-pool').get_json()['readers'], [status])
+
+        with sqlite3.connect(self.replica_path) as replica:
+            replica.execute('UPDATE complaints SET updated_at = ? WHERE id = ?',
+                            (primary_mark.isoformat(sep=' '), self.complaint_id))
+        self.assertTrue(self.served_by_replica())
+        self.assertTrue(self.router.status()[0]['healthy'])
+        print("✅ Replica lag fallback passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
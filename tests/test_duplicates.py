@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection tests: linking at submit time, cluster resolution and index catch-up.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy.orm import Session
+from models import db, User, Department, ComplaintCategory, Complaint, Notification
+
+OUTAGE = ('WiFi down in hostel block A', 'The WiFi in hostel block A has been down since this morning, '
+          'nobody on the second floor can connect to the network.')
+
+class DuplicatesTestSuite(AppTestCase):
+    """Duplicate index and cluster endpoints against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        from duplicates import duplicate_index
+        cls.index = duplicate_index
+        it, ee = Department(name='IT Services', code='IT'), Department(name='Electrical', code='EE')
+        db.session.add_all([it, ee])
+        db.session.flush()
+        network = ComplaintCategory(name='Network', department_id=it.id)
+        power = ComplaintCategory(name='Power Supply', department_id=ee.id)
+        students = [User(name=f'Student {i}', email=f's{i}@college.edu', role='student',
+                         student_id=f'24IT{i:03d}') for i in range(4)]
+        db.session.add_all([network, power, *students])
+        db.session.commit()
+        cls.it_id, cls.ee_id = it.id, ee.id
+        cls.network_id, cls.power_id = network.id, power.id
+        cls.student_ids = [s.id for s in students]
+        cls.admin_id = User.query.filter_by(role='admin').first().id
+
+    def submit(self, title, description, student=0, department='it'):
+        department_id, category_id = ((self.it_id, self.network_id) if department == 'it'
+                                      else (self.ee_id, self.power_id))
+        response = self.client.post('/api/complaints', json={
+            'title': title, 'description': description, 'category_id': category_id,
+            'department_id': department_id, 'user_id': self.student_ids[student]
+        })
+        self.assertEqual(response.status_code, 201)
+        return response.get_json()
+
+    def test_01_near_duplicates_are_linked(self):
+        """Test that reworded reports in the same department join one cluster"""
+        first = self.submit(*OUTAGE)
+        self.assertIsNone(first['cluster_id'])
+        self.assertEqual(first['possible_duplicates'], [])
+
+        second = self.submit('WiFi down in hostel block A!', OUTAGE[1].replace('this morning', 'morning'), student=1)
+        self.assertEqual(second['cluster_id'], first['id'])
+        self.assertEqual(second['possible_duplicates'][0]['id'], first['id'])
+        self.assertGreaterEqual(second['possible_duplicates'][0]['similarity'], 0.6)
+
+        third = self.submit(*OUTAGE, student=2)
+        self.assertEqual(third['cluster_id'], first['id'])  # joins the existing cluster, not a new one
+
+        other_department = self.submit(*OUTAGE, student=3, department='ee')
+        unrelated = self.submit('Projector broken in lab 3', 'The projector in lab 3 flickers and turns off '
+                                'after a few minutes of use.', student=3)
+        self.assertIsNone(other_department['cluster_id'])
+        self.assertIsNone(unrelated['cluster_id'])
+
+        cluster = self.client.get(f"/api/complaints/{second['id']}/duplicates").get_json()
+        self.assertEqual(cluster['cluster_id'], first['id'])
+        self.assertEqual([c['id'] for c in cluster['complaints']], [first['id'], second['id'], third['id']])
+        self.assertIsNone(self.client.get(f"/api/complaints/{unrelated['id']}/duplicates").get_json()['cluster_id'])
+
+        clusters = self.client.get('/api/complaint-clusters').get_json()
+        self.assertEqual([(c['cluster_id'], c['open_duplicates']) for c in clusters], [(first['id'], 2)])
+        with open(os.path.join(self.tmpdir.name, 'student_complaints.csv'), encoding='utf-8') as mirror:
+            self.assertEqual(len(mirror.readlines()), 6)  # header + five submissions, not the tracked data/ file
+        self.__class__.cluster_id = first['id']
+        print("✅ Duplicate linking passed")
+
+    def test_02_resolve_cluster(self):
+        """Test that resolving a cluster updates and notifies every member"""
+        resolve_url = f'/api/complaint-clusters/{self.cluster_id}/resolve'
+        self.assertNotEqual(self.client.post(resolve_url, json={}).status_code, 200)  # not logged in
+        student = self.app.test_client()
+        student.post('/api/login', json={'student_id': '24IT000'})
+        self.assertEqual(student.post(resolve_url, json={}).status_code, 403)
+
+        self.login_admin()
+        self.assertEqual(self.client.post(resolve_url, json={'status': 'Closed'}).status_code, 400)
+        self.assertEqual(self.client.post('/api/complaint-clusters/999999/resolve', json={}).status_code, 404)
+
+        response = self.client.post(resolve_url, json={'admin_comment': 'Access point replaced'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['updated_count'], 3)
+
+        cluster = self.client.get(f'/api/complaints/{self.cluster_id}/duplicates').get_json()
+        self.assertEqual({c['status'] for c in cluster['complaints']}, {'Resolved'})
+        for complaint in cluster['complaints']:
+            comments = self.client.get(f"/api/complaints/{complaint['id']}/comments").get_json()
+            self.assertIn('Access point replaced', comments[-1]['text'])
+            self.assertEqual(comments[-1]['admin_id'], self.admin_id)  # the logged-in admin, not the body
+        with self.app.app_context():
+            notified = {n.user_id for n in Notification.query.filter_by(type='complaint_update')}
+        self.assertEqual(notified, set(self.student_ids[:3]))
+        self.assertEqual(self.client.get('/api/complaint-clusters').get_json(), [])
+        print("✅ Cluster resolution passed")
+
+    def test_03_index_catches_up_and_rebuilds(self):
+        """Test that rows written elsewhere are picked up and that rebuild honours the window"""
+        title, description = 'Water leak in library', 'Water is leaking from the ceiling near the library ' \
+                                                       'reading room entrance onto the floor.'
+        with self.app.app_context():
+            with Session(db.engine) as other_process:
+                other_process.add_all([
+                    Complaint(complaint_id='EXT0001', title=title, description=description,
+                              category_id=self.network_id, department_id=self.it_id,
+                              student_id=self.student_ids[0]),
+                    Complaint(complaint_id='EXT0002', title='Old ' + title, description=description,
+                              category_id=self.network_id, department_id=self.it_id,
+                              student_id=self.student_ids[0], created_at=datetime.utcnow() - timedelta(days=30))
+                ])
+                other_process.commit()
+            recent_id, old_id = (Complaint.query.filter_by(complaint_id=cid).first().id for cid in ('EXT0001', 'EXT0002'))
+
+        duplicate = self.submit(title, description, student=1)
+        self.assertEqual(duplicate['possible_duplicates'][0]['id'], recent_id)
+        self.assertEqual(len(duplicate['possible_duplicates']), 1)  # the 30-day-old report is outside the window
+        self.assertIn(recent_id, self.index.entries)
+        self.assertNotIn(old_id, self.index.entries)
+
+        with self.app.app_context():
+            self.index.rebuild()
+            expected = {c.id for c in Complaint.query.filter(Complaint.id != old_id)}
+        self.assertEqual(set(self.index.entries), expected)
+        self.assertIsNotNone(self.index.status()['rebuild_ms'])
+        print("✅ Index catch-up passed")
+
+    def test_04_late_commits_below_max_id_are_indexed(self):
+        """Test that a lower id committed after a higher one (concurrent inserts) still gets indexed"""
+        projector = 'The projector in the seminar hall shows no picture at all during lectures.'
+
+        def commit_complaint(complaint_id, title):
+            with Session(db.engine) as other_process:
+                other_process.add(Complaint(id=complaint_id, complaint_id=f'LATE{complaint_id}', title=title,
+                                            description=projector, category_id=self.network_id,
+                                            department_id=self.it_id, student_id=self.student_ids[0]))
+                other_process.commit()
+
+        with self.app.app_context():
+            first_id = self.index.max_id + 1
+            commit_complaint(first_id + 1, 'Projector broken in seminar hall')  # committed first
+            self.assertEqual(self.index.find(Complaint(title='x' * 40, department_id=self.it_id)), [])
+            self.assertEqual(self.index.max_id, first_id + 1)
+
+            commit_complaint(first_id, 'Projector broken in the seminar hall')  # lower id, committed later
+            matches = self.index.find(Complaint(title='Projector broken in seminar hall', description=projector,
+                                                department_id=self.it_id))
+        self.assertIn(first_id, self.index.entries)
+        self.assertEqual({match[0] for match in matches}, {first_id, first_id + 1})
+        print("✅ Late commit catch-up passed")
+
+    def test_05_expiry_follows_created_at(self):
+        """Test that entries leaving the window are dropped from the entries, buckets and expiry heap"""
+        with self.app.app_context():
+            self.index.rebuild()
+            self.assertEqual(sorted(cid for _, cid in self.index.expiry), sorted(self.index.entries))
+            window = self.index.window
+            try:
+                self.index.window = timedelta(0)  # everything already indexed is now too old
+                with self.index.lock:
+                    self.index._catch_up()
+                self.assertEqual((self.index.entries, dict(self.index.buckets), self.index.expiry), ({}, {}, []))
+            finally:
+                self.index.window = window
+                self.index.rebuild()
+        self.assertTrue(self.index.entries)
+        print("✅ Window expiry passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+SLA escalation tests: watermark scans, escalation alerts and the background service.
+"""
+
+import os
+import sys
+import time
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy.orm import Session
+from models import db, User, Department, ComplaintCategory, Complaint, Notification, SchedulerWatermark
+
+class Recorder:
+    """Socket channel that records each push and whether its row was committed by then"""
+    def __init__(self, app):
+        self.app = app
+        self.emitted = []
+
+    def emit(self, event, payload, room=None):
+        with self.app.app_context(), Session(db.engine) as other_process:
+            committed = other_process.get(Notification, payload['id']) is not None
+        self.emitted.append((event, room, payload['complaint_id'], committed))
+
+class EscalationTestSuite(AppTestCase):
+    """SlaEscalator against a temporary SQLite app"""
+
+    CONFIG = {
+        'SLA_BATCH_SIZE': 2
+    }
+
+    @classmethod
+    def seed(cls):
+        cls.escalator = cls.app.extensions['sla_escalator']
+        cls.now = datetime.utcnow()
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        cls.category_id, cls.department_id, cls.student_id = category.id, department.id, student.id
+        cls.admin_id = User.query.filter_by(role='admin').first().id
+        cls.ids = cls.add_complaints([  # (hours until due, status)
+            (-30, 'Pending'),
+            (-20, 'In Progress'),
+            (-10, 'Resolved'),  # closed in time: never escalated
+            (-5, 'Pending'),
+            (48, 'Pending')
+        ])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.escalator.stop()
+        super().tearDownClass()
+
+    @classmethod
+    def add_complaints(cls, rows):
+        complaints = [Complaint(
+            complaint_id=f'SLA{datetime.utcnow():%H%M%S%f}{i}', title=f'Complaint due in {hours}h',
+            description='Overdue check', category_id=cls.category_id, department_id=cls.department_id,
+            student_id=cls.student_id, status=status, expected_resolution_date=cls.now + timedelta(hours=hours)
+        ) for i, (hours, status) in enumerate(rows)]
+        db.session.add_all(complaints)
+        db.session.commit()
+        return [c.id for c in complaints]
+
+    def escalated_ids(self):
+        with self.app.app_context():
+            return {c.id for c in Complaint.query.filter_by(escalated=True)}
+
+    def test_01_escalates_overdue_open_complaints(self):
+        """Test that the first run escalates every open overdue complaint and alerts admins"""
+        from monitoring import notification_manager
+        socketio = notification_manager.socketio = Recorder(self.app)
+        try:
+            self.assertEqual(self.escalator.run_once(self.now), 3)
+        finally:
+            notification_manager.socketio = None
+        self.assertEqual(self.escalated_ids(), {self.ids[0], self.ids[1], self.ids[3]})
+        self.assertEqual(self.escalator.last_run['scanned'], 4)  # three batches of at most 2 rows
+        self.assertEqual(self.escalator.next_due, self.now + timedelta(hours=48))
+
+        with self.app.app_context():
+            complaint = db.session.get(Complaint, self.ids[0])
+            self.assertIn('SLA breached', complaint.escalation_reason)
+            alerts = Notification.query.filter_by(type='sla_breach', user_id=self.admin_id).all()
+            self.assertEqual({n.complaint_id for n in alerts}, {self.ids[0], self.ids[1], self.ids[3]})
+            watermark = db.session.get(SchedulerWatermark, 'sla_escalation')
+            self.assertEqual((watermark.position, watermark.last_id),
+                             (self.now - timedelta(hours=5), self.ids[3]))
+        self.assertEqual(socketio.emitted, [('notification', f'student_{self.admin_id}', complaint_id, True)
+                                            for complaint_id in (self.ids[0], self.ids[1], self.ids[3])])
+        print("✅ Overdue escalation passed")
+
+    def test_02_later_runs_only_read_newly_due(self):
+        """Test that a later run reads only what came due after the watermark"""
+        self.assertEqual(self.escalator.run_once(self.now + timedelta(minutes=1)), 0)
+        self.assertEqual(self.escalator.last_run['scanned'], 0)
+
+        with self.app.app_context():
+            late_id, = self.add_complaints([(-1, 'Pending')])  # due after the watermark, written late
+        self.assertEqual(self.escalator.run_once(self.now + timedelta(minutes=2)), 1)
+        self.assertEqual(self.escalator.last_run['scanned'], 1)
+        self.assertIn(late_id, self.escalated_ids())
+        self.assertEqual(self.escalator.run_once(self.now + timedelta(minutes=3)), 0)  # never twice
+        print("✅ Watermark scan passed")
+
+    def test_03_background_service_escalates_on_breach(self):
+        """Test that the running service wakes up when the next complaint falls due"""
+        self.escalator.check_seconds = 30
+        with self.app.app_context():
+            soon_id, = self.add_complaints([(0, 'Pending')])
+            db.session.get(Complaint, soon_id).expected_resolution_date = datetime.utcnow() + timedelta(seconds=1)
+            db.session.commit()
+        self.escalator.start()
+        try:
+            deadline = time.time() + 10
+            while soon_id not in self.escalated_ids() and time.time() < deadline:
+                time.sleep(0.2)
+        finally:
+            self.escalator.stop()
+        self.assertIn(soon_id, self.escalated_ids())
+
+        status = self.client.get('/api/admin/performance').get_json()['sla_escalation']
+        self.assertIsNotNone(status['watermark'])
+        self.assertGreaterEqual(status['escalated_total'], 5)
+        print("✅ Background escalation passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Logging tests: JSON records with request ids, and a queue that never blocks.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from logging_config import NonBlockingQueueHandler, stop_logging
+
+class LoggingTestSuite(unittest.TestCase):
+    """logging_config against a temporary app and log file"""
+
+    def test_01_json_records_carry_request_id(self):
+        """Test that records reach the rotating file as JSON with the request id"""
+        from app import create_app
+        from models import db
+        with tempfile.TemporaryDirectory() as tmpdir:
+            from config import Config
+            self.assertIn('{pid}', Config.LOG_FILE)  # workers never share (and rotate) one file by default
+            log_file = os.path.join(tmpdir, 'app-{pid}.log')
+            app = create_app({
+                'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmpdir, 'logging.db')}",
+                'LOAD_CSV_ON_STARTUP': False,
+                'LOG_FILE': log_file,
+                'LOG_LEVEL': 'INFO',
+                'TESTING': True
+            })
+            try:
+                response = app.test_client().get('/api/health', headers={'X-Request-ID': 'req-123'})
+                self.assertEqual(response.headers['X-Request-ID'], 'req-123')
+                self.assertEqual(len(app.test_client().get('/api/health').headers['X-Request-ID']), 32)
+
+                logger = logging.getLogger('test_logging')
+                with app.test_request_context(headers={'X-Request-ID': 'req-456'}):
+                    app.preprocess_request()
+                    logger.info('saved %s', 'C1', extra={'complaint_id': 'C1'})
+                    logger.debug('not emitted at INFO')
+                    try:
+                        raise ValueError('boom')
+                    except ValueError:
+                        logger.exception('failed')
+                logger.warning('outside a request')
+            finally:
+                from app_testcase import reset_singletons
+                stop_logging()
+                with app.app_context():
+                    db.session.remove()
+                    db.engine.dispose()
+                app.extensions['db_routing'].dispose()
+                reset_singletons()
+
+            with open(log_file.format(pid=os.getpid()), encoding='utf-8') as f:
+                records = [json.loads(line) for line in f if '"test_logging"' in line]
+        self.assertEqual([r['message'] for r in records], ['saved C1', 'failed', 'outside a request'])
+        self.assertEqual(records[0]['request_id'], 'req-456')
+        self.assertEqual(records[0]['complaint_id'], 'C1')
+        self.assertIn('ValueError: boom', records[1]['exception'])
+        self.assertIsNone(records[2]['request_id'])
+        print("✅ JSON request logging passed")
+
+    def test_02_full_queue_drops_instead_of_blocking(self):
+        """Test that a full queue counts dropped records rather than waiting"""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        logger = logging.getLogger('test_logging.queue')
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(3):
+                logger.warning('record %d', i)
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual(handler.dropped, 2)
+        self.assertEqual(handler.queue.get_nowait().msg, 'record 0')
+        print("✅ Non-blocking queue passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Response encoding tests: MessagePack negotiation, timestamp extension and columnar layout.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint
+from negotiation import MSGPACK_AVAILABLE
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+
+MSGPACK = {'Accept': 'application/msgpack'}
+
+def iso_strings(value):
+    """Datetimes from the timestamp extension back to the JSON representation"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat()
+    if isinstance(value, list):
+        return [iso_strings(item) for item in value]
+    if isinstance(value, dict):
+        return {key: iso_strings(item) for key, item in value.items()}
+    return value
+
+@unittest.skipUnless(MSGPACK_AVAILABLE, 'msgpack not installed')
+class MessagePackTestSuite(AppTestCase):
+    """Negotiated encodings against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        now = datetime.utcnow()
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        db.session.add_all([
+            Complaint(complaint_id=f'CMP{i:04d}', title=f'Complaint {i}', description='Projector broken',
+                      category_id=category.id, department_id=department.id, student_id=student.id,
+                      status='Resolved' if i % 3 == 0 else 'Pending', created_at=now - timedelta(hours=i),
+                      resolved_at=now if i % 3 == 0 else None)
+            for i in range(300)
+        ])
+        db.session.commit()
+
+    def unpack(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/msgpack')
+        self.assertIn('Accept', response.vary)
+        return msgpack.unpackb(response.data, timestamp=3)
+
+    def test_01_list_matches_json(self):
+        """Test that the MessagePack list decodes to the JSON list, with real timestamps"""
+        as_json = self.client.get('/api/complaints')
+        self.assertEqual(as_json.mimetype, 'application/json')
+        self.assertEqual(self.client.get('/api/complaints', headers={'Accept': '*/*'}).mimetype, 'application/json')
+
+        packed = self.client.get('/api/complaints', headers=MSGPACK)
+        complaints = self.unpack(packed)
+        self.assertIsInstance(complaints[0]['created_at'], datetime)
+        self.assertEqual(iso_strings(complaints), as_json.get_json())
+        self.assertLess(len(packed.data), len(as_json.data))
+
+        fields = self.unpack(self.client.get('/api/complaints?fields=title,resolved_at', headers=MSGPACK))
+        self.assertEqual(set(fields[0]), {'id', 'title', 'resolved_at'})
+        print("✅ MessagePack list passed")
+
+    def test_02_columnar_layout(self):
+        """Test struct-of-arrays output in both encodings, top level and nested"""
+        rows = self.client.get('/api/complaints?fields=title,status').get_json()
+        columns = self.client.get('/api/complaints?fields=title,status&layout=columnar').get_json()
+        self.assertEqual(set(columns), {'id', 'title', 'status'})
+        self.assertEqual(columns['title'], [row['title'] for row in rows])
+
+        search = self.unpack(self.client.get('/api/complaints/search?status=Resolved&layout=columnar',
+                                             headers=MSGPACK))
+        self.assertEqual(search['total'], 100)
+        self.assertEqual(set(search['complaints']['status']), {'Resolved'})
+        self.assertIsInstance(search['complaints']['resolved_at'][0], datetime)
+
+        feed = self.client.get('/api/all-student-complaints').get_json()
+        packed = self.unpack(self.client.get('/api/all-student-complaints?layout=columnar', headers=MSGPACK))
+        self.assertEqual(packed['complaint_id'], [row['complaint_id'] for row in feed])
+        self.assertLess(len(self.client.get('/api/all-student-complaints?layout=columnar', headers=MSGPACK).data),
+                        len(self.client.get('/api/all-student-complaints').data) // 2)
+        print("✅ Columnar layout passed")
+
+    def test_03_aggregates_dashboard_and_batch(self):
+        """Test aggregate endpoints, the dashboard's own ETag, and JSON items inside a batch"""
+        self.assertEqual(self.unpack(self.client.get('/api/stats', headers=MSGPACK))['total'],
+                         self.client.get('/api/stats').get_json()['total'])
+
+        self.login_admin()
+        json_etag = self.client.get('/api/admin/dashboard').headers['ETag']
+        packed = self.client.get('/api/admin/dashboard', headers=MSGPACK)
+        self.assertEqual(self.unpack(packed)['counts']['total'], 300)
+        self.assertNotEqual(packed.headers['ETag'], json_etag)
+        revalidated = self.client.get('/api/admin/dashboard',
+                                      headers={**MSGPACK, 'If-None-Match': packed.headers['ETag']})
+        self.assertEqual(revalidated.status_code, 304)
+
+        response = self.client.post('/api/batch', json={'requests': ['/api/stats']}, headers=MSGPACK)
+        self.assertEqual(response.get_json()['responses'][0]['body']['total'], 300)
+        print("✅ Aggregates, dashboard and batch passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
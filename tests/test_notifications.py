@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Notification inbox tests: producers, unread counters, read state and the indexed page.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import text
+from models import db, User, Department, ComplaintCategory, Complaint, NotificationCounter
+
+class NotificationInboxTestSuite(AppTestCase):
+    """Inbox endpoints against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        students = [User(name=f'Student {i}', email=f's{i}@college.edu', role='student',
+                         student_id=f'24CSE00{i}') for i in (1, 2)]
+        db.session.add_all([category, *students])
+        db.session.flush()
+        complaint = Complaint(complaint_id='CMP2024010001', title='Broken projector',
+                              description='Projector in lab 2 does not turn on',
+                              category_id=category.id, department_id=department.id,
+                              student_id=students[0].id)
+        db.session.add(complaint)
+        db.session.commit()
+        cls.student_id, cls.other_student_id = students[0].id, students[1].id
+        cls.complaint_id = complaint.id
+        cls.admin_id = User.query.filter_by(role='admin').first().id
+
+    def setUp(self):
+        self.admin = self.app.test_client()
+        self.login_admin(self.admin)
+
+    def inbox(self, user_id, client=None):
+        response = (client or self.admin).get(f'/api/notifications/{user_id}')
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_01_status_change_notifies_student(self):
+        """Test that a status update lands in the student's inbox, unread"""
+        client = self.app.test_client()
+        for status in ('In Progress', 'In Progress', 'Resolved'):  # the repeat is not a change
+            response = client.patch(f'/api/complaints/{self.complaint_id}/status', json={'status': status})
+            self.assertEqual(response.status_code, 200)
+
+        inbox = self.inbox(self.student_id)
+        self.assertEqual(inbox['unread_count'], 2)
+        self.assertEqual([n['message'] for n in inbox['notifications']],
+                         ['Status changed to Resolved', 'Status changed to In Progress'])
+        self.assertFalse(any(n['read'] for n in inbox['notifications']))
+        self.assertEqual(inbox['notifications'][0]['data'], {'old_status': 'In Progress', 'status': 'Resolved'})
+
+        # Matching is by user id, not substring: another student's inbox stays empty
+        self.assertEqual(self.inbox(self.other_student_id), {'notifications': [], 'unread_count': 0})
+        print("✅ Status notifications passed")
+
+    def test_02_mark_read_updates_counter(self):
+        """Test that marking read flips read state once and keeps the counter exact"""
+        client = self.app.test_client()
+        response = client.post(f'/api/notifications/{self.student_id}/read')
+        self.assertEqual(response.status_code, 302)  # login_required redirects to the login view
+
+        client.post('/api/login', json={'student_id': '24CSE002'})
+        response = client.post(f'/api/notifications/{self.student_id}/read')
+        self.assertEqual(response.status_code, 403)
+
+        client.post('/api/login', json={'student_id': '24CSE001'})
+        newest = self.inbox(self.student_id)['notifications'][0]['id']
+        for _ in range(2):  # marking twice must not decrement twice
+            response = client.post(f'/api/notifications/{self.student_id}/read', json={'ids': [newest]})
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'marked': 0, 'unread_count': 1})
+
+        response = client.post(f'/api/notifications/{self.student_id}/read')
+        self.assertEqual(response.get_json(), {'marked': 1, 'unread_count': 0})
+        self.assertTrue(all(n['read'] for n in self.inbox(self.student_id)['notifications']))
+        count = client.get(f'/api/notifications/{self.student_id}/unread-count').get_json()
+        self.assertEqual(count, {'unread_count': 0})
+
+        # Reading an inbox needs the owner's (or an admin's) session too
+        for url in (f'/api/notifications/{self.other_student_id}',
+                    f'/api/notifications/{self.other_student_id}/unread-count'):
+            self.assertEqual(client.get(url).status_code, 403)
+            self.assertEqual(self.app.test_client().get(url).status_code, 302)
+        self.assertEqual(self.inbox(self.student_id, client)['unread_count'], 0)
+        print("✅ Mark read passed")
+
+    def test_03_comments_and_bulk_updates_notify(self):
+        """Test comment and bulk status producers, and counters staying consistent"""
+        client = self.app.test_client()
+        response = client.post(f'/api/complaints/{self.complaint_id}/comments',
+                               json={'admin_id': self.admin_id, 'text': 'Technician assigned'})
+        self.assertEqual(response.status_code, 201)
+        response = client.post('/api/complaints/bulk-update', json={
+            'complaint_ids': [self.complaint_id], 'action': 'status', 'value': 'Pending'})
+        self.assertEqual(response.status_code, 200)
+
+        types = [n['type'] for n in self.inbox(self.student_id)['notifications'][:2]]
+        self.assertEqual(sorted(types), ['complaint_update', 'new_comment'])
+        with self.app.app_context():
+            unread = db.session.execute(text(
+                "SELECT COUNT(*) FROM notifications WHERE user_id = :u AND read_at IS NULL"
+            ), {'u': self.student_id}).scalar()
+            self.assertEqual(db.session.get(NotificationCounter, self.student_id).unread, unread)
+        print("✅ Comment and bulk notifications passed")
+
+    def test_04_admin_fan_out_and_index(self):
+        """Test new-complaint fan-out to admins and that the page query uses the inbox index"""
+        from notifications import notify_admins
+        with self.app.app_context():
+            before = db.session.get(NotificationCounter, self.admin_id)
+            before = before.unread if before else 0
+            notify_admins('new_complaint', 'New Complaint Received', 'Broken projector - Student 1',
+                          complaint_id=self.complaint_id)
+            db.session.commit()
+            self.assertEqual(db.session.get(NotificationCounter, self.admin_id).unread, before + 1)
+
+            plan = db.session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM notifications WHERE user_id = :u "
+                "ORDER BY created_at DESC, id DESC LIMIT 20"
+            ), {'u': self.admin_id}).all()
+            self.assertIn('ix_notifications_user_created', ' '.join(str(row[-1]) for row in plan))
+        self.assertEqual(self.inbox(self.admin_id)['notifications'][0]['type'], 'new_complaint')
+        print("✅ Admin fan-out passed")
+
+    def test_05_push_emits_the_row_written(self):
+        """Test that a pushed notification is the row just written and is committed by the caller"""
+        from monitoring import NotificationManager
+
+        class Recorder:
+            def __init__(self):
+                self.emitted = []
+
+            def emit(self, event, payload, room=None):
+                self.emitted.append((event, payload, room))
+
+        socketio = Recorder()
+        with self.app.app_context():
+            pushed = NotificationManager(socketio).send_notification(self.other_student_id, 'general', 'Hello', 'First')
+            self.assertEqual(socketio.emitted, [('notification', pushed, f'student_{self.other_student_id}')])
+            self.assertEqual((pushed['message'], pushed['read']), ('First', False))
+            db.session.rollback()  # nothing was committed on the caller's behalf
+        self.assertEqual(self.inbox(self.other_student_id), {'notifications': [], 'unread_count': 0})
+
+        with self.app.app_context():
+            pushed = NotificationManager(socketio).send_notification(self.other_student_id, 'general', 'Hello', 'Second')
+            db.session.commit()
+        self.assertEqual(self.inbox(self.other_student_id)['notifications'][0]['id'], pushed['id'])
+        print("✅ Notification push passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Sparse fieldset tests: ?fields= output, SQL pushdown and validation.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from models import db, User, Department, ComplaintCategory, Complaint, Comment
+
+class ProjectionTestSuite(AppTestCase):
+    """List endpoints with ?fields= against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001',
+                       address='Hostel block A', blood_group='O+', date_of_birth=datetime(2005, 4, 1).date())
+        db.session.add_all([category, student])
+        db.session.flush()
+        admin = User.query.filter_by(role='admin').first()
+        complaints = [
+            Complaint(complaint_id=f'CMP{i:04d}', title=f'Complaint {i}', description='Long description ' * 20,
+                      category_id=category.id, department_id=department.id, student_id=student.id,
+                      assigned_to=admin.id if i == 0 else None)
+            for i in range(3)
+        ]
+        db.session.add_all(complaints)
+        db.session.flush()
+        db.session.add(Comment(complaint_id=complaints[0].id, admin_id=admin.id, admin_name=admin.name,
+                               text='Looking into it'))
+        db.session.commit()
+        cls.complaint_id = complaints[0].id
+
+    def get_with_sql(self, path):
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(Engine, 'before_cursor_execute', record)  # reads may go to the read engine
+        try:
+            response = self.client.get(path)
+        finally:
+            event.remove(Engine, 'before_cursor_execute', record)
+        self.assertEqual(response.status_code, 200, path)
+        return response.get_json(), statements
+
+    def test_01_all_fields_match_to_dict(self):
+        """Test that asking for every field reproduces to_dict() exactly"""
+        from projection import complaint_projection, user_projection, comment_projection
+        cases = [
+            ('/api/complaints', complaint_projection, lambda body: body),
+            ('/api/complaints/search', complaint_projection, lambda body: body['complaints']),
+            ('/api/students', user_projection, lambda body: body),
+            (f'/api/complaints/{self.complaint_id}/comments', comment_projection, lambda body: body)
+        ]
+        for path, projection, items in cases:
+            full = items(self.client.get(path).get_json())
+            projected = items(self.client.get(f"{path}?fields={','.join(projection.fields)}").get_json())
+            self.assertTrue(full, path)
+            self.assertEqual(projected, full, path)
+        print("✅ Full projections passed")
+
+    def test_02_fields_are_pushed_into_select(self):
+        """Test that only the requested columns and joins reach the SQL"""
+        body, statements = self.get_with_sql('/api/complaints?fields=title,status')
+        self.assertEqual(set(body[0]), {'id', 'title', 'status'})
+        self.assertEqual(sorted(c['title'] for c in body), ['Complaint 0', 'Complaint 1', 'Complaint 2'])
+        select_sql = ' '.join(s for s in statements if 'FROM complaints' in s)
+        self.assertTrue(select_sql)
+        self.assertNotIn('description', select_sql)
+        self.assertNotIn('JOIN', select_sql)
+        self.assertFalse(any('FROM users' in s for s in statements))  # no per-row student loads
+
+        body, statements = self.get_with_sql('/api/complaints?fields=student_name,assigned_admin_name')
+        self.assertEqual({c['student_name'] for c in body}, {'Student 1'})
+        self.assertEqual(sorted(c['assigned_admin_name'] is None for c in body), [False, True, True])
+        self.assertEqual(len([s for s in statements if 'FROM complaints' in s]), 1)
+
+        body, statements = self.get_with_sql('/api/students?fields=name,email,student_id,year,semester')
+        self.assertEqual(set(body[0]), {'id', 'name', 'email', 'student_id', 'year', 'semester'})
+        self.assertTrue(any('FROM users' in s for s in statements))
+        self.assertFalse(any('address' in s or 'blood_group' in s for s in statements))
+        print("✅ Projection pushdown passed")
+
+    def test_03_unknown_fields_are_rejected(self):
+        """Test 400 for unknown names and that a blank fields= means everything"""
+        response = self.client.get('/api/students?fields=name,password_hash')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password_hash', response.get_json()['error'])
+        self.assertEqual(self.client.get('/api/complaints/search?fields=nope').status_code, 400)
+        self.assertIn('description', self.client.get('/api/complaints?fields=').get_json()[0])
+        print("✅ Field validation passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Query plan regression tests for the complaints hot paths.
+Seeds a temporary SQLite database and fails if a hot query falls back to a full table scan.
+"""
+
+import os
+import random
+import re
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from flask import Flask
+from sqlalchemy import select, func, insert
+from models import db, Complaint, Department, ComplaintCategory
+from db_indexes import ensure_indexes
+
+SEED_COMPLAINTS = 5000
+STATUSES = ['Pending', 'In Progress', 'Resolved', 'Rejected']
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+
+# "SCAN complaints ..." reads every row (or every index entry); hot queries must SEARCH
+FULL_SCAN = re.compile(r'^SCAN (TABLE )?complaints\b')
+
+class QueryPlanTestSuite(unittest.TestCase):
+    """EXPLAIN QUERY PLAN checks for the indexed complaint queries"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.app = Flask(__name__)
+        cls.app.config.update(
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(cls.tmpdir.name, 'plans.db')}",
+            SQLALCHEMY_TRACK_MODIFICATIONS=False
+        )
+        db.init_app(cls.app)
+        cls.ctx = cls.app.app_context()
+        cls.ctx.push()
+        db.create_all()
+        cls._seed()
+        ensure_indexes(db.engine)
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql('ANALYZE')
+
+    @classmethod
+    def tearDownClass(cls):
+        db.session.remove()
+        db.engine.dispose()
+        cls.ctx.pop()
+        cls.tmpdir.cleanup()
+
+    @classmethod
+    def _seed(cls):
+        rng = random.Random(42)
+        now = datetime.utcnow()
+        db.session.execute(insert(Department), [
+            {'id': i, 'name': f'Department {i}', 'code': f'D{i}'} for i in range(1, 11)
+        ])
+        db.session.execute(insert(ComplaintCategory), [
+            {'id': i, 'name': f'Category {i}', 'department_id': i} for i in range(1, 11)
+        ])
+        rows = []
+        for i in range(SEED_COMPLAINTS):
+            created = now - timedelta(days=rng.uniform(0, 365))
+            rows.append({
+                'complaint_id': f'CMP{i:06d}',
+                'title': f'Complaint {i}',
+                'description': 'Seeded for query plan checks',
+                'category_id': rng.randint(1, 10),
+                'department_id': rng.randint(1, 10),
+                'status': rng.choice(STATUSES),
+                'priority': rng.choice(PRIORITIES),
+                'student_id': rng.randint(1, 500),
+                'created_at': created,
+                'updated_at': created + timedelta(hours=rng.uniform(0, 240)),
+                'expected_resolution_date': created + timedelta(days=rng.randint(1, 14))
+            })
+        db.session.execute(insert(Complaint), rows)
+        db.session.commit()
+
+    def explain(self, stmt):
+        sql = str(stmt.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+        with db.engine.connect() as conn:
+            return [row[-1] for row in conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}')]
+
+    def assertIndexed(self, stmt, index_name=None):
+        plan = self.explain(stmt)
+        scans = [line for line in plan if FULL_SCAN.match(line)]
+        self.assertFalse(scans, f"Full scan of complaints: {plan}")
+        if index_name:
+            self.assertTrue(any(index_name in line for line in plan), f"{index_name} not used: {plan}")
+        return plan
+
+    def test_01_declared_indexes_exist(self):
+        """Test that the migration created every hot-path index"""
+        self.assertEqual(ensure_indexes(db.engine), [])
+        names = {ix['name'] for ix in db.inspect(db.engine).get_indexes('complaints')}
+        for name in ['ix_complaints_student_created', 'ix_complaints_status_created',
+                     'ix_complaints_department_created', 'ix_complaints_created_at', 'ix_complaints_updated_at',
+                     'ix_complaints_expected_resolution']:
+            self.assertIn(name, names)
+        print("✅ Declared indexes passed")
+
+    def test_02_student_complaint_list(self):
+        """Test per-student complaint list"""
+        stmt = select(Complaint).where(Complaint.student_id == 7).order_by(Complaint.created_at.desc())
+        plan = self.assertIndexed(stmt, 'ix_complaints_student_created')
+        self.assertFalse(any('TEMP B-TREE' in line for line in plan), f"Sort not served by index: {plan}")
+        print("✅ Student complaint list plan passed")
+
+    def test_03_status_counts(self):
+        """Test status counts used by stats and monitoring"""
+        for status in STATUSES:
+            self.assertIndexed(
+                select(func.count(Complaint.id)).where(Complaint.status == status),
+                'ix_complaints_status_created'
+            )
+        print("✅ Status count plans passed")
+
+    def test_04_today_range(self):
+        """Test the sargable "today" window"""
+        today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+        stmt = select(func.count(Complaint.id)).where(
+            Complaint.created_at >= today_start,
+            Complaint.created_at < today_start + timedelta(days=1)
+        )
+        self.assertIndexed(stmt, 'ix_complaints_created_at')
+        print("✅ Today range plan passed")
+
+    def test_05_recent_activity(self):
+        """Test notifications by updated_at"""
+        since = datetime.utcnow() - timedelta(days=1)
+        stmt = (select(Complaint).where(Complaint.updated_at > since)
+                .order_by(Complaint.updated_at.desc()).limit(10))
+        self.assertIndexed(stmt, 'ix_complaints_updated_at')
+
+        student_stmt = (select(Complaint).where(Complaint.student_id == 7, Complaint.updated_at > since)
+                        .order_by(Complaint.updated_at.desc()).limit(10))
+        self.assertIndexed(student_stmt)
+
+        admin_stmt = (select(Complaint).where(Complaint.status == 'Pending', Complaint.created_at > since)
+                      .order_by(Complaint.created_at.desc()).limit(10))
+        self.assertIndexed(admin_stmt, 'ix_complaints_status_created')
+        print("✅ Recent activity plans passed")
+
+    def test_06_department_grouping(self):
+        """Test department breakdown and department date windows"""
+        grouped = (select(Department.name, func.count(Complaint.id))
+                   .join(Complaint, Complaint.department_id == Department.id).group_by(Department.name))
+        self.assertIndexed(grouped)
+
+        window = select(Complaint).where(
+            Complaint.department_id == 3,
+            Complaint.created_at >= datetime.utcnow() - timedelta(days=30)
+        )
+        self.assertIndexed(window, 'ix_complaints_department_created')
+        print("✅ Department grouping plans passed")
+
+    def test_07_sla_watermark_scan(self):
+        """Test that the SLA scheduler's newly-due scan and next-due lookup use the due-date index"""
+        from escalation import newly_due, next_due
+        from models import SchedulerWatermark
+        now = datetime.utcnow()
+        watermark = SchedulerWatermark(position=now - timedelta(minutes=5), last_id=1234)
+        plan = self.assertIndexed(newly_due(watermark, now, 500), 'ix_complaints_expected_resolution')
+        self.assertFalse(any('TEMP B-TREE' in line for line in plan), f"Sort not served by index: {plan}")
+        self.assertIndexed(next_due(now), 'ix_complaints_expected_resolution')
+        print("✅ SLA watermark scan plans passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
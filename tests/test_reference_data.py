@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Reference data registry tests: cached lookups, served JSON and invalidation.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import event
+from models import db, User, Department, Course, ComplaintCategory, Complaint, ReferenceDataVersion
+
+class ReferenceDataTestSuite(AppTestCase):
+    """ReferenceDataRegistry against a temporary SQLite app"""
+
+    CONFIG = {
+        'REFERENCE_DATA_CHECK_SECONDS': 3600
+    }
+
+    @classmethod
+    def seed(cls):
+        from reference_data import reference_data
+        cls.registry = reference_data
+        cse = Department(name='Computer Science', code='CSE')
+        ee = Department(name='Electrical', code='EE')
+        db.session.add_all([cse, ee])
+        db.session.flush()
+        db.session.add_all([
+            Course(name='B.Tech CSE', code='BTCSE', duration_years=4, department_id=cse.id, degree_type='UG'),
+            ComplaintCategory(name='Lab Equipment', department_id=cse.id, priority_level='High',
+                              typical_resolution_days=3),
+            ComplaintCategory(name='Power Supply', department_id=ee.id)
+        ])
+        db.session.commit()
+        cls.cse_id, cls.ee_id = cse.id, ee.id
+
+    def count_queries(self, func):
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        with self.app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', record)
+            try:
+                func()
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', record)
+        return statements
+
+    def test_01_served_json_matches_models(self):
+        """Test that cached JSON equals the model serialization"""
+        with self.app.app_context():
+            expected = {
+                '/api/departments': [d.to_dict() for d in Department.query.order_by(Department.id)],
+                '/api/courses': [c.to_dict() for c in Course.query.order_by(Course.id)],
+                '/api/complaint-categories': [c.to_dict() for c in ComplaintCategory.query.order_by(ComplaintCategory.id)],
+                f'/api/departments/{self.cse_id}/categories': [
+                    c.to_dict() for c in ComplaintCategory.query.filter_by(department_id=self.cse_id)
+                ]
+            }
+        for path, items in expected.items():
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), items, path)
+        print("✅ Served reference JSON passed")
+
+    def test_02_lookups_do_not_query(self):
+        """Test O(1) lookups once the snapshot is loaded"""
+        with self.app.app_context():
+            self.registry.current()
+            def lookups():
+                self.assertEqual(self.registry.department_name(self.cse_id), 'Computer Science')
+                self.assertEqual(self.registry.department_id('EE'), self.ee_id)
+                self.assertEqual(self.registry.category_id('Lab Equipment'), self.registry.category(1)['id'])
+                self.assertEqual(self.registry.category(1)['priority_level'], 'High')
+                self.assertEqual(self.registry.course(1)['department_name'], 'Computer Science')
+                self.assertIsNone(self.registry.category(None))
+                self.registry.json('courses', department_id=self.cse_id)
+            self.assertEqual(self.count_queries(lookups), [])
+        print("✅ Registry lookups passed")
+
+    def test_03_local_write_invalidates(self):
+        """Test that committing a reference change bumps the version and refreshes this process"""
+        with self.app.app_context():
+            before = self.registry.current().version
+            db.session.add(Department(name='Mechanical', code='ME'))
+            db.session.commit()
+            self.assertEqual(db.session.get(ReferenceDataVersion, 1).version, before + 1)
+            self.assertIsNotNone(self.registry.department_id('Mechanical'))
+
+            # Rolled back changes leave the cache alone
+            loads = self.registry.loads
+            db.session.add(Department(name='Civil', code='CE'))
+            db.session.flush()
+            db.session.rollback()
+            self.assertIsNone(self.registry.department_id('Civil'))
+            self.assertEqual(self.registry.loads, loads)
+        names = [d['name'] for d in self.client.get('/api/departments').get_json()]
+        self.assertIn('Mechanical', names)
+        print("✅ Local invalidation passed")
+
+    def test_04_other_process_write_is_noticed(self):
+        """Test that a version bump from elsewhere triggers a reload after the check interval"""
+        with self.app.app_context():
+            self.registry.current()
+            table = ReferenceDataVersion.__table__
+            with db.engine.begin() as conn:
+                # Simulates another worker renaming a department
+                conn.execute(Department.__table__.update().where(Department.id == self.ee_id).values(name='EEE'))
+                conn.execute(table.update().values(version=table.c.version + 1))
+
+            self.assertEqual(self.registry.department_name(self.ee_id), 'Electrical')  # within the interval
+            self.registry.checked_at -= self.registry.check_seconds
+            self.assertEqual(self.registry.department_name(self.ee_id), 'EEE')
+        print("✅ Cross-process version check passed")
+
+    def test_05_complaint_export_is_one_query(self):
+        """Test that export records join students in the same query and name from the registry"""
+        from app import complaint_export_records
+        with self.app.app_context():
+            students = [User(name=f'Student {i}', email=f'export{i}@college.edu', role='student',
+                             student_id=f'24CSE10{i}') for i in range(3)]
+            db.session.add_all(students)
+            db.session.flush()
+            category_id = self.registry.category_id('Lab Equipment')
+            db.session.add_all([Complaint(complaint_id=f'EXP{i:04d}', title='Broken lab PC',
+                                          description='Does not boot', category_id=category_id,
+                                          department_id=self.cse_id, student_id=students[i % 3].id)
+                                for i in range(6)])
+            db.session.commit()
+            self.registry.current()
+
+            records = []
+            statements = self.count_queries(lambda: records.extend(complaint_export_records()))
+            self.assertEqual(len([s for s in statements if s.lstrip().upper().startswith('SELECT')]), 1)
+            self.assertEqual([(r['student_id'], r['student_name']) for r in records[:3]],
+                             [(f'24CSE10{i}', f'Student {i}') for i in range(3)])
+            self.assertEqual({(r['department'], r['category'], r['expected_resolution']) for r in records},
+                             {('Computer Science', 'Lab Equipment', '')})
+            self.assertIsNone(complaint_export_records(iso=True)[0]['expected_resolution'])
+        print("✅ Complaint export records passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
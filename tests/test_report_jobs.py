@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Report job tests: summary contents, shared in-flight jobs and caching by data version.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from models import db, User, Department, ComplaintCategory, Complaint
+
+class ReportJobsTestSuite(AppTestCase):
+    """ReportJobManager and the report endpoints against a temporary SQLite app"""
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        for index, status in enumerate(['Pending', 'Pending', 'Resolved']):
+            db.session.add(Complaint(complaint_id=f'CMP{index:04d}', title=f'Complaint {index}',
+                                     description='Report complaint', category_id=category.id,
+                                     department_id=department.id, student_id=student.id, status=status))
+        db.session.commit()
+        cls.complaint_id = Complaint.query.filter_by(complaint_id='CMP0000').one().id
+
+    def setUp(self):
+        self.client = self.app.test_client()
+        self.login_admin()
+
+    def test_01_summary_is_cached_until_data_changes(self):
+        """Test the summary contents and that an unchanged data version is served from cache"""
+        report = self.client.get('/api/reports/summary').get_json()
+        self.assertEqual(report['total_complaints'], 3)
+        self.assertEqual(report['status_breakdown'], {'Pending': 2, 'Resolved': 1})
+        self.assertEqual(report['department_breakdown'], {'Computer Science': 3})
+
+        response = self.client.post('/api/reports/summary')
+        self.assertEqual(response.status_code, 200)
+        job = response.get_json()
+        self.assertTrue(job['cached'])
+        self.assertEqual(job['data_version'], report['data_version'])
+        self.assertEqual(response.headers['Location'], f"/api/reports/jobs/{job['id']}")
+        self.assertEqual(self.client.get(response.headers['Location']).get_json()['report'], report)
+
+        self.client.patch(f'/api/complaints/{self.complaint_id}/status', json={'status': 'Resolved'})
+        fresh = self.client.get('/api/reports/summary').get_json()
+        self.assertNotEqual(fresh['data_version'], report['data_version'])
+        self.assertEqual(fresh['status_breakdown'], {'Pending': 1, 'Resolved': 2})
+        self.assertEqual(self.client.get('/api/reports/jobs/missing').status_code, 404)
+        print("✅ Report caching passed")
+
+    def test_02_concurrent_requests_share_one_job(self):
+        """Test that requests for a report already being built join that job"""
+        import report_jobs
+        started, release = threading.Event(), threading.Event()
+        builds = []
+
+        def slow_report(session, progress=None):
+            builds.append(1)
+            started.set()
+            release.wait(5)
+            return {'complaints': session.query(Complaint).count()}
+
+        manager = report_jobs.ReportJobManager(max_workers=2)
+        manager.init_app(self.app)
+        report_jobs.REPORT_BUILDERS['slow'] = slow_report
+        try:
+            with self.app.app_context():
+                first = manager.submit('slow')
+                self.assertTrue(started.wait(5))
+                second = manager.submit('slow')
+                self.assertIs(second, first)
+                release.set()
+                self.assertEqual(manager.wait(first, timeout=5)['status'], 'completed')
+
+                again = manager.submit('slow')
+                self.assertIsNot(again, first)
+                self.assertTrue(again['cached'])
+                self.assertEqual(again['result'], first['result'])
+                self.assertRaises(ValueError, manager.submit, 'missing')
+        finally:
+            del report_jobs.REPORT_BUILDERS['slow']
+            release.set()
+            manager.executor.shutdown(wait=True)
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(first['result']['complaints'], 3)
+        self.assertEqual(manager.in_flight, {})
+        print("✅ Shared report jobs passed")
+
+class ReplicaReportJobsTestSuite(AppTestCase):
+    """Report jobs built while a second SQLite file serves reads as a replica"""
+
+    @classmethod
+    def config(cls):
+        cls.primary_path = os.path.join(cls.tmpdir.name, 'test.db')
+        cls.replica_path = os.path.join(cls.tmpdir.name, 'replica.db')
+        return {
+            'DATABASE_REPLICA_URLS': [f'sqlite:///{cls.replica_path}'],
+            'REPLICA_MAX_LAG_SECONDS': 3600,  # behind, but still in rotation
+            'REPLICA_CHECK_SECONDS': 0,
+            'SQLITE_READ_POOL_SIZE': 0
+        }
+
+    @classmethod
+    def seed(cls):
+        department = Department(name='Computer Science', code='CSE')
+        db.session.add(department)
+        db.session.flush()
+        category = ComplaintCategory(name='Lab Equipment', department_id=department.id)
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([category, student])
+        db.session.flush()
+        db.session.add_all([Complaint(complaint_id=f'CMP{index:04d}', title=f'Complaint {index}',
+                                      description='Report complaint', category_id=category.id,
+                                      department_id=department.id, student_id=student.id) for index in range(2)])
+        db.session.commit()
+        cls.replicate()
+
+    @classmethod
+    def replicate(cls):
+        with sqlite3.connect(cls.primary_path) as primary, sqlite3.connect(cls.replica_path) as replica:
+            primary.backup(replica)
+
+    def replica_version(self):
+        from report_jobs import data_version
+        engine = create_engine(f'sqlite:///{self.replica_path}')
+        try:
+            with Session(engine) as session:
+                return data_version(session)
+        finally:
+            engine.dispose()
+
+    def test_01_lagging_replica_reports_are_filed_under_the_replica_version(self):
+        """Test that a report built on a lagging replica is cached under the replica's version, not the primary's"""
+        import report_jobs
+        with self.app.app_context():
+            complaint = Complaint.query.filter_by(complaint_id='CMP0000').one()
+            complaint.status = 'Resolved'
+            db.session.commit()  # on the primary only
+
+        manager = report_jobs.ReportJobManager(max_workers=1)
+        manager.init_app(self.app)
+        try:
+            with self.app.test_request_context():
+                stale = manager.wait(manager.submit('summary'), timeout=5)
+                self.assertEqual(stale['status'], 'completed')
+                self.assertEqual(stale['result']['status_breakdown'], {'Pending': 2})
+                self.assertEqual(stale['result']['data_version'], self.replica_version())
+
+                self.replicate()
+                fresh = manager.wait(manager.submit('summary'), timeout=5)
+        finally:
+            manager.executor.shutdown(wait=True)
+        self.assertFalse(fresh['cached'])
+        self.assertEqual(fresh['result']['status_breakdown'], {'Pending': 1, 'Resolved': 1})
+        self.assertEqual(fresh['result']['data_version'], self.replica_version())
+        print("✅ Replica report versions passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+SQLite profile tests: connect-time pragmas, the read-only pool and WAL checkpoints.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+from models import db, Department
+from db_pool import pool_metrics
+from db_routing import reading
+
+class SqliteProfileTestSuite(AppTestCase):
+    """Pragmas, reader routing and checkpoints against a temporary SQLite app"""
+
+    CONFIG = {
+        'SQLITE_BUSY_TIMEOUT_MS': 15000,
+        'SQLITE_READ_POOL_SIZE': 2
+    }
+
+    def test_01_writer_pragmas(self):
+        """Test that the writer runs in WAL mode with the configured profile"""
+        with self.app.app_context():
+            pragma = lambda name: db.session.execute(text(f'PRAGMA {name}')).scalar()
+            self.assertEqual(pragma('journal_mode'), 'wal')
+            self.assertEqual(pragma('synchronous'), 1)  # NORMAL
+            self.assertEqual(pragma('busy_timeout'), 15000)
+            self.assertEqual(pragma('temp_store'), 2)  # MEMORY
+            self.assertEqual(pragma('query_only'), 0)
+        print("✅ Writer pragmas passed")
+
+    def test_02_reads_use_the_read_only_pool(self):
+        """Test that read-only contexts use a query_only connection on the same file"""
+        reader = self.app.extensions['db_routing'].readers[0]
+        self.assertEqual((reader.name, reader.check_lag), ('sqlite-reader', False))
+        self.assertEqual(reader.engine.pool.size(), 2)
+        with self.app.app_context():
+            db.session.add(Department(name='Computer Science', code='CSE'))
+            db.session.commit()
+            with reading():
+                self.assertIs(db.session.get_bind(clause=select(Department.id)), reader.engine)
+                self.assertIs(db.session.get_bind(clause=text('PRAGMA query_only')), db.engine)  # not a SELECT
+                self.assertEqual(db.session.query(Department).count(), 1)  # sees the committed write
+            db.session.remove()
+            self.assertIs(db.session.get_bind(), db.engine)
+
+        with reader.engine.connect() as conn:
+            self.assertEqual(conn.execute(text('PRAGMA query_only')).scalar(), 1)
+            self.assertRaises(OperationalError, conn.execute,
+                              text("INSERT INTO departments (name, code) VALUES ('Electrical', 'EE')"))
+
+        checkouts = pool_metrics.get('sqlite-reader').checkouts
+        self.assertEqual(self.client.get('/api/analytics/resolution-times').status_code, 200)  # @read_only
+        self.assertGreater(pool_metrics.get('sqlite-reader').checkouts, checkouts)
+        print("✅ Read-only pool passed")
+
+    def test_03_wal_checkpoints(self):
+        """Test passive checkpoints, and that a WAL past the size limit is truncated"""
+        from background import background_services
+        from sqlite_profile import WalCheckpointer
+        checkpointer = self.app.extensions['wal_checkpointer']
+        self.assertIs(background_services.services['sqlite-wal-checkpoint'], checkpointer)
+        with self.app.app_context():
+            for index in range(20):
+                db.session.add(Department(name=f'Department {index}', code=f'D{index:02d}'))
+                db.session.commit()
+
+            result = checkpointer.checkpoint()
+            self.assertEqual(result['mode'], 'PASSIVE')
+            self.assertGreater(result['wal_frames'], 0)
+            self.login_admin()
+            self.assertEqual(self.client.get('/api/admin/db-pool').get_json()['wal_checkpoint']['mode'], 'PASSIVE')
+
+            db.session.add(Department(name='Electrical', code='EE'))
+            db.session.commit()
+            db.session.remove()
+            truncating = WalCheckpointer(db.engine, size_limit=0)
+            self.assertGreater(truncating.wal_size(), 0)
+            result = truncating.checkpoint()
+        self.assertEqual((result['mode'], result['busy'], result['wal_size_bytes']), ('TRUNCATE', False, 0))
+        print("✅ WAL checkpoints passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
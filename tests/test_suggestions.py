@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Category suggestion tests: training, ranking, backlog scoring and model hot-swap.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app_testcase import AppTestCase
+from models import db, User, Department, ComplaintCategory, Complaint
+
+TRAINING = [  # (text, category, department)
+    ('WiFi not working in hostel room, no internet connection', 'Network', 'IT Services'),
+    ('Internet very slow in the library, WiFi keeps disconnecting', 'Network', 'IT Services'),
+    ('Cannot connect to campus WiFi from my laptop', 'Network', 'IT Services'),
+    ('Mess food is cold and the vegetables are not fresh', 'Food Quality', 'Mess & Catering'),
+    ('Food quality in the mess is poor, rice undercooked', 'Food Quality', 'Mess & Catering'),
+    ('Dinner in the mess was stale and tasted bad', 'Food Quality', 'Mess & Catering'),
+    ('Professor skips lectures and the syllabus is behind', 'Teaching Quality', 'Computer Science'),
+    ('Lectures are hard to follow, teaching quality is poor', 'Teaching Quality', 'Computer Science')
+]
+
+class SuggestionsTestSuite(AppTestCase):
+    """Suggestion endpoints against a temporary SQLite app and model file"""
+
+    @classmethod
+    def config(cls):
+        cls.model_path = os.path.join(cls.tmpdir.name, 'model.npz')
+        return {'SUGGESTION_MODEL_PATH': cls.model_path, 'SUGGESTION_CHECK_SECONDS': 3600}
+
+    @classmethod
+    def seed(cls):
+        from suggestions import category_suggester
+        cls.suggester = category_suggester
+        departments = {name: Department(name=name, code=code) for name, code in
+                       [('IT Services', 'IT'), ('Mess & Catering', 'MESS'), ('Computer Science', 'CSE')]}
+        db.session.add_all(departments.values())
+        db.session.flush()
+        categories = {category: ComplaintCategory(name=category, department_id=departments[department].id)
+                      for _, category, department in TRAINING}
+        student = User(name='Student 1', email='s1@college.edu', role='student', student_id='24CSE001')
+        db.session.add_all([*categories.values(), student])
+        db.session.flush()
+        filed = [  # (text, category actually filed)
+            ('WiFi down in my hostel room again', 'Network'),
+            ('Mess food was cold at lunch', 'Network'),  # misrouted
+        ]
+        complaints = [Complaint(complaint_id=f'CMP{i:04d}', title=text, description=text,
+                                category_id=categories[category].id,
+                                department_id=categories[category].department_id, student_id=student.id)
+                      for i, (text, category) in enumerate(filed)]
+        db.session.add_all(complaints)
+        db.session.commit()
+        cls.category_ids = {name: category.id for name, category in categories.items()}
+        cls.complaint_ids = [c.id for c in complaints]
+
+    def suggest(self, title, description=''):
+        return self.client.post('/api/suggestions/categories', json={'title': title, 'description': description})
+
+    def test_01_no_model_yet(self):
+        """Test 503 before any model has been trained"""
+        self.assertEqual(self.suggest('WiFi is down').status_code, 503)
+        self.assertEqual(self.suggest('').status_code, 400)
+        response = self.client.post('/api/suggestions/categories', json={'title': 'WiFi is down', 'limit': 'all'})
+        self.assertEqual(response.status_code, 400)
+        print("✅ Missing model handling passed")
+
+    def test_02_trained_model_ranks_categories(self):
+        """Test that a freshly trained model is picked up by reload and ranks sensibly"""
+        from suggestions import train, evaluate
+        model = train(TRAINING, epochs=30)
+        self.assertEqual(evaluate(model, TRAINING)['category']['top1'], 1.0)
+        model.save(self.model_path)
+        self.assertNotEqual(self.client.post('/api/admin/suggestions/reload').status_code, 200)  # admins only
+        self.login_admin()
+        status = self.client.post('/api/admin/suggestions/reload').get_json()
+        self.assertTrue(status['loaded'])
+        self.assertEqual(status['samples'], len(TRAINING))
+
+        body = self.suggest('No WiFi', 'The internet connection in my room is not working').get_json()
+        self.assertEqual(body['categories'][0]['category_id'], self.category_ids['Network'])
+        self.assertEqual(body['categories'][0]['department'], 'IT Services')
+        self.assertEqual(body['departments'][0]['department'], 'IT Services')
+        self.assertEqual(len(body['categories']), 3)
+        self.assertAlmostEqual(sum(c['score'] for c in body['categories']), 1.0, places=3)
+        print("✅ Suggestion ranking passed")
+
+    def test_03_batch_scores_backlog(self):
+        """Test batch scoring of drafts and of filed complaints"""
+        response = self.client.post('/api/suggestions/categories/batch', json={
+            'items': [{'title': 'Mess dinner stale'}, {'title': 'Lectures skipped by professor'}], 'limit': 1
+        })
+        results = response.get_json()['results']
+        self.assertEqual([r['categories'][0]['category'] for r in results], ['Food Quality', 'Teaching Quality'])
+
+        response = self.client.post('/api/suggestions/categories/batch', json={
+            'complaint_ids': self.complaint_ids + [999999], 'only_mismatched': True
+        })
+        body = response.get_json()
+        self.assertEqual([r['id'] for r in body['results']], [self.complaint_ids[1]])
+        self.assertEqual(body['results'][0]['categories'][0]['category'], 'Food Quality')
+        self.assertEqual(body['missing'], [999999])
+        self.assertEqual(self.client.post('/api/suggestions/categories/batch', json={'items': []}).status_code, 400)
+        response = self.client.post('/api/suggestions/categories/batch', json={'items': [{'title': 'x'}], 'limit': None})
+        self.assertEqual(response.status_code, 400)
+        print("✅ Batch scoring passed")
+
+    def test_04_retrained_model_is_hot_swapped(self):
+        """Test that a model written over the file replaces the loaded one without a restart"""
+        from suggestions import train
+        before = self.suggester.model
+        relabelled = [(text, 'Network' if category == 'Food Quality' else category, department)
+                      for text, category, department in TRAINING]
+        model = train(relabelled, epochs=30)
+        model.save(self.model_path)
+        os.utime(self.model_path, ns=(0, os.stat(self.model_path).st_mtime_ns + 1))  # coarse filesystem clocks
+        self.suggester.checked_at = 0.0  # as if SUGGESTION_CHECK_SECONDS had passed
+
+        body = self.suggest('Mess food is cold').get_json()
+        self.assertIsNot(self.suggester.model, before)
+        self.assertNotIn('Food Quality', [c['category'] for c in body['categories'][:1]])
+        self.assertEqual(self.suggester.status()['loads'], 2)
+        print("✅ Hot swap passed")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)